@@ -0,0 +1,50 @@
+// vision_core/bindings.cpp – pybind11 module `vision_core`
+//   import vision_core
+//   r = vision_core.OverlayRenderer()
+//   r.render(frame, boxes_f32_Nx4, ids_i32_N, "FPS: 30.0")   # frame 은 in-place 로 그려진다
+#include <stdexcept>
+#include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
+#include "vision_core/render.hpp"
+
+namespace py = pybind11;
+using vision_core::OverlayRenderer;
+
+// forcecast 없음 → dtype/연속성이 다르면 복사 대신 TypeError (복사본에 그리는 실수 방지)
+using Frame = py::array_t<uint8_t, py::array::c_style>;
+using Boxes = py::array_t<float,   py::array::c_style>;
+using Ids   = py::array_t<int32_t, py::array::c_style>;
+
+static int render(OverlayRenderer& self, Frame frame, Boxes boxes, Ids ids, const std::string& hud)
+{
+    if (frame.ndim() != 3 || frame.shape(2) != 3)
+        throw std::invalid_argument("frame must be H×W×3 uint8");
+    if (boxes.ndim() != 2 || boxes.shape(1) != 4)
+        throw std::invalid_argument("boxes must be N×4 float32");
+    if (ids.ndim() != 1 || ids.shape(0) != boxes.shape(0))
+        throw std::invalid_argument("ids must be N int32");
+    cv::Mat mat(int(frame.shape(0)), int(frame.shape(1)), CV_8UC3, frame.mutable_data());
+    const float*   b = boxes.data();
+    const int32_t* d = ids.data();
+    const int n = int(boxes.shape(0));
+    py::gil_scoped_release release;              // 그리는 동안 다른 파이프라인 스레드 진행
+    return self.render(mat, b, d, n, hud);
+}
+
+PYBIND11_MODULE(vision_core, m)
+{
+    m.doc() = "Zybo-EdgeTPU native vision helpers";
+    py::class_<OverlayRenderer>(m, "OverlayRenderer")
+        .def(py::init([](py::tuple box_color, py::tuple hud_color, std::size_t cache_size) {
+                 auto sc = [](py::tuple t) {
+                     return cv::Scalar(t[0].cast<double>(), t[1].cast<double>(), t[2].cast<double>());
+                 };
+                 return new OverlayRenderer(sc(box_color), sc(hud_color), cache_size);
+             }),
+             py::arg("box_color") = py::make_tuple(0, 255, 0),
+             py::arg("hud_color") = py::make_tuple(255, 255, 0),
+             py::arg("cache_size") = 1024)
+        .def("render", &render, py::arg("frame"), py::arg("boxes"), py::arg("ids"),
+             py::arg("hud") = "")
+        .def_property_readonly("cached", &OverlayRenderer::cached);
+}
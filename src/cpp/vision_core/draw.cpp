@@ -1,19 +1,37 @@
-// vision_core/draw.cpp (요약)
+// vision_core/draw.cpp
+#include "vision_core/draw.hpp"
+#include <opencv2/imgproc.hpp>
+
+namespace vision_core {
+
 void draw_box(cv::Mat& frame,
     const cv::Rect2f& box,
     const cv::Scalar& color,
     const std::string& label)
 {
-cv::rectangle(frame, box, color, 2);
-if (!label.empty()) {
 int  baseline = 0;
-auto size = cv::getTextSize(label,
-                          cv::FONT_HERSHEY_SIMPLEX, 0.5, 1, &baseline);
+cv::Size size = label.empty() ? cv::Size()
+              : cv::getTextSize(label, kLabelFont, kLabelScale, kLabelThick, &baseline);
+draw_box(frame, cv::Point(int(box.x), int(box.y)),
+         cv::Point(int(box.x + box.width), int(box.y + box.height)), color, label, size);
+}
+
+void draw_box(cv::Mat& frame,
+    const cv::Point& p1,
+    const cv::Point& p2,
+    const cv::Scalar& color,
+    const std::string& label,
+    const cv::Size& size)
+{
+cv::rectangle(frame, p1, p2, color, 2);
+if (!label.empty()) {
 cv::rectangle(frame,
-            cv::Point(box.x, box.y - size.height - 4),
-            cv::Point(box.x + size.width, box.y), color, cv::FILLED);
+            cv::Point(p1.x, p1.y - size.height - 4),
+            cv::Point(p1.x + size.width, p1.y), color, cv::FILLED);
 cv::putText(frame, label,
-          cv::Point(box.x, box.y - 2),
-          cv::FONT_HERSHEY_SIMPLEX, 0.5, CV_RGB(0,0,0), 1);
+          cv::Point(p1.x, p1.y - 2),
+          kLabelFont, kLabelScale, CV_RGB(0,0,0), kLabelThick);
 }
 }
+
+}  // namespace vision_core
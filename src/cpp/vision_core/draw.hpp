@@ -0,0 +1,20 @@
+// vision_core/draw.hpp – box / label drawing primitives
+#pragma once
+#include <string>
+#include <opencv2/core.hpp>
+
+namespace vision_core {
+
+// 라벨 글꼴 – Python fallback (pipeline/overlay.py) 과 동일해야 한다
+constexpr int    kLabelFont  = cv::FONT_HERSHEY_SIMPLEX;
+constexpr double kLabelScale = 0.5;
+constexpr int    kLabelThick = 1;
+
+void draw_box(cv::Mat& frame, const cv::Rect2f& box, const cv::Scalar& color,
+              const std::string& label);
+
+// 이미 측정된 라벨 크기로 그리기 (getTextSize 생략 – label cache 용)
+void draw_box(cv::Mat& frame, const cv::Point& p1, const cv::Point& p2, const cv::Scalar& color,
+              const std::string& label, const cv::Size& label_size);
+
+}  // namespace vision_core
@@ -0,0 +1,52 @@
+// vision_core/render.cpp
+#include "vision_core/render.hpp"
+#include "vision_core/draw.hpp"
+#include <algorithm>
+#include <cmath>
+#include <opencv2/imgproc.hpp>
+
+namespace vision_core {
+
+OverlayRenderer::OverlayRenderer(const cv::Scalar& box_color, const cv::Scalar& hud_color,
+                                 std::size_t cache_size)
+    : box_color_(box_color), hud_color_(hud_color), cache_size_(cache_size) {}
+
+const OverlayRenderer::Label& OverlayRenderer::label(int32_t id)
+{
+    auto it = cache_.find(id);
+    if (it != cache_.end())
+        return it->second;
+    if (cache_.size() >= cache_size_)            // 오래 산 ID 들이 쌓이면 통째로 비운다
+        cache_.clear();
+    Label l;
+    l.text = "ID:" + std::to_string(id);
+    int baseline = 0;
+    l.size = cv::getTextSize(l.text, kLabelFont, kLabelScale, kLabelThick, &baseline);
+    return cache_.emplace(id, std::move(l)).first->second;
+}
+
+int OverlayRenderer::render(cv::Mat& frame, const float* boxes, const int32_t* ids, int n,
+                            const std::string& hud)
+{
+    // 좌표 규칙은 Output._visible_boxes 와 동일: 유한값만, [0, w-1]×[0, h-1] clip 후 int 절삭
+    const float xmax = float(frame.cols - 1), ymax = float(frame.rows - 1);
+    int drawn = 0;
+    for (int i = 0; i < n; ++i) {
+        const float* b = boxes + 4 * i;
+        if (!(std::isfinite(b[0]) && std::isfinite(b[1]) && std::isfinite(b[2]) && std::isfinite(b[3])))
+            continue;
+        const int x1 = int(std::clamp(b[0], 0.f, xmax)), y1 = int(std::clamp(b[1], 0.f, ymax));
+        const int x2 = int(std::clamp(b[2], 0.f, xmax)), y2 = int(std::clamp(b[3], 0.f, ymax));
+        if (x2 <= x1 || y2 <= y1)
+            continue;
+        const Label& l = label(ids[i]);
+        draw_box(frame, cv::Point(x1, y1), cv::Point(x2, y2), box_color_, l.text, l.size);
+        ++drawn;
+    }
+    if (!hud.empty())
+        cv::putText(frame, hud, cv::Point(10, 20), cv::FONT_HERSHEY_SIMPLEX, 0.6,
+                    hud_color_, 2, cv::LINE_AA);
+    return drawn;
+}
+
+}  // namespace vision_core
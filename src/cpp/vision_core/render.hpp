@@ -0,0 +1,34 @@
+// vision_core/render.hpp – batch overlay renderer (all tracks + HUD in one call)
+#pragma once
+#include <cstdint>
+#include <string>
+#include <unordered_map>
+#include <opencv2/core.hpp>
+
+namespace vision_core {
+
+class OverlayRenderer {
+public:
+    explicit OverlayRenderer(const cv::Scalar& box_color = cv::Scalar(0, 255, 0),
+                             const cv::Scalar& hud_color = cv::Scalar(255, 255, 0),
+                             std::size_t cache_size = 1024);
+
+    // boxes: N×4 float [x1,y1,x2,y2] (frame 좌표), ids: N – 그린 박스 수 반환
+    int render(cv::Mat& frame, const float* boxes, const int32_t* ids, int n,
+               const std::string& hud);
+
+    std::size_t cached() const { return cache_.size(); }
+
+private:
+    struct Label {
+        std::string text;
+        cv::Size    size;
+    };
+    const Label& label(int32_t id);
+
+    cv::Scalar box_color_, hud_color_;
+    std::size_t cache_size_;
+    std::unordered_map<int32_t, Label> cache_;   // track id → "ID:<n>" + 측정된 크기
+};
+
+}  // namespace vision_core
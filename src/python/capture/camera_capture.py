@@ -3,12 +3,15 @@ import sys, os
 sys.path.append(os.pardir)
 import cv2, queue, threading, time
 from utils.logger import get_logger
+from utils.trace import TRACER
+from utils.profiler import PROFILER
 
 SUPPORT_FOURCC = ("MJPG", "YUYV", "H264")      # 순차 시도
 
-# 카메라가 실제로 디코딩해 주는 코덱을 3-프레임 테스트로 탐색
-def _find_working_fourcc(cap):
-    for cc in SUPPORT_FOURCC:
+# 카메라가 실제로 디코딩해 주는 코덱을 3-프레임 테스트로 탐색 (preferred 가 있으면 먼저 시도)
+def _find_working_fourcc(cap, preferred=None):
+    order = ((preferred,) if preferred else ()) + tuple(c for c in SUPPORT_FOURCC if c != preferred)
+    for cc in order:
         if cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*cc)):
             # 읽기 테스트
             for _ in range(3):
@@ -18,7 +21,7 @@ def _find_working_fourcc(cap):
 
 class CameraCapture(threading.Thread):
     def __init__(self, cam_id: int, out_q: queue.Queue, cfg: dict):
-        super().__init__(daemon=True)
+        super().__init__(daemon=True, name="Capture")
         self.cam_id, self.q, self.cfg = cam_id, out_q, cfg
         self.log = get_logger(f"Camera{cam_id}")
 
@@ -34,31 +37,37 @@ class CameraCapture(threading.Thread):
         self.cap.set(cv2.CAP_PROP_BUFFERSIZE,   1)
 
         # ── 2) 카메라가 먹는 FourCC 찾기 ───────────────────
-        fourcc = _find_working_fourcc(self.cap)
+        fourcc = _find_working_fourcc(self.cap, cfg.get("fourcc"))
         if not fourcc:
             raise RuntimeError("No working FourCC (MJPG/YUYV/H264) found")
         self.log.info("Using FourCC %s", fourcc)
 
-        # 워밍업용 dummy capture
-        for _ in range(4):
+        # 워밍업용 dummy capture (camera.warmup, 0 = 첫 프레임 최우선)
+        for _ in range(int(cfg.get("warmup", 4))):
             self.cap.read()
 
     def run(self):
         drop = 0
         while True:
+            PROFILER.checkpoint()
+            tr = TRACER.new()                     # 샘플링된 프레임만 trace, 아니면 None
             t0 = time.perf_counter()
             ret, frame = self.cap.read()
-            print(f"Capture:{(time.perf_counter()-t0)*1e3:5.1f}")
+            t1 = time.perf_counter()
+            print(f"Capture:{(t1-t0)*1e3:5.1f}")
 
             if not ret:
                 self.log.warning("grab failed")
                 time.sleep(0.05)
                 continue
+            if tr:
+                tr.add("capture", t0, t1)
+                tr.enqueue("cap_q")
             try:
-                self.q.put_nowait((time.time(), frame))
+                self.q.put_nowait((time.time(), frame, tr))
             except queue.Full:
                 self.q.get_nowait()
-                self.q.put_nowait((time.time(), frame))
+                self.q.put_nowait((time.time(), frame, tr))
                 drop += 1
                 if not drop % 100:
                     self.log.debug("dropped %d frames", drop)
@@ -93,7 +102,7 @@ if __name__ == "__main__":
     
     try:
         while True:
-            ts, frame = frame_q.get()
+            ts, frame, _ = frame_q.get()
             cv2.imshow("CameraCapture-TEST", frame)
             key = cv2.waitKey(1) & 0xFF
             if key in (27, ord("q")):   # ESC or q
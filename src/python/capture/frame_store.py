@@ -0,0 +1,275 @@
+# capture/frame_store.py – chunked memory-mapped raw frame store + replay sources
+# -------------------------------------------------------------------------------------------
+# 라이브 카메라 대신 "녹화해 둔 디코딩 완료 프레임" 으로 profile / eval / pipeline 을 돌려
+# 커밋·보드가 달라도 같은 입력으로 비교할 수 있게 한다.
+#
+#   <store>/meta.json          shape, dtype, chunk
+#   <store>/chunk_00000.npy    (chunk, H, W, C) uint8 – np.lib.format.open_memmap
+#   <store>/ts.bin             float64 캡처 타임스탬프 (append-only, 프레임 데이터 다음에 기록)
+#
+#   프레임 수 = len(ts.bin) → 기록 도중 죽어도 ts 가 써진 프레임까지만 유효.
+#   읽기는 memmap view → 디코딩 0, 복사 1 회 (read(copy=True), in-place 연산 보호용).
+#
+#   FrameStoreWriter : append(frame, ts)
+#   FrameStore       : len / [i] / ts / iter → (ts, frame)      ← Preprocessor 직접 구동
+#   StoreCapture     : cv2.VideoCapture 호환 read()/release()    ← profile_ops / eval_ops
+#   ReplayCapture    : CameraCapture 대체 스레드 (원래 타이밍 | 최대 속도) ← Pipeline
+#
+# 녹화: python -m capture.frame_store record --source 0 --out ../../stores/day1 --frames 600
+# 확인: python -m capture.frame_store info ../../stores/day1
+# -------------------------------------------------------------------------------------------
+from __future__ import annotations
+import json, queue, threading, time
+from pathlib import Path
+from typing import Iterator, Optional, Tuple, Union
+
+import numpy as np
+from utils.logger import get_logger
+from utils.trace import TRACER
+from utils.profiler import PROFILER
+
+__all__ = ["FrameStoreWriter", "FrameStore", "StoreCapture", "ReplayCapture", "is_store"]
+
+VERSION = 1
+
+
+def is_store(path: Union[str, Path, int]) -> bool:
+    return not isinstance(path, int) and (Path(path) / "meta.json").is_file()
+
+
+class FrameStoreWriter:
+    """Append raw frames into fixed-size memmapped chunks; all frames must share shape/dtype."""
+
+    def __init__(self, path: Union[str, Path], chunk: int = 256):
+        self.root = Path(path)
+        self.root.mkdir(parents=True, exist_ok=True)
+        if (self.root / "meta.json").exists():
+            raise ValueError(f"[FrameStore] {self.root} already holds a store")
+        self.chunk = int(chunk)
+        self.count = 0
+        self._mm: Optional[np.memmap] = None
+        self._shape = self._dtype = None
+        self._ts = open(self.root / "ts.bin", "ab")
+
+    def _open_chunk(self, idx: int):
+        if self._mm is not None:
+            self._mm.flush()
+        self._mm = np.lib.format.open_memmap(self.root / f"chunk_{idx:05d}.npy", mode="w+",
+                                             dtype=self._dtype, shape=(self.chunk, *self._shape))
+
+    def append(self, frame: np.ndarray, ts: Optional[float] = None):
+        if self._shape is None:
+            self._shape, self._dtype = frame.shape, frame.dtype
+            (self.root / "meta.json").write_text(json.dumps(
+                {"version": VERSION, "shape": list(frame.shape), "dtype": frame.dtype.str, "chunk": self.chunk}))
+        elif frame.shape != self._shape or frame.dtype != self._dtype:
+            raise ValueError(f"[FrameStore] frame {frame.shape}/{frame.dtype} != store {self._shape}/{self._dtype}")
+        i, j = divmod(self.count, self.chunk)
+        if j == 0:
+            self._open_chunk(i)
+        self._mm[j] = frame
+        self._ts.write(np.float64(time.time() if ts is None else ts).tobytes())
+        self.count += 1
+
+    def close(self):
+        if self._mm is not None:
+            self._mm.flush()
+            self._mm = None
+        self._ts.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class FrameStore:
+    """Read-only view over a store: ``store[i]`` is a memmap view (no decode, no copy)."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.root = Path(path)
+        meta = json.loads((self.root / "meta.json").read_text())
+        if meta.get("version") != VERSION:
+            raise ValueError(f"[FrameStore] unsupported version {meta.get('version')}")
+        self.shape, self.dtype, self.chunk = tuple(meta["shape"]), np.dtype(meta["dtype"]), int(meta["chunk"])
+        ts_path = self.root / "ts.bin"
+        n = ts_path.stat().st_size // 8
+        self.ts = np.fromfile(ts_path, dtype=np.float64, count=n)
+        self._chunks = [np.load(self.root / f"chunk_{i:05d}.npy", mmap_mode="r")
+                        for i in range((n + self.chunk - 1) // self.chunk)]
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    @property
+    def fps(self) -> float:
+        span = self.ts[-1] - self.ts[0] if len(self.ts) > 1 else 0.0
+        return (len(self.ts) - 1) / span if span > 0 else 0.0
+
+    def __getitem__(self, i: int) -> np.ndarray:
+        if not -len(self) <= i < len(self):
+            raise IndexError(i)
+        i %= len(self)
+        return self._chunks[i // self.chunk][i % self.chunk]
+
+    def __iter__(self) -> Iterator[Tuple[float, np.ndarray]]:
+        for i in range(len(self)):
+            yield float(self.ts[i]), self[i]
+
+
+class StoreCapture:
+    """``cv2.VideoCapture``-compatible reader (read / isOpened / get / release) over a FrameStore."""
+
+    def __init__(self, store: Union[str, Path, FrameStore], loop: bool = False, copy: bool = True):
+        self.store = store if isinstance(store, FrameStore) else FrameStore(store)
+        self.loop, self.copy = loop, copy
+        self.pos = 0
+
+    def isOpened(self) -> bool:
+        return len(self.store) > 0
+
+    def read(self) -> Tuple[bool, Optional[np.ndarray]]:
+        if self.pos >= len(self.store):
+            if not self.loop or not len(self.store):
+                return False, None
+            self.pos = 0
+        f = self.store[self.pos]
+        self.pos += 1
+        return True, (f.copy() if self.copy else f)
+
+    def get(self, prop: int) -> float:
+        import cv2
+        h, w = self.store.shape[:2]
+        return {cv2.CAP_PROP_FRAME_WIDTH: w, cv2.CAP_PROP_FRAME_HEIGHT: h, cv2.CAP_PROP_FPS: self.store.fps,
+                cv2.CAP_PROP_FRAME_COUNT: len(self.store), cv2.CAP_PROP_POS_FRAMES: self.pos}.get(prop, 0.0)
+
+    def set(self, prop: int, value) -> bool:                 # 해상도·FourCC 설정은 무시 (녹화 시 고정)
+        return False
+
+    def release(self):
+        pass
+
+
+class ReplayCapture(threading.Thread):
+    """Drop-in for CameraCapture: puts ``(ts, frame, trace)`` from a store into ``out_q``.
+
+    realtime=True  : 원래 캡처 간격(÷ speed)대로 내보내고, 큐가 차면 카메라처럼 가장 오래된 프레임을 버림
+    realtime=False : 최대 속도, 큐가 빌 때까지 block → 모든 프레임이 정확히 한 번씩 처리됨
+    ts 는 녹화 당시 값 그대로 (results_log 등과 run 간 비교 가능)
+    """
+
+    def __init__(self, store: Union[str, Path, FrameStore], out_q: queue.Queue,
+                 realtime: bool = True, speed: float = 1.0, loop: bool = False):
+        super().__init__(daemon=True, name="ReplayCapture")
+        self.store = store if isinstance(store, FrameStore) else FrameStore(store)
+        self.q = out_q
+        self.realtime, self.speed, self.loop = bool(realtime), float(speed), bool(loop)
+        self.log = get_logger("Replay")
+        self.done = threading.Event()
+        self._halt = threading.Event()            # stop() → 프레임 / loop 경계에서 종료
+        self.log.info("%s: %d frames %s, %.1f fps (%s)", self.store.root, len(self.store),
+                      "x".join(map(str, self.store.shape)), self.store.fps,
+                      f"realtime x{self.speed:g}" if self.realtime else "as fast as possible")
+
+    def run(self):
+        drop = 0
+        while not self._halt.is_set():
+            t_start, ts0 = time.perf_counter(), float(self.store.ts[0]) if len(self.store) else 0.0
+            for ts, frame in self.store:
+                if self.realtime:
+                    wait = (ts - ts0) / self.speed - (time.perf_counter() - t_start)
+                    if wait > 0 and self._halt.wait(wait):
+                        break
+                if self._halt.is_set():
+                    break
+                PROFILER.checkpoint()
+                tr = TRACER.new()
+                t0 = time.perf_counter()
+                frame = frame.copy()
+                if tr:
+                    tr.add("capture", t0, time.perf_counter())
+                    tr.enqueue("cap_q")
+                if self.realtime:
+                    try:
+                        self.q.put_nowait((ts, frame, tr))
+                    except queue.Full:
+                        self.q.get_nowait()
+                        self.q.put_nowait((ts, frame, tr))
+                        drop += 1
+                else:
+                    while not self._halt.is_set():     # 소비자가 멈춰도 stop() 으로 빠져나오도록
+                        try:
+                            self.q.put((ts, frame, tr), timeout=0.1)
+                            break
+                        except queue.Full:
+                            pass
+            if not self.loop:
+                break
+        self.log.info("replay %s (%d frames dropped)", "stopped" if self._halt.is_set() else "finished", drop)
+        self.done.set()
+
+    def stop(self):
+        self._halt.set()
+
+
+# ------------------------------------------------------------
+# CLI: record / info
+# ------------------------------------------------------------
+if __name__ == "__main__":
+    import argparse, cv2
+
+    ap = argparse.ArgumentParser("raw frame store")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    r = sub.add_parser("record", help="camera / video → store")
+    r.add_argument("--source", default="0", help="camera index or video path")
+    r.add_argument("--out", required=True)
+    r.add_argument("--frames", type=int, default=300)
+    r.add_argument("--width", type=int, default=640)
+    r.add_argument("--height", type=int, default=480)
+    r.add_argument("--fps", type=int, default=30)
+    r.add_argument("--chunk", type=int, default=256, help="chunk 당 프레임 수")
+    i = sub.add_parser("info")
+    i.add_argument("store")
+    args = ap.parse_args()
+
+    if args.cmd == "info":
+        s = FrameStore(args.store)
+        print(f"{s.root}: {len(s)} frames, {s.shape} {s.dtype}, {s.fps:.1f} fps, "
+              f"{len(s) * int(np.prod(s.shape)) * s.dtype.itemsize / 2**20:.0f} MB")
+    else:
+        try:
+            src = int(args.source)
+        except ValueError:
+            src = args.source
+        if isinstance(src, int):                  # 카메라: CameraCapture 와 같은 설정·타임스탬프
+            from capture.camera_capture import CameraCapture
+            q: queue.Queue = queue.Queue(maxsize=64)
+            cam = CameraCapture(src, q, {"width": args.width, "height": args.height, "fps": args.fps})
+            cam.start()
+
+            def read():
+                ts, frame, _ = q.get()
+                return ts, frame
+        else:
+            cap = cv2.VideoCapture(src)
+            if not cap.isOpened():
+                raise RuntimeError(f"cannot open {src}")
+            fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+            n = 0
+
+            def read():                           # 파일: 프레임 번호 기반 타임스탬프
+                global n
+                ok, f = cap.read()
+                if not ok:
+                    raise EOFError
+                n += 1
+                return (n - 1) / fps, f
+        with FrameStoreWriter(args.out, chunk=args.chunk) as w:
+            try:
+                while w.count < args.frames:
+                    ts, frame = read()
+                    w.append(frame, ts)
+            except (EOFError, KeyboardInterrupt):
+                pass
+        print(f"{w.count} frames → {args.out}")
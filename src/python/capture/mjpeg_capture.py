@@ -0,0 +1,212 @@
+# capture/mjpeg_capture.py – raw MJPEG grab + pooled reduced-scale JPEG decoding
+# -------------------------------------------------------------------------------------------
+# CameraCapture 는 MJPG 를 골라도 OpenCV 가 캡처 스레드에서 매 프레임을 원본 해상도 BGR 로 디코딩한다.
+# 여기서는 CAP_PROP_CONVERT_RGB=0 으로 압축된 MJPEG 버퍼만 받아오고, 디코딩은 작은 스레드 풀에서
+# IMREAD_REDUCED_COLOR_{2,4,8} (libjpeg DCT scaling) 으로 목표 해상도 근처까지 바로 줄여서 한다.
+#
+#   capture thread : grab → (seq, ts, jpeg bytes) → ThreadPoolExecutor.submit
+#   emit thread    : 제출 순서대로 future.result() → out_q  (순서·타임스탬프 보존)
+#   in-flight 상한 : workers × 2 – 넘치면 디코딩 전 압축 프레임을 버림 (가장 싼 drop)
+#
+#   scale 선택 : capture / target 비율 이하의 최대 2^k (k ≤ 3) → 남은 차이는 cv2.resize(INTER_AREA)
+#   예) 1920×1080 → 640×480 : REDUCED_2 (960×540) + resize,  1280×960 → 640×480 : REDUCED_2 그대로
+#
+#   카메라/드라이버가 raw 버퍼를 주지 않으면 (이미 디코딩된 3 채널) 자동으로 resize 만 하는 경로로 동작.
+#
+#   pipeline.yaml
+#   -------------
+#   camera:
+#     width: 640                # 파이프라인 목표 해상도
+#     height: 480
+#     raw_mjpeg:
+#       enable: true
+#       capture_width: 1920     # 카메라 요청 해상도 (MJPG)
+#       capture_height: 1080
+#       workers: 2
+#
+# 벤치: python -m capture.mjpeg_capture --bench [--capture 1920x1080 --target 640x480]
+# -------------------------------------------------------------------------------------------
+from __future__ import annotations
+import collections, queue, threading, time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple
+
+import cv2, numpy as np
+from utils.logger import get_logger
+from utils.metrics import METRICS
+from utils.trace import TRACER
+from utils.profiler import PROFILER
+
+__all__ = ["MJPEGCapture", "reduced_flag", "decode_reduced"]
+
+_REDUCED = {1: cv2.IMREAD_COLOR, 2: cv2.IMREAD_REDUCED_COLOR_2,
+            4: cv2.IMREAD_REDUCED_COLOR_4, 8: cv2.IMREAD_REDUCED_COLOR_8}
+
+
+def reduced_flag(src: Tuple[int, int], dst: Tuple[int, int]) -> Tuple[int, int]:
+    """(src w,h) → (dst w,h): largest DCT scale 2^k with src/2^k still ≥ dst → (imread flag, factor)."""
+    f = 1
+    while f < 8 and src[0] // (f * 2) >= dst[0] and src[1] // (f * 2) >= dst[1]:
+        f *= 2
+    return _REDUCED[f], f
+
+
+def decode_reduced(buf: np.ndarray, flag: int, size: Tuple[int, int]) -> np.ndarray:
+    img = cv2.imdecode(buf, flag)                 # GIL 해제 → 스레드 풀로 병렬
+    if img is None:
+        raise ValueError("[MJPEGCapture] corrupt JPEG")
+    if (img.shape[1], img.shape[0]) != size:
+        img = cv2.resize(img, size, interpolation=cv2.INTER_AREA)
+    return img
+
+
+class MJPEGCapture(threading.Thread):
+    """Drop-in for CameraCapture: puts ``(ts, frame, trace)`` at ``cfg`` width×height into ``out_q``."""
+
+    def __init__(self, cam_id: int, out_q: queue.Queue, cfg: dict):
+        super().__init__(daemon=True, name=f"MJPEGCapture{cam_id}")
+        self.cam_id, self.q, self.cfg = cam_id, out_q, cfg
+        self.log = get_logger(f"MJPEG{cam_id}")
+        r_cfg = cfg.get("raw_mjpeg") or {}
+        self.size = (int(cfg.get("width", 640)), int(cfg.get("height", 480)))
+        cap_w = int(r_cfg.get("capture_width", self.size[0]))
+        cap_h = int(r_cfg.get("capture_height", self.size[1]))
+        self.workers = int(r_cfg.get("workers", 2))
+
+        self.cap = cv2.VideoCapture(cam_id, cv2.CAP_V4L2)
+        if not self.cap.isOpened():
+            raise RuntimeError(f"Camera {cam_id} open failed")
+        self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, cap_w)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, cap_h)
+        self.cap.set(cv2.CAP_PROP_FPS, cfg.get("fps", 30))
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        self.raw = bool(self.cap.set(cv2.CAP_PROP_CONVERT_RGB, 0))
+        actual = (int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+        self.flag, f = reduced_flag(actual, self.size)
+
+        for _ in range(int(cfg.get("warmup", 4))):
+            ok, frame = self.cap.read()
+        if int(cfg.get("warmup", 4)) and ok:      # 실제로 압축 버퍼가 오는지 확인
+            self.raw = frame.ndim == 1 or frame.shape[0] == 1
+        self.log.info("MJPG %dx%d → %dx%d, %s, %d decode workers", *actual, *self.size,
+                      f"raw + REDUCED_{f}" if self.raw else "driver-decoded (resize only)", self.workers)
+
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="jpeg")
+        self._pending: collections.deque = collections.deque()
+        self._cv = threading.Condition()
+
+    def _decode(self, buf: np.ndarray, tr=None) -> np.ndarray:
+        t0 = time.perf_counter()
+        if self.raw:
+            img = decode_reduced(buf.reshape(-1), self.flag, self.size)
+        else:
+            img = buf if (buf.shape[1], buf.shape[0]) == self.size else \
+                cv2.resize(buf, self.size, interpolation=cv2.INTER_AREA)
+        t1 = time.perf_counter()
+        METRICS.observe("capture.decode_ms", (t1 - t0) * 1e3)
+        if tr:
+            tr.add("decode", t0, t1)
+        return img
+
+    def _emit(self):
+        drop = 0
+        while True:
+            with self._cv:
+                while not self._pending:
+                    self._cv.wait()
+                ts, fut, tr = self._pending[0]
+            try:
+                frame = fut.result()              # 제출 순서대로 → 순서 보존
+            except Exception as e:                # noqa: BLE001 – 깨진 프레임 하나로 멈추지 않도록
+                self.log.warning("decode failed: %s", e)
+                frame = None
+            with self._cv:
+                self._pending.popleft()
+                self._cv.notify_all()
+            if frame is None:
+                continue
+            if tr:
+                tr.enqueue("cap_q")
+            try:
+                self.q.put_nowait((ts, frame, tr))
+            except queue.Full:
+                self.q.get_nowait()
+                self.q.put_nowait((ts, frame, tr))
+                drop += 1
+                METRICS.inc("capture.dropped")
+                if not drop % 100:
+                    self.log.debug("dropped %d frames", drop)
+
+    def run(self):
+        threading.Thread(target=self._emit, daemon=True, name="MJPEGEmit").start()
+        limit = self.workers * 2
+        while True:
+            PROFILER.checkpoint()
+            tr = TRACER.new()
+            t0 = time.perf_counter()
+            ret, buf = self.cap.read()            # raw: 압축 바이트만 → 캡처 스레드는 디코딩하지 않음
+            ts = time.time()
+            if tr:
+                tr.add("capture", t0, time.perf_counter())
+            if not ret:
+                self.log.warning("grab failed")
+                time.sleep(0.05)
+                continue
+            with self._cv:
+                if len(self._pending) >= limit:   # 디코딩이 밀림 → 압축 상태에서 버림
+                    METRICS.inc("capture.decode_skipped")
+                    continue
+                self._pending.append((ts, self._pool.submit(self._decode, buf, tr), tr))
+                self._cv.notify_all()
+
+    def stop(self):
+        self.cap.release()
+        self._pool.shutdown(wait=False)
+
+
+# ------------------------------------------------------------
+# 디코딩 벤치: full decode + resize  vs  reduced decode (+ resize), 1 스레드 / N 스레드
+# ------------------------------------------------------------
+if __name__ == "__main__":
+    import argparse
+
+    ap = argparse.ArgumentParser("MJPEG reduced decode benchmark")
+    ap.add_argument("--bench", action="store_true")
+    ap.add_argument("--image", help="JPEG 파일 (생략 시 합성 영상)")
+    ap.add_argument("--capture", default="1920x1080")
+    ap.add_argument("--target", default="640x480")
+    ap.add_argument("--iters", type=int, default=100)
+    ap.add_argument("--workers", type=int, default=2)
+    args = ap.parse_args()
+
+    cw, ch = map(int, args.capture.split("x"))
+    size = tuple(map(int, args.target.split("x")))
+    if args.image:
+        buf = np.fromfile(args.image, dtype=np.uint8)
+    else:
+        rng = np.random.default_rng(0)
+        img = cv2.resize(rng.integers(0, 255, (ch // 8, cw // 8, 3), dtype=np.uint8), (cw, ch))
+        img = cv2.GaussianBlur(img, (0, 0), 3)
+        cv2.putText(img, "MJPEG", (cw // 4, ch // 2), cv2.FONT_HERSHEY_SIMPLEX, 8, (255, 255, 255), 12)
+        buf = cv2.imencode(".jpg", img, [cv2.IMWRITE_JPEG_QUALITY, 85])[1]
+    flag, f = reduced_flag((cw, ch), size)
+
+    def full():
+        return decode_reduced(buf, cv2.IMREAD_COLOR, size)
+
+    def reduced():
+        return decode_reduced(buf, flag, size)
+
+    print(f"\n★★ {cw}x{ch} JPEG ({buf.size / 1024:.0f} KB) → {size[0]}x{size[1]}, REDUCED_{f} ★★")
+    for name, fn in (("full+resize", full), (f"reduced_{f}", reduced)):
+        fn()
+        t0 = time.perf_counter()
+        for _ in range(args.iters):
+            fn()
+        one = (time.perf_counter() - t0) / args.iters * 1e3
+        with ThreadPoolExecutor(args.workers) as ex:
+            t0 = time.perf_counter()
+            list(ex.map(lambda _: fn(), range(args.iters)))
+            pooled = args.iters / (time.perf_counter() - t0)
+        print(f"{name:<12}: {one:6.2f} ms/frame (1 thread)   {pooled:6.1f} fps ({args.workers} workers)")
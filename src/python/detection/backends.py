@@ -0,0 +1,342 @@
+"""detection/backends.py
+=================================
+Detector backend interface + CPU / OpenCV DNN / mock implementations.
+The Edge TPU backend lives in :mod:`detection.tpu_detection` (pycoral 의존).
+
+모든 backend 는 SSD 계열 출력(boxes / classes / scores / count)을 내고,
+:func:`detection.postprocess.postprocess` 한 곳에서 class 별 threshold·좌표 변환을
+벡터 연산으로 처리한다.
+
+📐  API
+-------
+* ``det = Backend(model_path, thresh, classes=None, labels=None, **params)``
+* ``det(frame)`` → (N,6) ndarray [x1,y1,x2,y2,score,cls] (frame 좌표)
+* ``det.input_size`` → (w, h) 모델 입력 크기
+* ``det.warmup(n)`` → 빈 프레임으로 n 회 invoke (Edge TPU 는 첫 invoke 에 모델 업로드)
+
+🔧  구현 포인트
+---------------
+서브클래스는 ``_invoke(img)`` 하나만 구현한다. ``img`` 는 이미 ``input_size`` 로
+리사이즈된 uint8 BGR 이며, 반환은 ``(boxes[N,4] (ymin,xmin,ymax,xmax 정규화),
+classes[N], scores[N], count)``.
+"""
+from __future__ import annotations
+import json, threading, time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import cv2, numpy as np
+from utils.logger import get_logger
+from utils.metrics import METRICS
+from detection.postprocess import ClassFilter, postprocess, read_labels
+
+__all__ = [
+    "DetectorBackend", "TFLiteDetector", "OpenCVDNNDetector", "MockDetector",
+    "FallbackDetector",
+]
+
+
+# ------------------------------------------------------------
+# 1. Base class
+# ------------------------------------------------------------
+
+class DetectorBackend:
+    name = "base"
+
+    def __init__(self, model_path: Optional[str] = None, thresh: float = 0.5,
+                 classes: Optional[dict] = None, labels: Optional[str] = None, **_):
+        self.model_path = model_path
+        classes = classes or {}
+        self.classes = ClassFilter(thresh, classes.get("thresh"), classes.get("allow"),
+                                   read_labels(labels) if labels else None)
+        self.input_size: Tuple[int, int] = (300, 300)
+        self.log = get_logger(f"Detector[{self.name}]")
+
+    @property
+    def thresh(self) -> float:
+        return self.classes.thresh
+
+    @thresh.setter
+    def thresh(self, v: float):
+        self.classes.thresh = v
+
+    def _invoke(self, img: np.ndarray):
+        raise NotImplementedError
+
+    def warmup(self, n: int = 2) -> float:
+        """Run ``n`` invocations on a blank frame so the first live frame pays no upload/alloc cost."""
+        if n <= 0:
+            return 0.0
+        w, h = self.input_size
+        blank = np.zeros((h, w, 3), dtype=np.uint8)
+        t0 = time.perf_counter()
+        for _ in range(int(n)):
+            self(blank)
+        ms = (time.perf_counter() - t0) * 1e3
+        METRICS.observe("detector.warmup_ms", ms)
+        return ms
+
+    def __call__(self, frame: np.ndarray) -> np.ndarray:
+        w, h = self.input_size
+        img = frame if frame.shape[1] == w and frame.shape[0] == h else cv2.resize(frame, (w, h))
+        t0 = time.perf_counter()
+        boxes, classes, scores, count = self._invoke(img)
+        METRICS.observe(f"detector.{self.name}.invoke_ms", (time.perf_counter() - t0) * 1e3)
+        return postprocess(boxes, classes, scores, count, self.classes.lut, frame.shape)
+
+
+# ------------------------------------------------------------
+# 2. TensorFlow Lite (CPU) – also the base of the Edge TPU backend
+# ------------------------------------------------------------
+
+class TFLiteDetector(DetectorBackend):
+    """CPU TFLite SSD (``tflite_runtime`` 우선, 없으면 ``tensorflow.lite``)."""
+    name = "tflite"
+
+    def __init__(self, model_path: str, thresh: float = 0.5, threads: int = 2, **kw):
+        super().__init__(model_path, thresh, **kw)
+        self.threads = int(threads)
+        self.interp = self._make_interpreter(model_path)
+        self.interp.allocate_tensors()
+        inp = self.interp.get_input_details()[0]
+        _, h, w, _ = inp["shape"]
+        self.input_size = (int(w), int(h))
+        self._in_idx = inp["index"]
+        self._in_float = inp["dtype"] == np.float32
+        self._out_idx = self._output_order()
+
+    def _make_interpreter(self, model_path: str):
+        try:
+            from tflite_runtime.interpreter import Interpreter
+        except ImportError:
+            try:
+                from tensorflow.lite import Interpreter            # type: ignore
+            except ImportError as e:
+                raise ImportError("[Detector] tflite_runtime 이 필요합니다. → pip install tflite-runtime") from e
+        return Interpreter(model_path=str(model_path), num_threads=self.threads)
+
+    def _output_order(self):
+        """(boxes, classes, scores, count) output indices – pycoral detect.get_objects 와 같은 판별 순서.
+
+        1) serving signature 가 있으면 (TF2 export) 이름으로: output_0 count, _1 scores, _2 classes, _3 boxes
+        2) 없으면 위치로 TF1 vs TF2 SSD 순서 판별
+        """
+        sigs = self.interp.get_signature_list() if hasattr(self.interp, "get_signature_list") else {}
+        full = getattr(self.interp, "_get_full_signature_list", None)    # 이름 → tensor index
+        if sigs and full:
+            if len(sigs) > 1:
+                raise ValueError(f"[Detector] only single-signature models are supported ({list(sigs)})")
+            out = full()[next(iter(sigs))]["outputs"]
+            try:
+                return out["output_3"], out["output_2"], out["output_1"], out["output_0"]
+            except KeyError:
+                pass                                  # SSD 형식 signature 아님 → 위치 판별
+        det = self.interp.get_output_details()
+        idx = [d["index"] for d in det]
+        if int(np.prod(det[3]["shape"])) == 1:        # TF1: boxes, classes, scores, count
+            return idx[0], idx[1], idx[2], idx[3]
+        return idx[1], idx[3], idx[0], idx[2]         # TF2: scores, boxes, count, classes
+
+    def _invoke(self, img):
+        if self._in_float:
+            self.interp.set_tensor(self._in_idx, (img[None].astype(np.float32) - 127.5) / 127.5)
+        else:
+            self.interp.tensor(self._in_idx)()[0] = img
+        self.interp.invoke()
+        # tensor(i)() → 내부 버퍼의 zero-copy view. postprocess 가 선택된 행만 복사하고
+        # 다음 invoke 전에 view 가 해제되므로 안전.
+        b, c, s, n = (self.interp.tensor(i)() for i in self._out_idx)
+        return b[0], c[0], s[0], n.ravel()[0]
+
+
+# ------------------------------------------------------------
+# 3. OpenCV DNN
+# ------------------------------------------------------------
+
+class OpenCVDNNDetector(DetectorBackend):
+    """cv2.dnn SSD (Caffe / TF pb / ONNX). 출력 [1,1,N,7] = (img, cls, score, x1,y1,x2,y2)."""
+    name = "opencv"
+
+    def __init__(self, model_path: str, thresh: float = 0.5, config: Optional[str] = None,
+                 threads: int = 2, input_size=(300, 300), swap_rb: bool = True,
+                 scale: float = 1.0 / 127.5, mean=(127.5, 127.5, 127.5), **kw):
+        super().__init__(model_path, thresh, **kw)
+        cv2.setNumThreads(int(threads))
+        self.net = cv2.dnn.readNet(str(model_path), str(config) if config else "")
+        self.input_size = tuple(int(v) for v in input_size)
+        self.swap_rb, self.scale, self.mean = swap_rb, float(scale), tuple(mean)
+
+    def _invoke(self, img):
+        self.net.setInput(cv2.dnn.blobFromImage(img, self.scale, self.input_size,
+                                                self.mean, swapRB=self.swap_rb))
+        out = self.net.forward().reshape(-1, 7)
+        return out[:, [4, 3, 6, 5]], out[:, 1], out[:, 2], len(out)
+
+
+# ------------------------------------------------------------
+# 4. Replay / mock – deterministic, no hardware
+# ------------------------------------------------------------
+
+class MockDetector(DetectorBackend):
+    """Serves canned detections with emulated latency.
+
+    * ``replay``: JSONL 파일, 한 줄 = 한 프레임 ``[[ymin,xmin,ymax,xmax,cls,score], ...]``
+      (정규화 좌표). 끝나면 처음부터 반복.
+    * ``replay`` 가 없으면 ``objects`` 개의 박스가 고정 속도로 움직이는 합성 시퀀스.
+    * ``latency_ms`` ± ``jitter_ms`` (seed 고정) 만큼 sleep → CPU 벤치마크 재현성 확보.
+    """
+    name = "mock"
+
+    def __init__(self, model_path: Optional[str] = None, thresh: float = 0.5,
+                 replay: Optional[str] = None, latency_ms: float = 8.0, jitter_ms: float = 0.0,
+                 objects: int = 3, seed: int = 0, input_size=(300, 300), **kw):
+        super().__init__(model_path, thresh, **kw)
+        self.input_size = tuple(int(v) for v in input_size)
+        self.latency, self.jitter = latency_ms / 1e3, jitter_ms / 1e3
+        self._rng = np.random.default_rng(seed)
+        self._frames: List[np.ndarray] = []
+        if replay:
+            with open(Path(replay), "r", encoding="utf-8") as f:
+                self._frames = [np.asarray(json.loads(l), dtype=np.float32).reshape(-1, 6)
+                                for l in f if l.strip()]
+        self._n = 0
+        self._objects = int(objects)
+        self._start = self._rng.uniform(0.1, 0.7, size=(self._objects, 2))
+        self._vel = self._rng.uniform(-0.004, 0.004, size=(self._objects, 2))
+
+    def _canned(self) -> np.ndarray:
+        if self._frames:
+            return self._frames[self._n % len(self._frames)]
+        yx = (self._start + self._vel * self._n) % 0.8
+        d = np.empty((self._objects, 6), dtype=np.float32)
+        d[:, 0:2] = yx
+        d[:, 2:4] = yx + 0.15
+        d[:, 4] = np.arange(self._objects) % 80
+        d[:, 5] = 0.9
+        return d
+
+    def _invoke(self, img):
+        d = self._canned()
+        self._n += 1
+        dt = self.latency + (self._rng.uniform(-self.jitter, self.jitter) if self.jitter else 0.0)
+        if dt > 0:
+            time.sleep(dt)
+        return d[:, :4], d[:, 4], d[:, 5], len(d)
+
+
+# ------------------------------------------------------------
+# 5. Graceful degradation
+# ------------------------------------------------------------
+
+class FallbackDetector:
+    """Primary backend + ordered fallbacks, with model hot-swap.
+
+    ``factories`` 는 ``(name, make)`` 리스트이고 ``make(model_path=None)`` 가 backend 를 만든다.
+    invoke 가 예외를 던지면 (예: Coral 이 USB 에서 빠짐) 다음 backend 를 그 자리에서 생성해
+    같은 프레임을 재시도한다.
+
+    ``swap_model(path)`` 는 같은 backend 종류로 shadow 인스턴스를 백그라운드에서 로드 +
+    warm-up 한 뒤 참조 하나만 바꿔 끼운다. 그동안 프레임은 기존 interpreter 로 계속 처리되고,
+    진행 중인 invoke 는 자신이 잡은 (이전) backend 로 끝나므로 프레임 손실이 없다.
+    """
+
+    def __init__(self, factories: List[Tuple[str, callable]], warmup: int = 2):
+        self.log = get_logger("Detector")
+        self._factories = list(factories)
+        self._warmup = int(warmup)
+        self._lock = threading.Lock()            # failover ↔ swap 직렬화
+        self.backend = None
+        self.active = None
+        self._make = None
+        self._advance()
+
+    def _load(self, make, model_path: Optional[str] = None):
+        t0 = time.perf_counter()
+        backend = make(model_path) if model_path else make()
+        METRICS.observe("detector.load_ms", (time.perf_counter() - t0) * 1e3)
+        backend.warmup(self._warmup)
+        return backend
+
+    def _advance(self):
+        thresh = self.backend.thresh if self.backend is not None else None   # 런타임 변경값 유지
+        while self._factories:
+            name, make = self._factories.pop(0)
+            try:
+                backend = self._load(make)
+                if thresh is not None:
+                    backend.thresh = thresh
+                self.backend = backend
+                self.active, self._make = name, make
+                self.log.info("Detector backend → %s", name)
+                METRICS.gauge("detector.backend", name)
+                return
+            except Exception as e:               # noqa: BLE001 – 모든 로드 실패는 다음 후보로
+                self.log.warning("Backend '%s' unavailable: %s", name, e)
+        raise RuntimeError("[Detector] no usable detector backend")
+
+    def __getattr__(self, item):                 # input_size, model_path … → active backend
+        if item == "backend":
+            raise AttributeError(item)
+        return getattr(self.backend, item)
+
+    @property
+    def thresh(self):
+        return self.backend.thresh
+
+    @thresh.setter
+    def thresh(self, v):
+        self.backend.thresh = v
+
+    # --------------------------------------------------------
+    def swap_model(self, model_path: str, block: bool = False) -> threading.Thread:
+        """Load ``model_path`` into a shadow backend in the background, then swap atomically."""
+        th = threading.Thread(target=self._swap, args=(str(model_path),), daemon=True,
+                              name="DetectorSwap")
+        th.start()
+        if block:
+            th.join()
+        return th
+
+    def _swap(self, model_path: str):
+        t0 = time.perf_counter()
+        ready = self.prepare_swap(model_path)
+        if ready is not None:
+            self.commit_swap(ready, t0)
+
+    # 2 단계 swap: DetectorPool 은 모든 worker 의 shadow 를 먼저 로드한 뒤 한꺼번에 commit
+    def prepare_swap(self, model_path: str):
+        """Load + warm up a shadow backend of the active kind → token for ``commit_swap`` (None on failure)."""
+        active, make = self.active, self._make
+        try:
+            shadow = self._load(make, model_path)
+        except Exception as e:                   # noqa: BLE001 – 실패 시 기존 모델 유지
+            self.log.error("Hot-swap to %s failed: %s – keeping %s", model_path, e, self.model_path)
+            METRICS.inc("detector.swap_failed")
+            return None
+        return active, shadow, model_path
+
+    def commit_swap(self, ready, t0: Optional[float] = None) -> bool:
+        active, shadow, model_path = ready
+        with self._lock:
+            if self.active != active:            # 로드 중 failover → 다른 backend 종류, 폐기
+                self.log.warning("Backend changed during swap – discarding %s", model_path)
+                return False
+            shadow.thresh = self.backend.thresh  # 런타임에 바뀐 threshold 유지
+            self.backend = shadow
+        if t0 is not None:
+            METRICS.observe("detector.swap_ms", (time.perf_counter() - t0) * 1e3)
+        METRICS.inc("detector.swaps")
+        self.log.info("Detector model → %s", model_path)
+        return True
+
+    def __call__(self, frame: np.ndarray) -> np.ndarray:
+        while True:
+            backend = self.backend
+            try:
+                return backend(frame)
+            except Exception as e:               # noqa: BLE001
+                self.log.error("Backend '%s' failed: %s – failing over", self.active, e)
+                METRICS.inc("detector.failover")
+                with self._lock:
+                    if self.backend is backend:  # 다른 스레드가 이미 교체했다면 그대로 재시도
+                        self._advance()
@@ -0,0 +1,103 @@
+# detection/factory.py – 1‑stop factory for detector backends listed in config/pipeline.yaml
+# -------------------------------------------------------------------------------------------
+#   pipeline.yaml 예시
+#   ------------------
+#   det_model: ../../models/..._edgetpu.tflite     # backends.<name>.model 미지정 시 기본값
+#   det_thresh: 0.7
+#   detector:
+#     backend: edgetpu          # edgetpu | tflite | opencv | mock
+#     fallback: [tflite]        # primary 실패(USB 분리 등) 시 순서대로 전환
+#     warmup: 2                 # 로드 직후 빈 프레임 invoke 횟수 (TPU 모델 업로드 선행)
+#     backends:
+#       tflite: {model: ../../models/ssd_mobilenet_v2_coco_quant_postprocess.tflite, threads: 2}
+#       mock:   {latency_ms: 8}
+#     pool:                     # (선택) K 개 backend 병렬 – detection.pool.DetectorPool
+#       workers: [edgetpu, {backend: edgetpu, device: "usb:1"}]
+#       late_ms: 150
+#
+#   기동 시 DetectorLoader 로 모델 로드 + warm-up 을 카메라 FourCC 탐색과 겹쳐 실행한다.
+# -------------------------------------------------------------------------------------------
+from __future__ import annotations
+import importlib, difflib
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+from detection.backends import FallbackDetector
+from utils.startup import Loader
+
+_REGISTRY: Dict[str, Tuple[str, str]] = {
+    "edgetpu": ("detection.tpu_detection", "TPUDetector"),
+    "tflite":  ("detection.backends",      "TFLiteDetector"),
+    "opencv":  ("detection.backends",      "OpenCVDNNDetector"),
+    "mock":    ("detection.backends",      "MockDetector"),
+}
+
+
+@lru_cache(maxsize=None)
+def _import_class(module_path: str, class_name: str):
+    return getattr(importlib.import_module(module_path), class_name)
+
+
+def _check(alias: str):
+    if alias not in _REGISTRY:
+        hint = difflib.get_close_matches(alias, _REGISTRY.keys(), n=1)
+        raise ValueError(f"[DetectorFactory] Unknown backend '{alias}'. Did you mean {hint}?" if hint else
+                         f"[DetectorFactory] Unknown backend '{alias}'.")
+
+
+def model_for(alias: str, cfg: Dict[str, Any]) -> str:
+    """Model path the given backend would load under ``cfg`` (backends.<alias>.model → det_model)."""
+    d_cfg = cfg.get("detector") or {}
+    return ((d_cfg.get("backends") or {}).get(alias) or {}).get("model", cfg.get("det_model"))
+
+
+def _factory(alias: str, cfg: Dict[str, Any], overrides: Optional[Dict[str, Any]] = None):
+    _check(alias)
+    d_cfg = cfg.get("detector") or {}
+    params = dict((d_cfg.get("backends") or {}).get(alias) or {})
+    params.update(overrides or {})
+    model = params.pop("model", None) or model_for(alias, cfg)
+    thresh = cfg.get("det_thresh", 0.5)
+    params.setdefault("classes", d_cfg.get("classes"))
+    params.setdefault("labels", cfg.get("det_labels"))
+
+    def make(model_path=None):                    # model_path: hot-swap 시 다른 모델 파일
+        return _import_class(*_REGISTRY[alias])(model_path or model, thresh, **params)
+    return alias, make
+
+
+def _build_pool(cfg: Dict[str, Any], p_cfg: Dict[str, Any]):
+    from detection.pool import DetectorPool
+    warmup = (cfg.get("detector") or {}).get("warmup", 2)
+    dets = []
+    for spec in p_cfg["workers"]:
+        spec = {"backend": spec} if isinstance(spec, str) else dict(spec)
+        alias = str(spec.pop("backend")).lower()
+        chain = [alias] + [str(a).lower() for a in spec.pop("fallback", [])]
+        dets.append(FallbackDetector([_factory(a, cfg, spec if a == alias else None) for a in chain],
+                                     warmup=warmup))
+    return DetectorPool(dets, late_ms=p_cfg.get("late_ms", 150.0),
+                        max_inflight=p_cfg.get("max_inflight", 2))
+
+
+def build_detector(cfg: Dict[str, Any]):
+    """→ FallbackDetector wrapping the configured primary + fallback backends (loaded + warmed up),
+    or a DetectorPool of such detectors when ``detector.pool.workers`` is set."""
+    d_cfg = cfg.get("detector") or {}
+    p_cfg = d_cfg.get("pool") or {}
+    if p_cfg.get("workers"):
+        return _build_pool(cfg, p_cfg)
+    order = [str(d_cfg.get("backend", "edgetpu")).lower()]
+    order += [str(a).lower() for a in d_cfg.get("fallback", []) if str(a).lower() not in order]
+    return FallbackDetector([_factory(a, cfg) for a in order], warmup=d_cfg.get("warmup", 2))
+
+
+class DetectorLoader(Loader):
+    """Builds the detector in a background thread; ``result()`` blocks until it is ready.
+
+    ``loader = DetectorLoader(cfg); loader.start()`` → 카메라 초기화 → ``det = loader.result()``
+    """
+
+    def __init__(self, cfg: Dict[str, Any]):
+        super().__init__("detector", lambda: build_detector(cfg))
+        self.cfg = cfg
@@ -0,0 +1,134 @@
+# detection/motion_gate.py – content-based detection gating via low-res frame differencing
+# -------------------------------------------------------------------------------------------
+# 정적인 장면에서는 매 프레임 detector 를 돌릴 필요가 없다. 80×60 gray 축소 영상을
+# 마지막 탐지 프레임(reference)과 블록 단위로 비교해, 트랙 박스 밖에서 변화가 없으면
+# 이전 detections 를 트랙 속도만큼 옮겨 재사용하고 invoke 를 건너뛴다.
+#
+#   change map = block-mean |gray - ref|  (전역 밝기 변화는 빼고, confirmed 트랙 박스 블록은 마스킹
+#                                          – 아직 속도 추정이 없는 신규 트랙은 마스킹하지 않음)
+#   skip       = change_map.max() < thresh  and  stale < max_stale
+#
+#   pipeline.yaml
+#   -------------
+#   motion_gate:
+#     enable: true
+#     size: [80, 60]        # 비교용 축소 해상도 (w, h)
+#     block: 10             # 블록 크기 (축소 해상도 px) → 8×6 change map
+#     thresh: 6.0           # 블록 평균 gray 차이 (0-255) 임계값
+#     max_stale: 10         # 연속 skip 최대 프레임 수 (새 객체 놓침 상한)
+#     margin: 0             # 트랙 마스크 확장 (블록 단위)
+# -------------------------------------------------------------------------------------------
+from __future__ import annotations
+import cv2, numpy as np
+from utils.box_ops import iou_batch
+from utils.metrics import METRICS
+from tracking.track_array import TRACK_CONFIRMED
+
+__all__ = ["MotionGate", "GatedDetector", "carry_detections"]
+
+
+def carry_detections(prev: np.ndarray, tracks) -> np.ndarray:
+    """Previous detections moved by the velocity of the track they overlap most (IoU > 0.3)."""
+    dets = prev.copy()
+    if tracks is None or len(tracks) == 0 or len(dets) == 0:
+        return dets
+    iou = iou_batch(dets[:, :4], tracks["box"])
+    best = iou.argmax(axis=1)
+    hit = iou[np.arange(len(dets)), best] > 0.3
+    dets[hit, :4] += np.tile(tracks["vel"][best[hit]], 2)
+    return dets
+
+
+class MotionGate:
+    """Block-wise change detector against a reference refreshed whenever the detector runs."""
+
+    def __init__(self, size=(80, 60), block: int = 10, thresh: float = 6.0, margin: int = 0):
+        self.w, self.h = int(size[0]), int(size[1])
+        self.block, self.thresh, self.margin = int(block), float(thresh), int(margin)
+        self.gx, self.gy = self.w // self.block, self.h // self.block
+        self.ref = None
+        self.small = None
+        self.change_map = np.zeros((self.gy, self.gx), dtype=np.float32)
+
+    def _shrink(self, frame: np.ndarray) -> np.ndarray:
+        gray = frame if frame.ndim == 2 else cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        return cv2.resize(gray, (self.w, self.h), interpolation=cv2.INTER_AREA).astype(np.float32)
+
+    def track_mask(self, boxes: np.ndarray, frame_shape) -> np.ndarray:
+        """(M,4) frame boxes → (gy,gx) bool mask of blocks they cover (± margin)."""
+        mask = np.zeros((self.gy, self.gx), dtype=bool)
+        if boxes is None or len(boxes) == 0:
+            return mask
+        fh, fw = frame_shape[:2]
+        b = boxes[np.isfinite(boxes).all(axis=1)]
+        sx, sy = self.gx / fw, self.gy / fh
+        x1 = np.clip(np.floor(b[:, 0] * sx).astype(np.int64) - self.margin, 0, self.gx)
+        y1 = np.clip(np.floor(b[:, 1] * sy).astype(np.int64) - self.margin, 0, self.gy)
+        x2 = np.clip(np.ceil(b[:, 2] * sx).astype(np.int64) + self.margin, 0, self.gx)
+        y2 = np.clip(np.ceil(b[:, 3] * sy).astype(np.int64) + self.margin, 0, self.gy)
+        for a, b_, c, d in zip(x1, y1, x2, y2):
+            mask[b_:d, a:c] = True
+        return mask
+
+    def score(self, frame: np.ndarray, mask=None) -> float:
+        """Update ``change_map`` for ``frame``; return the max unmasked block score (inf w/o reference)."""
+        self.small = self._shrink(frame)
+        if self.ref is None:
+            self.change_map[:] = np.inf
+            return float("inf")
+        diff = self.small - self.ref
+        diff -= diff.mean()                                        # auto-exposure / 전역 밝기 보정
+        d = np.abs(diff[:self.gy * self.block, :self.gx * self.block])
+        self.change_map = d.reshape(self.gy, self.block, self.gx, self.block).mean(axis=(1, 3))
+        m = self.change_map if mask is None else np.where(mask, 0.0, self.change_map)
+        return float(m.max()) if m.size else 0.0
+
+    def reset(self):
+        """Adopt the last scored frame as the new reference (call after a real detector run)."""
+        self.ref = self.small
+
+
+class GatedDetector:
+    """Wraps a detector: skips invokes while nothing changes outside the tracked boxes."""
+    accepts_tracks = True
+
+    def __init__(self, det, size=(80, 60), block: int = 10, thresh: float = 6.0,
+                 max_stale: int = 10, margin: int = 0, **_):
+        self.det = det
+        self.gate = MotionGate(size, block, thresh, margin)
+        self.max_stale = int(max_stale)
+        self._inner_tracks = getattr(det, "accepts_tracks", False)
+        self._prev = np.zeros((0, 6), dtype=np.float32)
+        self._stale = 0
+
+    def __getattr__(self, item):
+        if item == "det":
+            raise AttributeError(item)
+        return getattr(self.det, item)
+
+    @property
+    def change_map(self) -> np.ndarray:
+        """(gy,gx) per-block change scores of the last frame (before track masking)."""
+        return self.gate.change_map
+
+    def _carry(self, tracks) -> np.ndarray:
+        return carry_detections(self._prev, tracks)
+
+    def __call__(self, frame: np.ndarray, tracks=None) -> np.ndarray:
+        boxes = None
+        if tracks is not None and len(tracks):
+            t = tracks[(tracks["flags"] & TRACK_CONFIRMED) != 0]
+            boxes = np.concatenate([t["box"], t["box"] + np.tile(t["vel"], 2)])
+        s = self.gate.score(frame, self.gate.track_mask(boxes, frame.shape))
+        METRICS.observe("gate.change", min(s, 255.0))
+        if s < self.gate.thresh and self._stale < self.max_stale:
+            self._stale += 1
+            self._prev = self._carry(tracks)
+            METRICS.inc("gate.skipped")
+            return self._prev
+
+        self._stale = 0
+        self.gate.reset()
+        self._prev = self.det(frame, tracks=tracks) if self._inner_tracks else self.det(frame)
+        METRICS.inc("gate.invoked")
+        return self._prev
@@ -0,0 +1,219 @@
+# detection/pool.py – detector worker pool (multi-Coral / TPU + CPU overflow) with in-order results
+# -------------------------------------------------------------------------------------------
+# 단일 detector 는 모든 추론을 직렬화한다. DetectorPool 은 K 개 backend 인스턴스를 각각
+# 전용 worker 스레드에 두고 프레임을 분배한 뒤, reorder buffer 로 캡처 순서대로 돌려준다.
+#
+#   dispatch  : least-loaded – (대기 + 실행 중 + 1) × worker latency EMA 가 가장 작은 worker
+#   reorder   : seq 순서대로 get(); 앞 프레임이 late_ms 넘게 늦고 뒤 결과가 준비돼 있으면 skip
+#   metrics   : pool.worker<i>.util (busy 비율), pool.worker<i>.ms, pool.late_skipped, pool.errors
+#
+#   pipeline.yaml
+#   -------------
+#   detector:
+#     pool:
+#       workers: [edgetpu, {backend: edgetpu, device: "usb:1"}, tflite]
+#       late_ms: 150          # 이보다 늦은 결과는 뒤 프레임이 준비되면 건너뜀
+#       max_inflight: 2       # worker 당 최대 대기 프레임
+#
+# self-test: python -m detection.pool
+# -------------------------------------------------------------------------------------------
+from __future__ import annotations
+import queue, threading, time
+from typing import Any, Callable, List, Optional, Tuple
+
+import numpy as np
+from utils.logger import get_logger
+from utils.metrics import METRICS
+
+__all__ = ["DetectorPool"]
+
+_EMPTY = np.zeros((0, 6), dtype=np.float32)
+
+
+class _Worker(threading.Thread):
+    def __init__(self, idx: int, det, pool: "DetectorPool"):
+        super().__init__(daemon=True, name=f"DetWorker{idx}")
+        self.idx, self.det, self.pool = idx, det, pool
+        self.q: queue.Queue = queue.Queue()
+        self.pending = 0                          # 큐 대기 + 실행 중 (pool lock 보호)
+        self.ema_ms = 0.0
+        self.busy_s = 0.0
+        self.t_start = time.perf_counter()
+
+    def expected_ms(self) -> float:
+        return (self.pending + 1) * (self.ema_ms or 1.0)
+
+    def run(self):
+        while True:
+            seq, frame = self.q.get()
+            t0 = time.perf_counter()
+            try:
+                dets = self.det(frame)
+            except Exception as e:               # noqa: BLE001 – 한 worker 실패가 pool 을 멈추지 않도록
+                self.pool.log.error("Worker %d failed: %s", self.idx, e)
+                METRICS.inc("pool.errors")
+                dets = _EMPTY
+            dt = time.perf_counter() - t0
+            self.busy_s += dt
+            ms = dt * 1e3
+            self.ema_ms = ms if self.ema_ms == 0 else 0.8 * self.ema_ms + 0.2 * ms
+            METRICS.observe(f"pool.worker{self.idx}.ms", ms)
+            METRICS.gauge(f"pool.worker{self.idx}.util",
+                          round(self.busy_s / max(time.perf_counter() - self.t_start, 1e-9), 3))
+            self.pool._done(self, seq, dets)
+
+
+class DetectorPool:
+    """K detector instances on K worker threads; ``submit`` → ``get`` returns results in submit order.
+
+    ``detectors`` 는 이미 생성된 backend 리스트 (FallbackDetector 등, ``det(frame)`` callable).
+    """
+
+    def __init__(self, detectors: List[Callable], late_ms: float = 150.0, max_inflight: int = 2):
+        if not detectors:
+            raise ValueError("[DetectorPool] at least one detector is required")
+        self.log = get_logger("DetectorPool")
+        self.late_s = float(late_ms) / 1e3
+        self.max_inflight = max(1, int(max_inflight))
+        self._cv = threading.Condition()
+        self._workers = [_Worker(i, d, self) for i, d in enumerate(detectors)]
+        self._seq = 0                             # 다음 submit seq
+        self._next = 0                            # 다음으로 내보낼 seq
+        self._items: dict = {}                    # seq → (item, t_submit)
+        self._ready: dict = {}                    # seq → dets
+        for w in self._workers:
+            w.start()
+
+    def __getattr__(self, item):                  # input_size, thresh … → 첫 번째 detector
+        if item == "_workers":
+            raise AttributeError(item)
+        return getattr(self._workers[0].det, item)
+
+    @property
+    def detectors(self) -> list:
+        return [w.det for w in self._workers]
+
+    def swap_models(self, paths: List[Optional[str]], block: bool = False) -> threading.Thread:
+        """Hot-swap worker i to ``paths[i]`` (None = keep): all shadows load first, then commit together.
+
+        한 worker 만 바뀌면 reorder buffer 가 서로 다른 모델 결과를 한 스트림으로 섞는다 →
+        하나라도 로드에 실패하면 전부 기존 모델 유지.
+        """
+        th = threading.Thread(target=self._swap, args=(list(paths),), daemon=True, name="PoolSwap")
+        th.start()
+        if block:
+            th.join()
+        return th
+
+    def _swap(self, paths: List[Optional[str]]):
+        t0 = time.perf_counter()
+        todo = [(d, p) for d, p in zip(self.detectors, paths) if p]
+        ready: list = [None] * len(todo)
+
+        def load(i, d, p):
+            ready[i] = d.prepare_swap(p)
+        loaders = [threading.Thread(target=load, args=(i, d, p), daemon=True) for i, (d, p) in enumerate(todo)]
+        for th in loaders:
+            th.start()
+        for th in loaders:
+            th.join()
+        if any(r is None for r in ready):
+            self.log.error("Hot-swap aborted: %d/%d worker(s) failed to load – keeping current models",
+                           sum(r is None for r in ready), len(todo))
+            return
+        for (d, _), r in zip(todo, ready):
+            d.commit_swap(r, t0)
+
+    def utilization(self) -> List[float]:
+        now = time.perf_counter()
+        return [w.busy_s / max(now - w.t_start, 1e-9) for w in self._workers]
+
+    # --------------------------------------------------------
+    def submit(self, frame: np.ndarray, item: Any = None) -> int:
+        """Queue ``frame`` on the least-loaded worker (blocks while every worker is saturated)."""
+        with self._cv:
+            while True:
+                free = [w for w in self._workers if w.pending < self.max_inflight]
+                if free:
+                    break
+                self._cv.wait()
+            w = min(free, key=_Worker.expected_ms)
+            w.pending += 1
+            seq = self._seq
+            self._seq += 1
+            self._items[seq] = (item, time.perf_counter())
+        w.q.put((seq, frame))
+        return seq
+
+    def _done(self, w: _Worker, seq: int, dets: np.ndarray):
+        with self._cv:
+            w.pending -= 1
+            if seq in self._items:                # skip 된 seq 의 늦은 결과는 버린다
+                self._ready[seq] = dets
+            self._cv.notify_all()
+
+    def get(self, timeout: Optional[float] = None) -> Tuple[Any, Optional[np.ndarray]]:
+        """Next result in submit order → ``(item, dets)``; ``dets is None`` marks a skipped (late) frame."""
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        with self._cv:
+            while True:
+                seq = self._next
+                if seq in self._ready:
+                    item, _ = self._items.pop(seq)
+                    self._next += 1
+                    return item, self._ready.pop(seq)
+                if seq in self._items:
+                    item, t_sub = self._items[seq]
+                    late = time.perf_counter() - t_sub > self.late_s
+                    if late and any(s > seq for s in self._ready):
+                        del self._items[seq]
+                        self._next += 1
+                        METRICS.inc("pool.late_skipped")
+                        return item, None
+                wait = self.late_s / 4
+                if deadline is not None:
+                    wait = min(wait, deadline - time.perf_counter())
+                    if wait <= 0:
+                        raise queue.Empty
+                self._cv.wait(wait)
+
+    def __call__(self, frame: np.ndarray) -> np.ndarray:
+        """Synchronous convenience (no pipelining) – same interface as a single backend."""
+        self.submit(frame)
+        while True:
+            _, dets = self.get()
+            if dets is not None:
+                return dets
+
+
+# ------------------------------------------------------------
+# self-test: mock backends with different speeds
+# ------------------------------------------------------------
+if __name__ == "__main__":
+    from detection.backends import MockDetector
+
+    def run(dets, n=200, label=""):
+        pool = DetectorPool(dets, late_ms=150)
+        frame = np.zeros((300, 300, 3), dtype=np.uint8)
+        out, skipped = [], 0
+
+        def producer():
+            for i in range(n):
+                pool.submit(frame, i)
+        t0 = time.perf_counter()
+        threading.Thread(target=producer, daemon=True).start()
+        for _ in range(n):
+            i, d = pool.get()
+            out.append(i)
+            skipped += d is None
+        dt = time.perf_counter() - t0
+        assert out == sorted(out) == list(range(n)), "results out of capture order"
+        util = " ".join(f"{u*100:4.0f}%" for u in pool.utilization())
+        print(f"{label:<22}: {n/dt:6.1f} fps  skipped {skipped:3d}  util [{util}]")
+
+    print("\n★★ DetectorPool self-test (mock backends) ★★")
+    run([MockDetector(latency_ms=20)], label="1 × 20 ms")
+    run([MockDetector(latency_ms=20), MockDetector(latency_ms=20)], label="2 × 20 ms")
+    run([MockDetector(latency_ms=20), MockDetector(latency_ms=60, jitter_ms=20, seed=1)],
+        label="20 ms + 60±20 ms")
+    print("order check passed")
@@ -0,0 +1,105 @@
+"""detection/postprocess.py
+=================================
+SSD output tensors → compact (N,6) ``[x1,y1,x2,y2,score,cls]`` detections.
+
+* 출력 텐서를 NumPy view 로 받아 per-class threshold + allow-list 를 **하나의 마스크**로 적용
+* 좌표 변환은 한 번의 곱셈 (정규화 ymin,xmin,ymax,xmax → frame 픽셀 x1,y1,x2,y2)
+* 허용되지 않은 클래스는 여기서 바로 버려 트래커 부하도 줄인다
+
+pipeline.yaml
+-------------
+```yaml
+det_labels: ../../test_data/coco_labels.txt
+detector:
+  classes:
+    allow: [person, car, bicycle]   # 비우면 전체 클래스
+    thresh: {person: 0.5, car: 0.6} # 미지정 클래스는 det_thresh
+```
+"""
+from __future__ import annotations
+import re
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Union
+
+import numpy as np
+
+__all__ = ["read_labels", "ClassFilter", "postprocess"]
+
+_NUM_CLASSES = 256                      # uint8 class id 범위 – LUT 크기
+
+
+def read_labels(path: Union[str, Path]) -> Dict[int, str]:
+    """``"<id>  <name>"`` 라인 형식 (pycoral read_label_file 와 동일)."""
+    labels = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for i, line in enumerate(f):
+            m = re.match(r"^\s*(\d+)\s+(.+?)\s*$", line)
+            if m:
+                labels[int(m.group(1))] = m.group(2)
+            elif line.strip():
+                labels[i] = line.strip()
+    return labels
+
+
+class ClassFilter:
+    """Per-class score threshold LUT; disallowed classes get +inf (never pass)."""
+
+    def __init__(self, thresh: float = 0.5, class_thresh: Optional[dict] = None,
+                 allow: Optional[Iterable] = None, labels: Optional[Dict[int, str]] = None):
+        self.labels = labels or {}
+        self._by_name = {v: k for k, v in self.labels.items()}
+        self._default = float(thresh)
+        self._overrides = {self._cid(k): float(v) for k, v in (class_thresh or {}).items()}
+        self._allow = None if not allow else {self._cid(k) for k in allow}
+        self._rebuild()
+
+    def _cid(self, key) -> int:
+        if isinstance(key, str) and not key.isdigit():
+            if key not in self._by_name:
+                raise ValueError(f"[ClassFilter] unknown class label: {key}")
+            return self._by_name[key]
+        return int(key)
+
+    def _rebuild(self):
+        lut = np.full(_NUM_CLASSES, self._default, dtype=np.float32)
+        for c, t in self._overrides.items():
+            lut[c] = t
+        if self._allow is not None:
+            mask = np.full(_NUM_CLASSES, np.inf, dtype=np.float32)
+            idx = np.fromiter(self._allow, dtype=np.int64)
+            mask[idx] = lut[idx]
+            lut = mask
+        self.lut = lut
+
+    @property
+    def thresh(self) -> float:
+        return self._default
+
+    @thresh.setter
+    def thresh(self, v: float):
+        self._default = float(v)
+        self._rebuild()
+
+    def name(self, cid: int) -> str:
+        return self.labels.get(int(cid), str(int(cid)))
+
+
+def postprocess(boxes: np.ndarray, classes: np.ndarray, scores: np.ndarray, count,
+                thresh: Union[float, np.ndarray], frame_shape) -> np.ndarray:
+    """SSD tensors → (N,6) [x1,y1,x2,y2,score,cls] in frame pixels.
+
+    ``thresh`` 는 scalar 또는 ClassFilter.lut (class id → threshold).
+    """
+    n = int(count)
+    s = scores[:n]
+    c = classes[:n]
+    if isinstance(thresh, np.ndarray):
+        keep = s >= thresh[np.clip(c.astype(np.int64), 0, len(thresh) - 1)]
+    else:
+        keep = s >= thresh
+    h, w = frame_shape[:2]
+    out = np.empty((int(keep.sum()), 6), dtype=np.float32)
+    out[:, :4] = boxes[:n][keep][:, [1, 0, 3, 2]] * np.array([w, h, w, h], dtype=np.float32)
+    out[:, 4] = s[keep]
+    out[:, 5] = c[keep]
+    return out
@@ -0,0 +1,146 @@
+# detection/roi.py – track-guided ROI re-detection at native resolution
+# -------------------------------------------------------------------------------------------
+# full-frame 탐지 사이 프레임에서는 트랙의 예측 박스 주변만 full-res 프레임에서 잘라
+# 모델 입력 크기의 mosaic (예: 2×2 → 150×150 셀) 에 채워 넣고 invoke 한 번으로 재탐지한다.
+#
+#   crop 크기 = max(cell, context × box)  → 작은 표적은 1:1 native 해상도,
+#                                           큰 표적만 셀 크기로 축소
+#   좌표 복원 = (mosaic 좌표 - 셀 원점) × scale + crop 원점
+#
+#   pipeline.yaml
+#   -------------
+#   roi:
+#     enable: true
+#     grid: [2, 2]         # mosaic 셀 배치 (rows, cols) → 최대 ROI 수
+#     context: 2.0         # 예측 박스 대비 crop 배율
+#     full_every: 5        # N 프레임마다 full-frame pass
+#     nms_thresh: 0.6      # 겹치는 crop 셀에서 같은 물체가 두 번 잡힌 경우 병합 (class-aware, IoS)
+# -------------------------------------------------------------------------------------------
+from __future__ import annotations
+import cv2, numpy as np
+from utils.box_ops import nms
+from utils.metrics import METRICS
+
+__all__ = ["MosaicPacker", "ROIScheduler", "ROIRedetector", "roi_crops"]
+
+
+def roi_crops(boxes: np.ndarray, frame_shape, cell, context: float = 2.0) -> np.ndarray:
+    """(M,4) predicted boxes → (M,4) int square-ish crop rects centred on each box, kept inside frame."""
+    h, w = frame_shape[:2]
+    cw, ch = cell
+    c = (boxes[:, :2] + boxes[:, 2:4]) * 0.5
+    bw = np.maximum(boxes[:, 2] - boxes[:, 0], 1) * context
+    bh = np.maximum(boxes[:, 3] - boxes[:, 1], 1) * context
+    # 셀 종횡비 유지 + 최소 셀 크기 (upscale 금지 → native 해상도)
+    k = np.maximum(np.maximum(bw / cw, bh / ch), 1.0)
+    sw = np.minimum(np.round(cw * k), w).astype(np.int64)
+    sh = np.minimum(np.round(ch * k), h).astype(np.int64)
+    x1 = np.clip(np.round(c[:, 0] - sw / 2).astype(np.int64), 0, w - sw)
+    y1 = np.clip(np.round(c[:, 1] - sh / 2).astype(np.int64), 0, h - sh)
+    return np.stack([x1, y1, x1 + sw, y1 + sh], axis=1)
+
+
+class MosaicPacker:
+    """Packs up to rows×cols crops into one model-sized canvas and maps detections back."""
+
+    def __init__(self, model_size=(300, 300), grid=(2, 2)):
+        self.rows, self.cols = int(grid[0]), int(grid[1])
+        self.w, self.h = int(model_size[0]), int(model_size[1])
+        self.cell = (self.w // self.cols, self.h // self.rows)
+        self.canvas = np.zeros((self.h, self.w, 3), dtype=np.uint8)
+        self._map = np.zeros((0, 5))             # per cell: cell_x, cell_y, crop_x, crop_y, scale
+
+    @property
+    def capacity(self) -> int:
+        return self.rows * self.cols
+
+    def pack(self, frame: np.ndarray, crops: np.ndarray) -> np.ndarray:
+        cw, ch = self.cell
+        self.canvas[:] = 0
+        m = np.zeros((len(crops), 5))
+        for i, (x1, y1, x2, y2) in enumerate(crops[:self.capacity]):
+            r, c = divmod(i, self.cols)
+            ox, oy = c * cw, r * ch
+            patch = frame[y1:y2, x1:x2]
+            if patch.shape[1] != cw or patch.shape[0] != ch:
+                patch = cv2.resize(patch, (cw, ch), interpolation=cv2.INTER_AREA)
+            self.canvas[oy:oy + ch, ox:ox + cw] = patch
+            m[i] = (ox, oy, x1, y1, (x2 - x1) / cw)
+        self._map = m[:min(len(crops), self.capacity)]
+        return self.canvas
+
+    def unpack(self, dets: np.ndarray) -> np.ndarray:
+        """Mosaic-space detections → frame coordinates (assigned to the cell holding their centre)."""
+        if len(dets) == 0 or len(self._map) == 0:
+            return dets[:0]
+        cw, ch = self.cell
+        cx = (dets[:, 0] + dets[:, 2]) * 0.5
+        cy = (dets[:, 1] + dets[:, 3]) * 0.5
+        cell = (np.clip(cy // ch, 0, self.rows - 1) * self.cols + np.clip(cx // cw, 0, self.cols - 1)).astype(np.int64)
+        ok = cell < len(self._map)
+        dets, cell = dets[ok].copy(), cell[ok]
+        m = self._map[cell]
+        ox, oy = m[:, 0:1], m[:, 1:2]
+        # 셀 경계를 넘는 박스는 잘라낸다 (이웃 셀 내용과 섞이지 않도록)
+        dets[:, [0, 2]] = np.clip(dets[:, [0, 2]], ox, ox + cw)
+        dets[:, [1, 3]] = np.clip(dets[:, [1, 3]], oy, oy + ch)
+        s = m[:, 4:5]
+        dets[:, [0, 2]] = (dets[:, [0, 2]] - ox) * s + m[:, 2:3]
+        dets[:, [1, 3]] = (dets[:, [1, 3]] - oy) * s + m[:, 3:4]
+        return dets
+
+
+class ROIScheduler:
+    """Full-frame every ``full_every`` frames (or when there is nothing to follow), ROI otherwise."""
+
+    def __init__(self, full_every: int = 5):
+        self.full_every = max(1, int(full_every))
+        self._n = 0
+
+    def full_pass(self, n_tracks: int) -> bool:
+        self._n += 1
+        if n_tracks == 0 or self._n >= self.full_every:
+            self._n = 0
+            return True
+        return False
+
+
+class ROIRedetector:
+    """Wraps a detector: alternates full-frame passes with one-invoke mosaic ROI passes."""
+    accepts_tracks = True
+
+    def __init__(self, det, grid=(2, 2), context: float = 2.0, full_every: int = 5,
+                 nms_thresh: float = 0.6, **_):
+        self.det = det
+        self.packer = MosaicPacker(det.input_size, grid)
+        self.sched = ROIScheduler(full_every)
+        self.context, self.nms_thresh = float(context), float(nms_thresh)
+        self._inner_tracks = getattr(det, "accepts_tracks", False)
+
+    def __getattr__(self, item):
+        if item == "det":
+            raise AttributeError(item)
+        return getattr(self.det, item)
+
+    def __call__(self, frame: np.ndarray, tracks=None) -> np.ndarray:
+        n = 0 if tracks is None else len(tracks)
+        if self.sched.full_pass(n):
+            METRICS.inc("roi.full_pass")
+            return self.det(frame, tracks=tracks) if self._inner_tracks else self.det(frame)
+
+        # 한 프레임 앞 예측 (box + velocity) – 작은 표적부터 mosaic 셀 배정
+        boxes = tracks["box"].astype(np.float64)
+        boxes = boxes + np.tile(tracks["vel"], 2)
+        boxes = boxes[np.isfinite(boxes).all(axis=1)]
+        area = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+        pick = np.argsort(area, kind="stable")[:self.packer.capacity]
+        crops = roi_crops(boxes[pick], frame.shape, self.packer.cell, self.context)
+        canvas = self.packer.pack(frame, crops)
+        METRICS.inc("roi.roi_pass")
+        METRICS.observe("roi.rois", len(crops))
+        # canvas 는 모델 입력 크기 → backend 내부 resize 없음, 결과는 mosaic 픽셀 좌표
+        # tiling wrapper 는 우회 (mosaic 에 다시 타일을 적용하지 않도록)
+        inner = self.det.det if self._inner_tracks and hasattr(self.det, "det") else self.det
+        dets = self.packer.unpack(inner(canvas))
+        # 가까운 트랙끼리 crop 이 겹치면 같은 물체가 여러 셀에서 검출됨 → tracker 에 중복 박스 방지
+        return dets[nms(dets, self.nms_thresh, metric="ios", class_aware=True)]
@@ -0,0 +1,129 @@
+# detection/tiling.py – tiled small-object detection with a rotating tile schedule
+# -------------------------------------------------------------------------------------------
+# 전체 프레임을 모델 입력(300×300)으로 줄이면 먼 거리의 작은 표적이 사라진다.
+# 프레임을 모델 해상도의 겹치는 타일로 잘라 축소 없이 추론하고, 결과 박스를 프레임 좌표로
+# 되돌린 뒤 타일 간 NMS 로 병합한다.
+#
+#   pipeline.yaml
+#   -------------
+#   tiling:
+#     enable: true
+#     overlap: 0.2          # 타일 간 겹침 비율
+#     mode: rotate          # all | rotate
+#     budget_ms: 25         # rotate: 프레임당 타일 추론 예산 (타일 latency EMA 기준)
+#     max_tiles: 3          # rotate: 프레임당 최대 타일 수
+#     full_frame: true      # 타일과 함께 축소 전체 프레임도 추론 (큰 객체용)
+#
+# 벤치마크: python -m detection.bench_tiling
+# -------------------------------------------------------------------------------------------
+from __future__ import annotations
+import time
+from typing import Optional
+import numpy as np
+from utils.box_ops import nms
+from utils.metrics import METRICS
+
+__all__ = ["TiledDetector", "make_tiles"]
+
+
+def make_tiles(frame_w: int, frame_h: int, tile_w: int, tile_h: int, overlap: float = 0.2) -> np.ndarray:
+    """Cover the frame with (T,4) int [x1,y1,x2,y2] tiles of exactly tile size (clamped to frame)."""
+    def starts(total, size):
+        if total <= size:
+            return np.array([0])
+        n = int(np.ceil((total - size) / (size * (1 - overlap)))) + 1
+        return np.round(np.linspace(0, total - size, n)).astype(np.int64)
+    tw, th = min(tile_w, frame_w), min(tile_h, frame_h)
+    xs, ys = starts(frame_w, tw), starts(frame_h, th)
+    gx, gy = np.meshgrid(xs, ys)
+    x1, y1 = gx.ravel(), gy.ravel()
+    return np.stack([x1, y1, x1 + tw, y1 + th], axis=1)
+
+
+class TiledDetector:
+    """Wraps any detector backend; ``det(frame, tracks=None)`` → merged (N,6) detections."""
+    accepts_tracks = True
+
+    def __init__(self, det, overlap: float = 0.2, mode: str = "rotate", budget_ms: float = 25.0,
+                 max_tiles: int = 3, full_frame: bool = True, nms_thresh: float = 0.6,
+                 tile_size: Optional[tuple] = None, **_):
+        if mode not in ("all", "rotate"):
+            raise ValueError(f"[Tiling] unknown mode: {mode}")
+        self.det = det
+        self.overlap, self.mode = float(overlap), mode
+        self.budget_ms, self.max_tiles = float(budget_ms), int(max_tiles)
+        self.full_frame, self.nms_thresh = bool(full_frame), float(nms_thresh)
+        self.tile_size = tuple(tile_size) if tile_size else None
+        self._tiles = None
+        self._shape = None
+        self._cursor = 0
+        self._n = 0                               # schedule 호출 수 (n == 1 일 때 track / round-robin 교대)
+        self._tile_ms = 0.0                       # per-tile latency EMA
+
+    def __getattr__(self, item):                  # thresh, input_size … → wrapped backend
+        if item == "det":
+            raise AttributeError(item)
+        return getattr(self.det, item)
+
+    # --------------------------------------------------------
+    def tiles_for(self, shape) -> np.ndarray:
+        if self._shape != shape[:2]:
+            tw, th = self.tile_size or self.det.input_size
+            self._tiles = make_tiles(shape[1], shape[0], tw, th, self.overlap)
+            self._shape = shape[:2]
+            self._cursor = 0
+        return self._tiles
+
+    def schedule(self, tiles: np.ndarray, tracks=None) -> np.ndarray:
+        """Indices of tiles to run this frame (track tiles first, then round-robin).
+
+        Track tiles take at most ``n - 1`` slots so the round-robin cursor always advances
+        (with ``n == 1`` they alternate frame by frame) – otherwise tracks spread over
+        ``max_tiles`` tiles would starve the rest of the frame.
+        """
+        if self.mode == "all":
+            return np.arange(len(tiles))
+        n = self.max_tiles
+        if self._tile_ms > 0:
+            n = max(1, min(n, int(self.budget_ms // self._tile_ms)))
+        self._n += 1
+        prio = np.zeros(0, dtype=np.int64)
+        if tracks is not None and len(tracks):
+            boxes = tracks["box"] if tracks.dtype.names else tracks[:, :4]
+            c = (boxes[:, :2] + boxes[:, 2:4]) * 0.5                  # (M,2) track centres
+            inside = ((c[None, :, 0] >= tiles[:, None, 0]) & (c[None, :, 0] < tiles[:, None, 2]) &
+                      (c[None, :, 1] >= tiles[:, None, 1]) & (c[None, :, 1] < tiles[:, None, 3]))
+            cnt = inside.sum(axis=1)
+            prio = np.flatnonzero(cnt)[np.argsort(-cnt[cnt > 0], kind="stable")]
+            prio = prio[:n - 1] if n > 1 else prio[:self._n % 2]
+        rr = (self._cursor + np.arange(len(tiles))) % len(tiles)
+        rr = rr[~np.isin(rr, prio)]
+        chosen = np.concatenate([prio, rr])[:n]
+        picked_rr = np.isin(rr, chosen)
+        if picked_rr.any():                       # 커서는 round-robin 으로 뽑힌 타일 다음으로
+            self._cursor = int(rr[picked_rr][-1] + 1) % len(tiles)
+        return chosen
+
+    # --------------------------------------------------------
+    def __call__(self, frame: np.ndarray, tracks=None) -> np.ndarray:
+        tiles = self.tiles_for(frame.shape)
+        idx = self.schedule(tiles, tracks)
+        parts = [self.det(frame)] if self.full_frame else []
+        t0 = time.perf_counter()
+        for x1, y1, x2, y2 in tiles[idx]:
+            d = self.det(frame[y1:y2, x1:x2])
+            if len(d):
+                d = d.copy()
+                d[:, [0, 2]] += x1
+                d[:, [1, 3]] += y1
+                parts.append(d)
+        if len(idx):
+            ms = (time.perf_counter() - t0) * 1e3 / len(idx)
+            self._tile_ms = ms if self._tile_ms == 0 else 0.8 * self._tile_ms + 0.2 * ms
+            METRICS.observe("tiling.tile_ms", ms)
+        METRICS.observe("tiling.tiles_per_frame", len(idx))
+        parts = [p for p in parts if len(p)]
+        if not parts:
+            return np.zeros((0, 6), dtype=np.float32)
+        dets = np.concatenate(parts)
+        return dets[nms(dets, self.nms_thresh, metric="ios", class_aware=True)]
@@ -1,27 +1,17 @@
 # Edge‑TPU MobileNet‑SSD object detection.
-import time
 from pycoral.utils.edgetpu import make_interpreter
-from pycoral.adapters import common, detect
-import numpy as np, cv2
+from detection.backends import TFLiteDetector
 
-class TPUDetector:
-    def __init__(self, model_path:str, thresh:float=0.5):
-        self.interp = make_interpreter(model_path)
-        self.interp.allocate_tensors()
-        self.thresh = thresh
-        _, self.h, self.w, _ = self.interp.get_input_details()[0]['shape']
+class TPUDetector(TFLiteDetector):
+    """Edge TPU backend – TFLite interpreter with the edgetpu delegate (pycoral).
 
-    def __call__(self, frame):
-        
-        img = cv2.resize(frame, (self.w, self.h))
-        common.set_input(self.interp, img)
-        
-        self.interp.invoke()
-        
-        objs = detect.get_objects(self.interp, self.thresh)
-        res = []
-        sx, sy = frame.shape[1]/self.w, frame.shape[0]/self.h
-        for o in objs:
-            box = o.bbox
-            res.append([box.xmin*sx, box.ymin*sy, box.xmax*sx, box.ymax*sy, o.score])
-        return np.asarray(res)
\ No newline at end of file
+    입력 설정 / 출력 텐서 해석 / 후처리는 :class:`detection.backends.TFLiteDetector` 와 공유.
+    """
+    name = "edgetpu"
+
+    def __init__(self, model_path:str, thresh:float=0.5, device:str=None, **kw):
+        self.device = device          # e.g. "usb:0" – 여러 Coral 사용 시
+        super().__init__(model_path, thresh, **kw)
+
+    def _make_interpreter(self, model_path:str):
+        return make_interpreter(str(model_path), device=self.device)
@@ -0,0 +1,187 @@
+# events/engine.py – vectorized zone / tripwire rules over TRACK_DTYPE arrays
+# -------------------------------------------------------------------------------------------
+# 매 프레임 모든 트랙 × 모든 규칙을 배열 연산 한 번씩으로 평가한다.
+#
+#   zone (polygon) : 모든 zone 의 edge 를 한 배열로 이어 붙여 (N 트랙 × E edge) ray casting,
+#                    np.add.reduceat 으로 zone 별 교차 parity → inside (N,Z)
+#                    → enter / exit / dwell(≥ dwell_s) / count(≥ count, 상승 에지)
+#   line (tripwire): 이전 → 현재 anchor 이동 선분 (N) × tripwire (L) 방향 판정 → cross (N,L)
+#                    direction: any | pos | neg  (pos = a→b 의 orient ≥ 0 쪽에서 반대쪽으로)
+#   트랙 상태(이전 anchor, inside, 진입 시각)는 정렬된 id 배열 + searchsorted 로 이어 붙인다.
+#
+#   pipeline.yaml
+#   -------------
+#   events:
+#     enable: true
+#     anchor: bottom        # bottom (발 위치) | center
+#     confirmed_only: true
+#     rules:
+#       - {name: gate,  type: zone, polygon: [[100,300],[300,300],[300,470],[100,470]], dwell_s: 3, count: 4}
+#       - {name: door,  type: line, line: [[320,0],[320,480]], direction: any}
+#     sinks:
+#       - {type: jsonl, path: ../../events.jsonl}
+#       - {type: unix,  path: /tmp/zybo_events.sock}
+#       - {type: webhook, url: "http://127.0.0.1:9000/events"}
+# -------------------------------------------------------------------------------------------
+from __future__ import annotations
+import time
+from typing import Dict, List, Optional
+
+import cv2, numpy as np
+from tracking.track_array import TRACK_CONFIRMED
+from utils.metrics import METRICS
+
+__all__ = ["EventEngine", "points_in_polygons", "segments_cross"]
+
+
+def points_in_polygons(p: np.ndarray, edges: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """(N,2) points × concatenated polygon edges (E,2,2) → (N,Z) bool inside (even-odd rule).
+
+    ``starts`` 는 각 polygon 의 첫 edge 인덱스 (np.add.reduceat 용).
+    """
+    if len(p) == 0 or len(starts) == 0:
+        return np.zeros((len(p), len(starts)), dtype=bool)
+    a, b = edges[:, 0], edges[:, 1]                       # (E,2)
+    px, py = p[:, 0:1], p[:, 1:2]                         # (N,1)
+    straddle = (a[:, 1] > py) != (b[:, 1] > py)           # (N,E)
+    dy = np.where(b[:, 1] == a[:, 1], 1e-12, b[:, 1] - a[:, 1])
+    x_cross = a[:, 0] + (py - a[:, 1]) * (b[:, 0] - a[:, 0]) / dy
+    hit = straddle & (px < x_cross)
+    return (np.add.reduceat(hit.astype(np.int32), starts, axis=1) & 1).astype(bool)
+
+
+def _orient(a, b, c):
+    return (b[..., 0] - a[..., 0]) * (c[..., 1] - a[..., 1]) - (b[..., 1] - a[..., 1]) * (c[..., 0] - a[..., 0])
+
+
+def segments_cross(p0: np.ndarray, p1: np.ndarray, lines: np.ndarray) -> np.ndarray:
+    """Movement segments (N,2)→(N,2) × tripwires (L,2,2) → (N,L) int8: +1 / -1 crossing side, 0 none."""
+    if len(p0) == 0 or len(lines) == 0:
+        return np.zeros((len(p0), len(lines)), dtype=np.int8)
+    a, b = lines[None, :, 0], lines[None, :, 1]           # (1,L,2)
+    q0, q1 = p0[:, None], p1[:, None]                     # (N,1,2)
+    # 선 위의 점은 한쪽(≥0)으로 취급 → 선 위에 정확히 멈춘 프레임이 있어도 한 번만 교차
+    s0 = np.where(_orient(a, b, q0) >= 0, 1, -1)
+    s1 = np.where(_orient(a, b, q1) >= 0, 1, -1)
+    t0, t1 = np.sign(_orient(q0, q1, a)), np.sign(_orient(q0, q1, b))
+    cross = (s0 != s1) & (t0 * t1 <= 0)
+    return np.where(cross, s0, 0).astype(np.int8)
+
+
+class EventEngine:
+    """``update(tracks, ts)`` → list of event dicts (zone enter/exit/dwell/count, line cross)."""
+
+    def __init__(self, rules: List[dict], anchor: str = "bottom", confirmed_only: bool = True, **_):
+        if anchor not in ("bottom", "center"):
+            raise ValueError(f"[Events] unknown anchor: {anchor}")
+        self.anchor, self.confirmed_only = anchor, bool(confirmed_only)
+        zones = [r for r in rules if r.get("type", "zone") == "zone"]
+        lines = [r for r in rules if r.get("type") == "line"]
+        unknown = [r.get("type") for r in rules if r.get("type", "zone") not in ("zone", "line")]
+        if unknown:
+            raise ValueError(f"[Events] unknown rule type(s): {unknown}")
+
+        # zones → 하나의 edge 배열
+        self.zone_names = [z.get("name", f"zone{i}") for i, z in enumerate(zones)]
+        self.polys = [np.asarray(z["polygon"], dtype=np.float32) for z in zones]
+        edges, starts = [], []
+        for poly in self.polys:
+            starts.append(sum(len(e) for e in edges))
+            edges.append(np.stack([poly, np.roll(poly, -1, axis=0)], axis=1))
+        self._edges = np.concatenate(edges) if edges else np.zeros((0, 2, 2), np.float32)
+        self._starts = np.asarray(starts, dtype=np.int64)
+        self._dwell = np.array([z.get("dwell_s") or np.inf for z in zones], dtype=np.float64)
+        self._count = np.array([z.get("count") or 0 for z in zones], dtype=np.int64)
+
+        # tripwires
+        self.line_names = [l.get("name", f"line{i}") for i, l in enumerate(lines)]
+        self._lines = np.asarray([l["line"] for l in lines], dtype=np.float32).reshape(-1, 2, 2)
+        dirs = {"any": 0, "pos": 1, "neg": -1}
+        self._dir = np.array([dirs[l.get("direction", "any")] for l in lines], dtype=np.int8)
+
+        Z = len(zones)
+        self._ids = np.zeros(0, dtype=np.int64)                 # 정렬된 이전 프레임 id
+        self._pt = np.zeros((0, 2), dtype=np.float32)
+        self._in = np.zeros((0, Z), dtype=bool)
+        self._t_in = np.zeros((0, Z), dtype=np.float64)         # zone 진입 시각
+        self._dwelled = np.zeros((0, Z), dtype=bool)
+        self._over = np.zeros(Z, dtype=bool)                    # count 임계 초과 상태
+
+    # --------------------------------------------------------
+    def _anchors(self, boxes: np.ndarray) -> np.ndarray:
+        cx = (boxes[:, 0] + boxes[:, 2]) * 0.5
+        y = boxes[:, 3] if self.anchor == "bottom" else (boxes[:, 1] + boxes[:, 3]) * 0.5
+        return np.stack([cx, y], axis=1)
+
+    def update(self, tracks: np.ndarray, ts: Optional[float] = None) -> List[Dict]:
+        ts = time.time() if ts is None else float(ts)
+        t0 = time.perf_counter()
+        if len(tracks):
+            ok = np.isfinite(tracks["box"]).all(axis=1)
+            if self.confirmed_only:
+                ok &= (tracks["flags"] & TRACK_CONFIRMED) != 0
+            tracks = tracks[ok]
+        order = np.argsort(tracks["id"], kind="stable")
+        ids = tracks["id"][order].astype(np.int64)
+        pt = self._anchors(tracks["box"][order].astype(np.float32))
+        Z = len(self.zone_names)
+
+        # 이전 상태 이어 붙이기
+        j = np.searchsorted(self._ids, ids)
+        j = np.minimum(j, max(len(self._ids) - 1, 0))
+        known = self._ids[j] == ids if len(self._ids) else np.zeros(len(ids), dtype=bool)
+        prev_in = np.zeros((len(ids), Z), dtype=bool)
+        t_in = np.full((len(ids), Z), ts)
+        dwelled = np.zeros((len(ids), Z), dtype=bool)
+        prev_in[known], t_in[known], dwelled[known] = self._in[j[known]], self._t_in[j[known]], self._dwelled[j[known]]
+
+        events: List[Dict] = []
+
+        def emit(kind, rule, rows, **extra):
+            # extra 값이 (N,) 배열이면 행별 값, 아니면 공통 값
+            for k in rows.tolist():
+                x, y = pt[k].tolist()
+                e = {"ts": ts, "event": kind, "rule": rule, "id": int(ids[k]), "x": round(x, 1), "y": round(y, 1)}
+                e.update({key: (v[k].item() if isinstance(v, np.ndarray) else v) for key, v in extra.items()})
+                events.append(e)
+
+        # ---- zones ----
+        inside = points_in_polygons(pt, self._edges, self._starts)
+        enter, leave = inside & ~prev_in, ~inside & prev_in
+        t_in = np.where(enter, ts, t_in)
+        dwelled &= inside
+        stay = ts - t_in
+        dwell_hit = inside & ~dwelled & (stay >= self._dwell)
+        dwelled |= dwell_hit
+        for z, name in enumerate(self.zone_names):
+            emit("enter", name, np.flatnonzero(enter[:, z]))
+            emit("exit", name, np.flatnonzero(leave[:, z]))
+            emit("dwell", name, np.flatnonzero(dwell_hit[:, z]), dwell_s=np.round(stay[:, z], 2))
+        if Z:
+            n_in = inside.sum(axis=0)
+            over = (self._count > 0) & (n_in >= self._count)
+            for z in np.flatnonzero(over & ~self._over).tolist():
+                events.append({"ts": ts, "event": "count", "rule": self.zone_names[z], "count": int(n_in[z])})
+            self._over = over
+
+        # ---- tripwires (이전 프레임에도 있던 트랙만) ----
+        if len(self._lines) and known.any():
+            side = np.zeros((len(ids), len(self._lines)), dtype=np.int8)
+            side[known] = segments_cross(self._pt[j[known]], pt[known], self._lines)
+            hit = (side != 0) & ((self._dir == 0) | (side == self._dir))
+            direction = np.where(side > 0, "pos", "neg")
+            for l, name in enumerate(self.line_names):
+                emit("cross", name, np.flatnonzero(hit[:, l]), direction=direction[:, l])
+
+        self._ids, self._pt, self._in, self._t_in, self._dwelled = ids, pt, inside, t_in, dwelled
+        METRICS.observe("events.eval_us", (time.perf_counter() - t0) * 1e6)
+        return events
+
+    # --------------------------------------------------------
+    def draw(self, frame: np.ndarray, zone_color=(255, 128, 0), line_color=(0, 0, 255)) -> np.ndarray:
+        """Zones + tripwires, one ``cv2.polylines`` call each."""
+        if self.polys:
+            cv2.polylines(frame, [np.rint(p).astype(np.int32)[:, None] for p in self.polys], True, zone_color, 1)
+        if len(self._lines):
+            cv2.polylines(frame, list(np.rint(self._lines).astype(np.int32)[:, :, None]), False, line_color, 2)
+        return frame
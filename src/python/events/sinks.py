@@ -0,0 +1,191 @@
+# events/sinks.py – non-blocking event emitters (JSONL file / Unix socket / local webhook)
+# -------------------------------------------------------------------------------------------
+# 각 sink 는 자체 스레드 + bounded 큐를 가진다. EventBus.emit() 은 큐에 넣기만 하고
+# 가득 차면 해당 sink 로 가는 이벤트만 버린다 → 느린 소비자가 Output 을 멈추지 못한다.
+#
+#   jsonl   : 한 줄 = 한 이벤트, 배치 단위 flush
+#   unix    : SOCK_STREAM Unix socket 에 JSON line 전송, 끊기면 retry_s 후 재연결 (그 사이 이벤트는 버림)
+#   webhook : 배치를 JSON 배열로 HTTP POST (로컬 수신기 stand-in: python -m events.sinks --serve 9000)
+#
+# metrics: events.emitted, events.dropped.<sink>, events.<sink>.write_ms
+# -------------------------------------------------------------------------------------------
+from __future__ import annotations
+import json, queue, socket, threading, time, urllib.request
+from pathlib import Path
+from typing import Dict, List
+
+from utils.logger import get_logger
+from utils.metrics import METRICS
+
+__all__ = ["EventSink", "JSONLSink", "UnixSocketSink", "WebhookSink", "EventBus", "build_sinks"]
+
+
+class EventSink(threading.Thread):
+    """Base: drains its own bounded queue in batches; subclasses implement ``_write(batch)``."""
+    kind = "base"
+
+    def __init__(self, queue_size: int = 256, batch: int = 64, **_):
+        super().__init__(daemon=True, name=f"EventSink[{self.kind}]")
+        self.log = get_logger(f"EventSink[{self.kind}]")
+        self.q: queue.Queue = queue.Queue(maxsize=int(queue_size))
+        self.batch = int(batch)
+
+    def offer(self, event: Dict):
+        try:
+            self.q.put_nowait(event)
+        except queue.Full:
+            METRICS.inc(f"events.dropped.{self.kind}")
+
+    def _write(self, batch: List[Dict]):
+        raise NotImplementedError
+
+    def run(self):
+        while True:
+            batch = [self.q.get()]
+            while len(batch) < self.batch:
+                try:
+                    batch.append(self.q.get_nowait())
+                except queue.Empty:
+                    break
+            t0 = time.perf_counter()
+            try:
+                self._write(batch)
+            except Exception as e:               # noqa: BLE001 – sink 오류로 스레드가 죽지 않도록
+                self.log.warning("write failed (%d events dropped): %s", len(batch), e)
+                METRICS.inc(f"events.dropped.{self.kind}", len(batch))
+            METRICS.observe(f"events.{self.kind}.write_ms", (time.perf_counter() - t0) * 1e3)
+
+
+class JSONLSink(EventSink):
+    kind = "jsonl"
+
+    def __init__(self, path: str = "events.jsonl", **kw):
+        super().__init__(**kw)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._f = open(self.path, "a", encoding="utf-8")
+
+    def _write(self, batch):
+        self._f.write("".join(json.dumps(e, separators=(",", ":")) + "\n" for e in batch))
+        self._f.flush()
+
+
+class UnixSocketSink(EventSink):
+    kind = "unix"
+
+    def __init__(self, path: str = "/tmp/zybo_events.sock", retry_s: float = 2.0, **kw):
+        super().__init__(**kw)
+        self.path, self.retry_s = str(path), float(retry_s)
+        self._sock = None
+        self._next_try = 0.0
+
+    def _connect(self) -> bool:
+        if self._sock is not None:
+            return True
+        if time.monotonic() < self._next_try:
+            return False
+        try:
+            s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            s.settimeout(1.0)
+            s.connect(self.path)
+            self._sock = s
+            return True
+        except OSError:
+            self._next_try = time.monotonic() + self.retry_s
+            return False
+
+    def _write(self, batch):
+        if not self._connect():
+            METRICS.inc("events.dropped.unix", len(batch))
+            return
+        try:
+            self._sock.sendall("".join(json.dumps(e) + "\n" for e in batch).encode())
+        except OSError:
+            self._sock.close()
+            self._sock = None
+            raise
+
+
+class WebhookSink(EventSink):
+    kind = "webhook"
+
+    def __init__(self, url: str = "http://127.0.0.1:9000/events", timeout_s: float = 1.0, **kw):
+        super().__init__(**kw)
+        self.url, self.timeout = url, float(timeout_s)
+
+    def _write(self, batch):
+        req = urllib.request.Request(self.url, data=json.dumps(batch).encode(), method="POST",
+                                     headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(req, timeout=self.timeout) as r:
+            r.read()
+
+
+_SINKS = {"jsonl": JSONLSink, "unix": UnixSocketSink, "webhook": WebhookSink}
+
+
+def build_sinks(specs: List[Dict]) -> List[EventSink]:
+    sinks = []
+    for spec in specs or []:
+        spec = dict(spec)
+        kind = spec.pop("type", None)
+        if kind not in _SINKS:
+            raise ValueError(f"[Events] unknown sink type: {kind} (choose from {list(_SINKS)})")
+        sinks.append(_SINKS[kind](**spec))
+    return sinks
+
+
+class EventBus:
+    """Fan-out to every sink; ``emit`` never blocks."""
+
+    def __init__(self, sinks: List[EventSink]):
+        self.sinks = sinks
+        for s in sinks:
+            s.start()
+
+    def emit(self, events: List[Dict]):
+        if not events:
+            return
+        METRICS.inc("events.emitted", len(events))
+        for e in events:
+            for s in self.sinks:
+                s.offer(e)
+
+
+# ------------------------------------------------------------
+# local stand-in receivers for testing the sinks
+# ------------------------------------------------------------
+if __name__ == "__main__":
+    import argparse, os
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+
+    ap = argparse.ArgumentParser("event sink stand-in receiver")
+    ap.add_argument("--serve", type=int, help="HTTP port for WebhookSink")
+    ap.add_argument("--unix", help="Unix socket path for UnixSocketSink")
+    args = ap.parse_args()
+
+    if args.unix:
+        if os.path.exists(args.unix):
+            os.unlink(args.unix)
+        srv = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        srv.bind(args.unix)
+        srv.listen(1)
+        print(f"listening on {args.unix}")
+        while True:
+            conn, _ = srv.accept()
+            with conn, conn.makefile("r") as f:
+                for line in f:
+                    print(line.rstrip())
+    else:
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                for e in json.loads(body):
+                    print(json.dumps(e))
+                self.send_response(204)
+                self.end_headers()
+
+            def log_message(self, *a):
+                pass
+
+        print(f"webhook stand-in on http://127.0.0.1:{args.serve or 9000}/events")
+        HTTPServer(("127.0.0.1", args.serve or 9000), Handler).serve_forever()
@@ -0,0 +1,69 @@
+# bench_overlay.py ── track overlay cost : legacy per-box loop vs. batch renderer (Python / native)
+'''
+python -m pipeline.bench_overlay                      # 640×480, 10–200 tracks
+python -m pipeline.bench_overlay --width 1920 --height 1080 --iters 300
+
+native(vision_core) 가 빌드돼 있으면 Python fallback 과 픽셀 단위 동일성도 확인한다.
+'''
+import argparse, time
+import cv2, numpy as np
+from tracking.track_array import TrackBuffer
+from pipeline.overlay import NATIVE, OverlayRenderer
+
+
+def legacy(frame, tracks, hud):
+    """이전 Output.run 방식 – 박스마다 np.clip / int() / rectangle / putText."""
+    h, w = frame.shape[:2]
+    for t in tracks:
+        x1, y1, x2, y2 = np.clip(t["box"], 0, (w - 1, h - 1, w - 1, h - 1))
+        x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2)
+        if x2 <= x1 or y2 <= y1:
+            continue
+        cv2.rectangle(frame, (x1, y1), (x2, y2), (0, 255, 0), 2)
+        cv2.putText(frame, f"ID:{int(t['id'])}", (x1, y1 - 8), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (0, 255, 0), 1)
+    cv2.putText(frame, hud, (10, 20), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 0), 2, cv2.LINE_AA)
+
+
+def make_tracks(n, w, h, rng):
+    buf = TrackBuffer(capacity=max(n, 1))
+    xy = rng.uniform(0, (w - 60, h - 60), size=(n, 2))
+    wh = rng.uniform(15, 60, size=(n, 2))
+    return buf.fill(np.arange(n) + 1, np.hstack([xy, xy + wh])).copy()
+
+
+def main():
+    ap = argparse.ArgumentParser("overlay rendering benchmark")
+    ap.add_argument("--width", type=int, default=640)
+    ap.add_argument("--height", type=int, default=480)
+    ap.add_argument("--iters", type=int, default=200)
+    ap.add_argument("--tracks", type=int, nargs="+", default=[10, 50, 100, 200])
+    args = ap.parse_args()
+
+    rng = np.random.default_rng(0)
+    base = rng.integers(0, 255, (args.height, args.width, 3), dtype=np.uint8)
+    impls = {"legacy": legacy, "batch-py": OverlayRenderer(native=False).render}
+    if NATIVE:
+        impls["batch-native"] = OverlayRenderer(native=True).render
+    print(f"\n★★ overlay {args.width}×{args.height}, {args.iters} iters (native: {NATIVE}) ★★")
+    print(f"{'tracks':>6} " + " ".join(f"{k:>14}" for k in impls))
+    for n in args.tracks:
+        tracks = make_tracks(n, args.width, args.height, rng)
+        row = []
+        for name, fn in impls.items():
+            frame = base.copy()
+            t0 = time.perf_counter()
+            for _ in range(args.iters):
+                fn(frame, tracks, "FPS:  30.0")
+            row.append((time.perf_counter() - t0) * 1e3 / args.iters)
+        print(f"{n:>6} " + " ".join(f"{ms:11.3f} ms" for ms in row))
+        if NATIVE:
+            a, b = base.copy(), base.copy()
+            impls["batch-py"](a, tracks, "FPS:  30.0")
+            impls["batch-native"](b, tracks, "FPS:  30.0")
+            assert np.array_equal(a, b), f"native / Python output differ at {n} tracks"
+    if NATIVE:
+        print("native == Python fallback (pixel-exact)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+# pipeline/control.py – runtime control plane (localhost HTTP) for live tuning
+# -------------------------------------------------------------------------------------------
+# yaml 수정 + 재시작 (tracker 상태 손실, 모델 재로드) 없이 실행 중에 값을 바꾼다.
+#
+#   POST /config   JSON patch – 아래 키의 임의 조합, 전부 검증·준비된 뒤 한 프레임 경계에서 한꺼번에 적용
+#       preprocessing : yaml 의 preprocessing 섹션과 같은 형식 ({preset: Night} | 수동 블록)
+#       det_thresh    : 0‥1 – 모든 backend (pool 이면 worker 전부)
+#       tracker       : {max_age: 20, ...} – 실행 중 tracker 인스턴스의 같은 이름 속성 (상태 유지)
+#       detect_every  : N – N 프레임마다 detector 실행, 사이 프레임은 이전 detection 을 track 속도로 이동
+#   GET  /state    현재 값
+#   GET  /metrics  METRICS.snapshot() (stage latency ema/max, counters, gauges)
+#
+#   검증 실패 → 400 + 아무것도 적용 안 함.  무거운 준비(전처리 체인 생성)는 control 스레드에서,
+#   Pipeline 스레드는 프레임 사이에 참조만 교체 → 캡처는 멈추지 않는다.
+#
+#   pipeline.yaml
+#   -------------
+#   control:
+#     enable: true
+#     host: 127.0.0.1
+#     port: 8081
+#
+#   client: python -m pipeline.control set '{"det_thresh": 0.6, "preprocessing": {"preset": "Night"}}'
+#           python -m pipeline.control state | metrics
+#           curl -s -XPOST localhost:8081/config -d '{"detect_every": 2}'
+# -------------------------------------------------------------------------------------------
+from __future__ import annotations
+import inspect, json, threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional
+
+from utils.logger import get_logger
+from utils.metrics import METRICS
+
+__all__ = ["LiveConfig", "ControlServer"]
+
+_KEYS = ("preprocessing", "det_thresh", "tracker", "detect_every")
+
+
+def _thresh_targets(det) -> list:
+    """Objects that own ``thresh`` (wrappers 는 __getattr__ 로 읽기만 전달 → 쓰기는 안쪽까지 내려간다)."""
+    roots = det.detectors if hasattr(type(det), "detectors") else [det]    # DetectorPool
+    out = []
+    for d in roots:
+        while not isinstance(getattr(type(d), "thresh", None), property) and "det" in vars(d):
+            d = d.det
+        out.append(d)
+    return out
+
+
+def _tracker_params(trk) -> Dict[str, Any]:
+    """Constructor parameters the instance keeps under the same name (frame_count 같은 런타임 상태 제외)."""
+    names = [n for n, p in inspect.signature(type(trk).__init__).parameters.items()
+             if n != "self" and p.kind not in (p.VAR_POSITIONAL, p.VAR_KEYWORD)]
+    return {n: getattr(trk, n) for n in names
+            if isinstance(getattr(trk, n, None), (int, float, bool, str))}
+
+
+class LiveConfig:
+    """Pending-patch slot between the control thread and the Pipeline thread."""
+
+    def __init__(self, pipe):
+        self.pipe = pipe
+        self.log = get_logger("Control")
+        self._lock = threading.Lock()
+        self._pending: Optional[Dict[str, Any]] = None
+        self._applied = threading.Condition(self._lock)
+        self._gen = 0
+
+    # ---- control thread --------------------------------------------------
+    def prepare(self, patch: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate + build everything up front; raises ValueError without side effects."""
+        from pipeline.pipeline import _make_preprocessor
+        unknown = set(patch) - set(_KEYS)
+        if unknown:
+            raise ValueError(f"[Control] unknown key(s): {sorted(unknown)} (choose from {list(_KEYS)})")
+        ready: Dict[str, Any] = {}
+        if "preprocessing" in patch:
+            pcfg = patch["preprocessing"]
+            if not isinstance(pcfg, dict):
+                raise ValueError("[Control] preprocessing must be a mapping")
+            try:
+                ready["preprocessing"] = (_make_preprocessor(pcfg), pcfg)
+            except (KeyError, TypeError, ValueError) as e:
+                raise ValueError(f"[Control] preprocessing: {e}") from e
+        if "det_thresh" in patch:
+            v = float(patch["det_thresh"])
+            if not 0.0 <= v <= 1.0:
+                raise ValueError(f"[Control] det_thresh out of range: {v}")
+            ready["det_thresh"] = v
+        if "tracker" in patch:
+            params = dict(patch["tracker"] or {})
+            trk = self.pipe.trk
+            tunable = _tracker_params(trk)
+            missing = [k for k in params if k not in tunable]
+            if missing:
+                raise ValueError(f"[Control] {type(trk).__name__} has no tunable parameter(s) {missing} "
+                                 f"(choose from {sorted(tunable)})")
+            ready["tracker"] = {k: type(tunable[k])(v) for k, v in params.items()}
+        if "detect_every" in patch:
+            n = int(patch["detect_every"])
+            if n < 1:
+                raise ValueError("[Control] detect_every must be ≥ 1")
+            if self.pipe.pool and n != 1:
+                raise ValueError("[Control] detect_every is not supported with detector.pool")
+            ready["detect_every"] = n
+        return ready
+
+    def submit(self, patch: Dict[str, Any], timeout: float = 2.0) -> bool:
+        """Queue a validated patch; True once the Pipeline thread applied it (within timeout)."""
+        ready = self.prepare(patch)
+        with self._lock:
+            self._pending = {**(self._pending or {}), **ready}
+            gen = self._gen + 1
+            return self._applied.wait_for(lambda: self._gen >= gen, timeout)
+
+    # ---- pipeline thread (프레임 경계) -------------------------------------
+    def apply(self):
+        if self._pending is None:                 # lock 없는 fast path – 평소 비용은 속성 조회 1 회
+            return
+        with self._lock:
+            ready, self._pending = self._pending, None
+            pipe = self.pipe
+            if "preprocessing" in ready:
+                pipe.pre, pipe.pre_cfg = ready["preprocessing"]
+            if "det_thresh" in ready:
+                for d in _thresh_targets(pipe.det):
+                    d.thresh = ready["det_thresh"]
+            for k, v in ready.get("tracker", {}).items():
+                setattr(pipe.trk, k, v)
+            if "detect_every" in ready:
+                pipe.detect_every = ready["detect_every"]
+            self._gen += 1
+            self._applied.notify_all()
+        METRICS.inc("control.applied")
+        self.log.info("applied %s", sorted(ready))
+
+    def state(self) -> Dict[str, Any]:
+        pipe = self.pipe
+        trk = pipe.trk
+        return {
+            "preprocessing": pipe.pre_cfg,
+            "det_thresh": _thresh_targets(pipe.det)[0].thresh,
+            "tracker": {"name": type(trk).__name__, **_tracker_params(trk)},
+            "detect_every": pipe.detect_every,
+        }
+
+
+class ControlServer:
+    """``GET /state``, ``GET /metrics``, ``POST /config`` on a ThreadingHTTPServer."""
+
+    def __init__(self, live: LiveConfig, host: str = "127.0.0.1", port: int = 8081, **_):
+        self.live = live
+        self.log = get_logger("Control")
+        self._httpd = ThreadingHTTPServer((host, int(port)), self._handler())
+        self._httpd.daemon_threads = True
+        self.address = self._httpd.server_address
+
+    def start(self):
+        threading.Thread(target=self._httpd.serve_forever, daemon=True, name="ControlHttp").start()
+        self.log.info("Control plane on http://%s:%d/ (GET /state /metrics, POST /config)", *self.address[:2])
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, fmt, *args):
+                server.log.debug(fmt, *args)
+
+            def _json(self, code: int, obj):
+                body = json.dumps(obj, default=str).encode()
+                self.send_response(code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                if self.path == "/state":
+                    return self._json(200, server.live.state())
+                if self.path == "/metrics":
+                    return self._json(200, METRICS.snapshot())
+                self.send_error(404)
+
+            def do_POST(self):
+                if self.path != "/config":
+                    return self.send_error(404)
+                try:
+                    patch = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                    if not isinstance(patch, dict):
+                        raise ValueError("[Control] body must be a JSON object")
+                    applied = server.live.submit(patch)
+                except (ValueError, TypeError) as e:
+                    return self._json(400, {"error": str(e)})
+                self._json(200 if applied else 202, {"applied": applied, "state": server.live.state()})
+
+        return Handler
+
+
+# ------------------------------------------------------------
+# client
+# ------------------------------------------------------------
+if __name__ == "__main__":
+    import argparse, sys, urllib.error, urllib.request
+
+    ap = argparse.ArgumentParser("pipeline control client")
+    ap.add_argument("cmd", choices=["state", "metrics", "set"])
+    ap.add_argument("patch", nargs="?", help='set: JSON, e.g. \'{"det_thresh": 0.6}\'')
+    ap.add_argument("--url", default="http://127.0.0.1:8081")
+    args = ap.parse_args()
+
+    if args.cmd == "set":
+        req = urllib.request.Request(f"{args.url}/config", data=(args.patch or "{}").encode(), method="POST",
+                                     headers={"Content-Type": "application/json"})
+    else:
+        req = urllib.request.Request(f"{args.url}/{args.cmd}")
+    try:
+        with urllib.request.urlopen(req, timeout=5) as r:
+            print(json.dumps(json.loads(r.read()), indent=2))
+    except urllib.error.HTTPError as e:
+        print(e.read().decode(), file=sys.stderr)
+        sys.exit(1)
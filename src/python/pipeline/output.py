@@ -1,29 +1,70 @@
 # src/python/output.py  –  Thread‑3 : Display & Save (FPS HUD always, optional pseudo-IR display)
 # ================================================================
-import cv2, queue, threading, math, numpy as np, yaml, time
+import cv2, queue, threading, yaml, time
+from typing import Optional
 from utils.logger import get_logger
+from utils.startup import STARTUP
+from utils.trace import TRACER
+from utils.profiler import PROFILER
+from pipeline.overlay import OverlayRenderer
+from tracking.trajectory import TrajectoryStore
+# recorder / stream_server(http.server) / events(urllib) 는 켜져 있을 때만 import → 기동 시간 단축
 
 class Output(threading.Thread):
     """Displays frames and draws tracking boxes with an always-on FPS HUD.
     Optionally display pseudo-IR (thermal) if `display_gray` is True in config.
-    Expects queue entries: (timestamp, frame, tracks).
+    Expects queue entries: (timestamp, frame, tracks, trace).
     * timestamp: float – capture time.
     * frame: H×W×3 BGR image.
-    * tracks: list[(x1,y1,x2,y2,id)].
+    * tracks: TRACK_DTYPE structured array (tracking.track_array).
+    * trace: utils.trace.FrameTrace for sampled frames, else None.
+    If `record.enable` is set, frames are also handed to an async Recorder.
+    `events.enable` evaluates zone / tripwire rules and emits events asynchronously.
+    `trajectory.enable` draws per-track trails below the boxes.
+    `display: headless` skips imshow/waitKey; `stream.enable` serves MJPEG over HTTP.
     ESC closes the window."""
-    def __init__(self, in_q: queue.Queue, config_path: str = "../../config/pipeline.yaml"):
-        super().__init__(daemon=True)
+    def __init__(self, in_q: queue.Queue, config_path: str = "../../config/pipeline.yaml",
+                 cfg: Optional[dict] = None):
+        super().__init__(daemon=True, name="Output")
         self.q = in_q
         self.log = get_logger("Output")
         self.last_ts = None
         self.fps_ema = 0.0
-        try:
-            with open(config_path, 'r') as f:
-                cfg = yaml.safe_load(f) or {}
-            self.display_gray = cfg.get('display_gray', False)
-        except Exception as e:
-            self.log.warning(f"Failed to load config '{config_path}': {e}")
-            self.display_gray = False
+        self.frames = 0                               # 처리한 프레임 수 (replay 종료 시 drain 판단)
+        if cfg is None:
+            try:
+                with open(config_path, 'r') as f:
+                    cfg = yaml.safe_load(f) or {}
+            except Exception as e:
+                self.log.warning(f"Failed to load config '{config_path}': {e}")
+                cfg = {}
+        self.display_gray = cfg.get('display_gray', False)
+        self.overlay = OverlayRenderer()
+        tr_cfg = dict(cfg.get("trajectory") or {})
+        tr_cfg.setdefault("max_age", ((cfg.get("tracker") or {}).get("params") or {}).get("max_age", 10))
+        self.trails = TrajectoryStore(**tr_cfg) if tr_cfg.get("enable", False) else None
+        ev_cfg = cfg.get("events") or {}
+        self.events = self.bus = None
+        if ev_cfg.get("enable", False):
+            from events.engine import EventEngine
+            from events.sinks import EventBus, build_sinks
+            self.events = EventEngine(ev_cfg.get("rules") or [], **{k: v for k, v in ev_cfg.items() if k != "rules"})
+            self.bus = EventBus(build_sinks(ev_cfg.get("sinks")))
+            self.draw_rules = ev_cfg.get("draw", True)
+
+        self.headless = cfg.get("display", "window") == "headless"
+        st_cfg = cfg.get("stream") or {}
+        self.stream = None
+        if st_cfg.get("enable", False):
+            from pipeline.stream_server import MJPEGServer
+            self.stream = MJPEGServer(**st_cfg).start()
+
+        rec_cfg = cfg.get("record") or {}
+        self.rec = None
+        if rec_cfg.get("enable", False):
+            from pipeline.recorder import Recorder
+            self.rec = Recorder(rec_cfg)
+            self.rec.start()
 
     def _update_fps(self, curr_ts: float) -> float:
         if self.last_ts is None:
@@ -39,7 +80,15 @@ class Output(threading.Thread):
 
     def run(self):
         while True:
-            cap_ts, frame, tracks = self.q.get()
+            cap_ts, frame, tracks, tr = self.q.get()
+            self.frames += 1
+            PROFILER.checkpoint()
+            if tr:
+                tr.dequeue("out_q")
+            t0 = time.perf_counter()
+            raw = None                                # 박스 그리기 전 원본 (pseudo-IR 은 새 배열 → 복사 불필요)
+            if self.rec and self.rec.wants_raw:
+                raw = frame if self.display_gray else frame.copy()
 
             # Optional pseudo-IR display
             if self.display_gray:
@@ -51,25 +100,35 @@ class Output(threading.Thread):
                 # 3) Gray → BGR (다른 코드와 통일시키기 위함)
                 frame = cv2.cvtColor(gray_eq, cv2.COLOR_GRAY2BGR)
 
-            # Draw tracking boxes
-            h, w = frame.shape[:2]
-            for x1, y1, x2, y2, tid in tracks:
-                if not all(map(math.isfinite, (x1, y1, x2, y2))):
-                    continue
-                xi1 = int(np.clip(x1, 0, w - 1)); yi1 = int(np.clip(y1, 0, h - 1))
-                xi2 = int(np.clip(x2, 0, w - 1)); yi2 = int(np.clip(y2, 0, h - 1))
-                if xi2 > xi1 and yi2 > yi1:
-                    cv2.rectangle(frame, (xi1, yi1), (xi2, yi2), (0, 255, 0), 2)
-                    cv2.putText(frame, f"ID:{int(tid)}", (xi1, yi1 - 8),
-                                cv2.FONT_HERSHEY_SIMPLEX, 0.4, (0, 255, 0), 1)
-
-            # FPS HUD
+            # Tracks + FPS HUD – 한 번의 호출 (vision_core native, 없으면 Python fallback)
             fps = self._update_fps(cap_ts)
-            cv2.putText(frame, f"FPS: {fps:5.1f}", (10, 20),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 0), 2, cv2.LINE_AA)
+            if self.events:
+                self.bus.emit(self.events.update(tracks, cap_ts))    # non-blocking – sink 별 스레드
+                if self.draw_rules:
+                    self.events.draw(frame)
+            if self.trails:
+                self.trails.update(tracks)
+                self.trails.draw(frame)               # 모든 궤적을 polylines 한 번으로
+            self.overlay.render(frame, tracks, f"FPS: {fps:5.1f}")
+            STARTUP.first_frame()                     # 첫 호출에만 기동 breakdown 기록
+            t1 = time.perf_counter()
 
-            cv2.imshow("EO", frame)
-            if cv2.waitKey(1) & 0xFF == 27:
+            if self.rec:
+                self.rec.push(frame, raw)             # non-blocking – 인코딩은 Recorder 스레드
+            if self.stream:
+                self.stream.publish(frame)            # non-blocking – client 없으면 인코딩 안 함
+            t2 = time.perf_counter()
+            if not self.headless:
+                cv2.imshow("EO", frame)
+                key = cv2.waitKey(1) & 0xFF
+            if tr:
+                tr.add("draw", t0, t1); tr.add("sinks", t1, t2)
+                if not self.headless:
+                    tr.add("display", t2, time.perf_counter())
+                TRACER.finish(tr)
+            if not self.headless and key == 27:
                 break
 
+        if self.rec:
+            self.rec.stop()
         cv2.destroyAllWindows()
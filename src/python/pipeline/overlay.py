@@ -0,0 +1,93 @@
+# pipeline/overlay.py – batch track overlay (native vision_core renderer + pure-Python fallback)
+# -------------------------------------------------------------------------------------------
+# 박스·라벨·FPS HUD 를 한 번의 호출로 그린다.
+#
+#   native   : src/cpp/vision_core (pybind11 → build/vision_core*.so)  – C++ 루프, GIL 해제
+#   fallback : 같은 규칙·같은 cv2 호출 순서 → 픽셀 단위로 동일한 결과
+#
+#   좌표 규칙 : 유한값만, [0,w-1]×[0,h-1] clip 후 int 절삭, x2>x1 & y2>y1 인 박스만
+#   라벨      : "ID:<n>" – 채운 배경 + 검은 글씨 (vision_core::draw_box 스타일),
+#               문자열·getTextSize 결과는 track id 별로 캐시
+#
+# 빌드: mkdir build && cd build && cmake -GNinja .. && ninja   (pip install pybind11)
+# 벤치: python -m pipeline.bench_overlay
+# -------------------------------------------------------------------------------------------
+from __future__ import annotations
+import sys
+from pathlib import Path
+from typing import Optional
+
+import cv2, numpy as np
+
+__all__ = ["OverlayRenderer", "PyOverlayRenderer", "NATIVE"]
+
+_BUILD = Path(__file__).resolve().parents[3] / "build"
+try:
+    import vision_core as _native                 # type: ignore
+except ImportError:
+    if _BUILD.is_dir() and str(_BUILD) not in sys.path:
+        sys.path.append(str(_BUILD))
+    try:
+        import vision_core as _native             # type: ignore
+    except ImportError:
+        _native = None
+
+NATIVE = _native is not None
+
+_FONT, _SCALE, _THICK = cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1       # vision_core/draw.hpp 와 동일
+
+
+class PyOverlayRenderer:
+    """Pure-Python twin of ``vision_core::OverlayRenderer``."""
+
+    def __init__(self, box_color=(0, 255, 0), hud_color=(255, 255, 0), cache_size: int = 1024):
+        self.box_color, self.hud_color = tuple(box_color), tuple(hud_color)
+        self.cache_size = int(cache_size)
+        self._cache = {}                          # track id → ("ID:<n>", (w, h))
+
+    @property
+    def cached(self) -> int:
+        return len(self._cache)
+
+    def _label(self, tid: int):
+        l = self._cache.get(tid)
+        if l is None:
+            if len(self._cache) >= self.cache_size:
+                self._cache.clear()
+            text = f"ID:{tid}"
+            l = self._cache[tid] = (text, cv2.getTextSize(text, _FONT, _SCALE, _THICK)[0])
+        return l
+
+    def render(self, frame: np.ndarray, boxes: np.ndarray, ids: np.ndarray, hud: str = "") -> int:
+        h, w = frame.shape[:2]
+        ok = np.isfinite(boxes).all(axis=1)
+        xy = np.clip(boxes[ok], 0, (w - 1, h - 1, w - 1, h - 1)).astype(np.int32)
+        keep = (xy[:, 2] > xy[:, 0]) & (xy[:, 3] > xy[:, 1])
+        c = self.box_color
+        for (x1, y1, x2, y2), tid in zip(xy[keep].tolist(), ids[ok][keep].tolist()):
+            text, (tw, th) = self._label(tid)
+            cv2.rectangle(frame, (x1, y1), (x2, y2), c, 2)
+            cv2.rectangle(frame, (x1, y1 - th - 4), (x1 + tw, y1), c, cv2.FILLED)
+            cv2.putText(frame, text, (x1, y1 - 2), _FONT, _SCALE, (0, 0, 0), _THICK)
+        if hud:
+            cv2.putText(frame, hud, (10, 20), cv2.FONT_HERSHEY_SIMPLEX, 0.6, self.hud_color, 2, cv2.LINE_AA)
+        return int(keep.sum())
+
+
+class OverlayRenderer:
+    """``render(frame, tracks, hud)`` – draws a TRACK_DTYPE array + HUD in place, native if built."""
+
+    def __init__(self, box_color=(0, 255, 0), hud_color=(255, 255, 0), cache_size: int = 1024,
+                 native: Optional[bool] = None):
+        use_native = NATIVE if native is None else (native and NATIVE)
+        impl = _native.OverlayRenderer if use_native else PyOverlayRenderer
+        self.native = use_native
+        self._r = impl(tuple(box_color), tuple(hud_color), cache_size)
+
+    def render(self, frame: np.ndarray, tracks: np.ndarray, hud: str = "") -> int:
+        # structured field view 는 strided → native 는 연속 float32/int32 를 요구 (N 작아 복사 비용 미미)
+        boxes = np.ascontiguousarray(tracks["box"], dtype=np.float32).reshape(-1, 4)
+        ids = np.ascontiguousarray(tracks["id"], dtype=np.int32)
+        if self.native and not (frame.flags.c_contiguous and frame.dtype == np.uint8):
+            raise ValueError("[Overlay] native renderer needs a C-contiguous uint8 frame")
+        return self._r.render(frame, boxes, ids, hud)
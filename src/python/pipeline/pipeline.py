@@ -1,11 +1,18 @@
 # Thread‑2: End‑to‑end pipeline glue.
 import queue, threading, time
 from processing.enhancers import build_preprocessing      # ★ NEW
-from detection.tpu_detection import TPUDetector
-from tracking.sort_tracker import Sort
+from detection.factory import build_detector
+from detection.tiling import TiledDetector
+from detection.roi import ROIRedetector
+from detection.motion_gate import GatedDetector, carry_detections
 from utils.logger import get_logger
+from utils.metrics import METRICS
+from utils.trace import TRACER
+from utils.profiler import PROFILER
 from typing import Optional
 from tracking.factory import build_tracker
+from tracking.camera_motion import CameraMotionEstimator, compose_affine
+from detection.pool import DetectorPool
 
 # ------------------------------------------------------------
 def _make_preprocessor(pcfg: Optional[dict]):
@@ -37,35 +44,138 @@ def _make_preprocessor(pcfg: Optional[dict]):
 
 
 class Pipeline(threading.Thread):
-    def __init__(self, in_q: queue.Queue, out_q: queue.Queue, cfg: dict):
-        super().__init__(daemon=True)
+    def __init__(self, in_q: queue.Queue, out_q: queue.Queue, cfg: dict, det=None, trk=None):
+        super().__init__(daemon=True, name="Pipeline")
         self.in_q, self.out_q = in_q, out_q
         self.log = get_logger("Pipeline")
 
-        self.pre = _make_preprocessor(cfg.get("preprocessing"))
-        self.det = TPUDetector(cfg["det_model"], cfg.get("det_thresh", 0.5))
-        self.trk = Sort()
-        #self.trk = build_tracker(cfg)
+        self.pre_cfg = cfg.get("preprocessing")
+        self.pre = _make_preprocessor(self.pre_cfg)
+        self.detect_every = int(cfg.get("detect_every", 1))   # N 프레임마다 detector, 사이는 carry
+        self._n = 0
+        self._prev_dets = None
+        self.det = det if det is not None else build_detector(cfg)    # det: DetectorLoader 결과
+        self.pool = self.det if isinstance(self.det, DetectorPool) else None
+        wrappers = (("tiling", TiledDetector), ("roi", ROIRedetector),      # roi: full-frame ↔ mosaic ROI
+                    ("motion_gate", GatedDetector))                         # gate: 정적 장면 → invoke 생략
+        for key, wrap in wrappers:
+            wcfg = cfg.get(key) or {}
+            if not wcfg.get("enable", False):
+                continue
+            if self.pool:                        # 동기 wrapper 는 pool 병렬성을 없앤다
+                self.log.warning("%s disabled: not supported with detector.pool", key)
+                continue
+            self.det = wrap(self.det, **wcfg)
+        self._det_tracks = getattr(self.det, "accepts_tracks", False)   # tiling / roi / gate: track 기반
+        self._last_tracks = None
+        self.trk = trk if trk is not None else build_tracker(cfg)   # trk: 백그라운드 Loader 결과
+        self._trk_frame = getattr(self.trk, "needs_frame", False)   # e.g. deepsort appearance
+
+        cmc_cfg = cfg.get("camera_motion") or {}
+        self.cmc = CameraMotionEstimator(**cmc_cfg) if cmc_cfg.get("enable", False) else None
+
+        rl_cfg = cfg.get("results_log") or {}         # 프레임별 dets / tracks / latency → columnar log
+        self.results = None
+        if rl_cfg.get("enable", False):
+            from pipeline.results_log import ResultsWriter
+            self.results = ResultsWriter(**rl_cfg)
+            self.results.start()
+            self.log.info("results log → %s", self.results.root)
+
+        ctl_cfg = cfg.get("control") or {}          # 실행 중 preset / threshold / tracker / cadence 변경
+        self.live = self.control = None
+        if ctl_cfg.get("enable", False):
+            from pipeline.control import ControlServer, LiveConfig
+            self.live = LiveConfig(self)
+            self.control = ControlServer(self.live, **ctl_cfg).start()
+
+    def _detect(self, frame):
+        """detector 호출 – detect_every > 1 이면 사이 프레임은 이전 결과를 track 속도로 이동."""
+        skip = self._n % self.detect_every and self._prev_dets is not None
+        self._n += 1
+        if skip:
+            METRICS.inc("pipeline.det_skipped")
+            self._prev_dets = carry_detections(self._prev_dets, self._last_tracks)
+        else:
+            self._prev_dets = self.det(frame, tracks=self._last_tracks) if self._det_tracks else self.det(frame)
+        return self._prev_dets
 
     def run(self):
+        if self.pool:
+            return self._run_pooled()
         while True:
-            ts, frame = self.in_q.get()
+            ts, frame, tr = self.in_q.get()           # tr: FrameTrace (샘플링된 프레임) | None
+            if tr:
+                tr.dequeue("cap_q")
+            if self.live:
+                self.live.apply()                    # control plane 변경은 프레임 경계에서만
+            PROFILER.checkpoint()                    # SIGUSR1 cprofile: 켜고 끄는 것도 프레임 경계에서
 
             t0 = time.perf_counter()
+            warp = self.cmc(frame) if self.cmc else None     # raw frame 기준 ego-motion
             frame = self.pre(frame)
             t1 = time.perf_counter()
 
-            dets = self.det(frame)
+            dets = self._detect(frame)
             t2 = time.perf_counter()
 
-            tracks = self.trk.update(dets)
+            kw = {"frame": frame} if self._trk_frame else {}
+            tracks = self.trk.update(dets, warp=warp, **kw)
+            self._last_tracks = tracks
             t3 = time.perf_counter()
 
-            self.out_q.put((ts, frame, tracks))
+            if tr:
+                tr.add("pre", t0, t1); tr.add("detect", t1, t2); tr.add("track", t2, t3)
+                tr.enqueue("out_q")
+            self.out_q.put((ts, frame, tracks.copy(), tr))    # TrackBuffer 슬롯 재사용 → 큐 깊이와 무관하게 소유
             t4 = time.perf_counter()
+            if self.results:
+                self.results.append(ts, dets, tracks, (t1-t0)*1e3, (t2-t1)*1e3, (t3-t2)*1e3)
 
             print(f"Pre-processing:{(t1-t0)*1e3:5.1f}  \n"
                 f"Detection:{(t2-t1)*1e3:5.1f}\n"
                 f"Tracking:{(t3-t2)*1e3:5.1f}\n"
                 f"Output:{(t4-t3)*1e3:5.1f}\n")
 
+    # --------------------------------------------------------
+    # detector.pool: submit 스레드(본 스레드) ↔ collect 스레드, 결과는 캡처 순서
+    # --------------------------------------------------------
+    def _run_pooled(self):
+        threading.Thread(target=self._collect, daemon=True, name="PipelineCollect").start()
+        while True:
+            ts, frame, tr = self.in_q.get()
+            if tr:
+                tr.dequeue("cap_q")
+            if self.live:
+                self.live.apply()
+            PROFILER.checkpoint()
+            t0 = time.perf_counter()
+            warp = self.cmc(frame) if self.cmc else None
+            frame = self.pre(frame)
+            if tr:
+                tr.add("pre", t0, time.perf_counter())
+                tr.enqueue("pool")                   # submit → 결과 수거: pool 대기 + detect
+            self.pool.submit(frame, (ts, frame, warp, tr))
+
+    def _collect(self):
+        carry = None                                  # skip 된 프레임들의 누적 warp
+        while True:
+            (ts, frame, warp, tr), dets = self.pool.get()
+            if tr:
+                tr.dequeue("pool")
+            if warp is not None and carry is not None:
+                warp = compose_affine(warp, carry)
+            if dets is None:                          # 너무 늦은 결과 → 프레임 skip
+                carry = warp
+                TRACER.finish(tr)                     # skip 된 프레임도 pool 대기까지는 기록
+                continue
+            carry = None
+            kw = {"frame": frame} if self._trk_frame else {}
+            t0 = time.perf_counter()
+            tracks = self.trk.update(dets, warp=warp, **kw)
+            if tr:
+                tr.add("track", t0, time.perf_counter())
+                tr.enqueue("out_q")
+            self.out_q.put((ts, frame, tracks.copy(), tr))
+            if self.results:                          # pool 모드: stage latency 는 pool.* metrics 참고
+                self.results.append(ts, dets, tracks)
@@ -0,0 +1,146 @@
+# pipeline/recorder.py – asynchronous recording sink (bounded encode queue + segment rotation)
+# -------------------------------------------------------------------------------------------
+# Output 스레드에서 VideoWriter.write 를 직접 부르면 인코딩이 화면 표시를 막는다.
+# Recorder 는 자체 스레드에서 인코딩하고, push() 는 절대 block 하지 않는다:
+#
+#   policy: drop      – 큐가 가득 차면 새 프레임을 버린다
+#           decimate  – 큐가 절반 이상 차면 2 프레임 중 1 프레임만 받고, 가득 차면 버린다
+#   rotate : segment_s 초 또는 segment_mb MB 를 넘으면 새 파일
+#
+#   pipeline.yaml
+#   -------------
+#   record:
+#     enable: true
+#     dir: ../../recordings
+#     mode: annotated       # annotated | raw | both
+#     fourcc: MJPG          # MJPG → .avi, mp4v → .mp4
+#     fps: 30
+#     queue: 16
+#     policy: decimate      # drop | decimate
+#     segment_s: 300
+#     segment_mb: 512
+#
+# metrics: record.encode_ms, record.dropped, record.decimated, record.segments, record.queue
+# -------------------------------------------------------------------------------------------
+from __future__ import annotations
+import os, queue, threading, time
+from pathlib import Path
+from typing import Optional
+
+import cv2, numpy as np
+from utils.logger import get_logger
+from utils.metrics import METRICS
+
+__all__ = ["Recorder"]
+
+_EXT = {"MJPG": ".avi", "XVID": ".avi", "mp4v": ".mp4", "avc1": ".mp4"}
+
+
+class _Segmenter:
+    """One output stream → rotating VideoWriter segments."""
+
+    def __init__(self, root: Path, stream: str, fourcc: str, fps: float,
+                 segment_s: float, segment_mb: float):
+        self.root, self.stream = root, stream
+        self.fourcc, self.fps = fourcc, float(fps)
+        self.segment_s, self.max_bytes = float(segment_s), float(segment_mb) * 1024 * 1024
+        self.writer = None
+        self.path: Optional[Path] = None
+        self._t_open = 0.0
+        self._n = 0
+        self._idx = 0                             # 같은 초 안의 rotation 도 파일명이 겹치지 않도록
+
+    def _open(self, shape):
+        stamp = time.strftime("%Y%m%d_%H%M%S")
+        self._idx += 1
+        self.path = self.root / f"{stamp}_{self.stream}_{self._idx:03d}{_EXT.get(self.fourcc, '.avi')}"
+        h, w = shape[:2]
+        self.writer = cv2.VideoWriter(str(self.path), cv2.VideoWriter_fourcc(*self.fourcc),
+                                      self.fps, (w, h), len(shape) == 3)
+        if not self.writer.isOpened():
+            raise RuntimeError(f"[Recorder] cannot open writer {self.path}")
+        self._t_open, self._n = time.monotonic(), 0
+        METRICS.inc("record.segments")
+
+    def _due(self) -> bool:
+        if self.segment_s > 0 and time.monotonic() - self._t_open >= self.segment_s:
+            return True
+        # 파일 크기는 30 프레임마다만 확인 (stat syscall 절약)
+        return self.max_bytes > 0 and self._n % 30 == 0 and os.path.getsize(self.path) >= self.max_bytes
+
+    def write(self, frame: np.ndarray):
+        if self.writer is not None and self._due():
+            self.close()
+        if self.writer is None:
+            self._open(frame.shape)
+        self.writer.write(frame)
+        self._n += 1
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.release()
+            self.writer = None
+
+
+class Recorder(threading.Thread):
+    """Background video recorder; ``push(annotated, raw)`` never blocks the caller."""
+
+    def __init__(self, cfg: dict):
+        super().__init__(daemon=True, name="Recorder")
+        self.log = get_logger("Recorder")
+        self.mode = cfg.get("mode", "annotated")
+        if self.mode not in ("annotated", "raw", "both"):
+            raise ValueError(f"[Recorder] unknown mode: {self.mode}")
+        self.policy = cfg.get("policy", "decimate")
+        if self.policy not in ("drop", "decimate"):
+            raise ValueError(f"[Recorder] unknown policy: {self.policy}")
+        root = Path(cfg.get("dir", "recordings"))
+        root.mkdir(parents=True, exist_ok=True)
+        args = (cfg.get("fourcc", "MJPG"), cfg.get("fps", 30),
+                cfg.get("segment_s", 300), cfg.get("segment_mb", 512))
+        streams = ("annotated", "raw") if self.mode == "both" else (self.mode,)
+        self._seg = {s: _Segmenter(root, s, *args) for s in streams}
+        self.q: queue.Queue = queue.Queue(maxsize=int(cfg.get("queue", 16)))
+        self._high = max(1, self.q.maxsize // 2)
+        self._n = 0
+        self._halt = threading.Event()
+
+    @property
+    def wants_raw(self) -> bool:
+        return self.mode in ("raw", "both")
+
+    def push(self, annotated: Optional[np.ndarray], raw: Optional[np.ndarray] = None):
+        """Enqueue one frame set (raw 는 wants_raw 일 때만 필요). 압박 시 버리거나 솎아낸다."""
+        self._n += 1
+        if self.policy == "decimate" and self.q.qsize() >= self._high and self._n % 2:
+            METRICS.inc("record.decimated")
+            return
+        try:
+            self.q.put_nowait((annotated, raw))
+        except queue.Full:
+            METRICS.inc("record.dropped")
+        METRICS.gauge("record.queue", self.q.qsize())
+
+    def run(self):
+        try:
+            while not self._halt.is_set() or not self.q.empty():
+                try:
+                    annotated, raw = self.q.get(timeout=0.2)
+                except queue.Empty:
+                    continue
+                t0 = time.perf_counter()
+                for stream, seg in self._seg.items():
+                    frame = annotated if stream == "annotated" else raw
+                    if frame is not None:
+                        seg.write(frame)
+                METRICS.observe("record.encode_ms", (time.perf_counter() - t0) * 1e3)
+        except Exception as e:                   # noqa: BLE001 – 녹화 실패가 표시를 멈추지 않도록
+            self.log.error("Recording stopped: %s", e)
+        finally:
+            for seg in self._seg.values():
+                seg.close()
+
+    def stop(self, timeout: float = 2.0):
+        """Flush queued frames and close the current segments."""
+        self._halt.set()
+        self.join(timeout)
@@ -0,0 +1,287 @@
+# pipeline/results_log.py – append-only columnar results log (writer thread + memmap reader + CLI)
+# -------------------------------------------------------------------------------------------
+# 프레임별 detections / tracks / stage latency 를 고정 dtype 레코드로 남겨, 사후 분석 시
+# 영상을 다시 돌리지 않아도 되게 한다.
+#
+#   <run>/frames.bin   FRAME_REC   프레임 1 행  (frame, ts, pre/det/trk ms, det/track 개수)
+#   <run>/dets.bin     DET_REC     detection 1 행 (frame, box, score, cls)
+#   <run>/tracks.bin   TRACK_REC   track 1 행 (frame, ts, id, box, score, vel, flags)
+#   <run>/meta.json    dtype 기술 + 버전
+#
+# writer : append() 는 레코드 배열만 만들어 큐에 넣고, 백그라운드 스레드가 flush_s 마다 chunk 로
+#          이어 쓰고 fsync_s 마다 fsync. 중간에 죽어도 마지막 불완전 레코드만 잘린다.
+# reader : 각 파일을 np.memmap – ts / frame 이 단조 증가라 시간 구간은 searchsorted 로 slice.
+#
+#   pipeline.yaml
+#   -------------
+#   results_log:
+#     enable: true
+#     dir: ../../results        # 실행마다 <dir>/<YYYYmmdd_HHMMSS>/
+#     flush_s: 1.0
+#     fsync_s: 5.0
+#
+# CLI
+#   python -m pipeline.results_log summarize <run>
+#   python -m pipeline.results_log export <run> --what tracks --t0 10 --t1 20 --id 7 --out t.csv
+#   python -m pipeline.results_log render <run> --video rec.avi [--out overlay.avi]
+# -------------------------------------------------------------------------------------------
+from __future__ import annotations
+import json, os, queue, sys, threading, time
+from pathlib import Path
+from typing import Optional, Tuple
+
+import numpy as np
+from utils.logger import get_logger
+from utils.metrics import METRICS
+from tracking.track_array import TRACK_DTYPE
+
+__all__ = ["FRAME_REC", "DET_REC", "TRACK_REC", "ResultsWriter", "ResultsReader"]
+
+VERSION = 1
+
+FRAME_REC = np.dtype([
+    ("frame", np.int64), ("ts", np.float64),
+    ("pre_ms", np.float32), ("det_ms", np.float32), ("trk_ms", np.float32),
+    ("n_det", np.int32), ("n_trk", np.int32),
+])
+DET_REC = np.dtype([
+    ("frame", np.int64), ("box", np.float32, (4,)), ("score", np.float32), ("cls", np.int16),
+])
+TRACK_REC = np.dtype([
+    ("frame", np.int64), ("ts", np.float64), ("id", np.int32), ("box", np.float32, (4,)),
+    ("score", np.float32), ("vel", np.float32, (2,)), ("flags", np.uint8),
+])
+_FILES = {"frames": FRAME_REC, "dets": DET_REC, "tracks": TRACK_REC}
+
+
+# ------------------------------------------------------------
+# Writer
+# ------------------------------------------------------------
+
+class ResultsWriter(threading.Thread):
+    """Background append-only writer; ``append()`` only builds records and enqueues them."""
+
+    def __init__(self, dir: str = "results", flush_s: float = 1.0, fsync_s: float = 5.0,
+                 queue_size: int = 1024, run: Optional[str] = None, **_):
+        super().__init__(daemon=True, name="ResultsWriter")
+        self.log = get_logger("ResultsLog")
+        self.root = Path(dir) / (run or time.strftime("%Y%m%d_%H%M%S"))
+        self.root.mkdir(parents=True, exist_ok=True)
+        (self.root / "meta.json").write_text(json.dumps(
+            {"version": VERSION, **{k: np.lib.format.dtype_to_descr(d) for k, d in _FILES.items()}}))
+        self.flush_s, self.fsync_s = float(flush_s), float(fsync_s)
+        self.q: queue.Queue = queue.Queue(maxsize=int(queue_size))
+        self._files = {k: open(self.root / f"{k}.bin", "ab") for k in _FILES}
+        self._frame = 0
+        self._halt = threading.Event()
+
+    def append(self, ts: float, dets: np.ndarray, tracks: np.ndarray,
+               pre_ms: float = np.nan, det_ms: float = np.nan, trk_ms: float = np.nan):
+        f = self._frame
+        self._frame += 1
+        fr = np.zeros(1, FRAME_REC)
+        fr[0] = (f, ts, pre_ms, det_ms, trk_ms, len(dets), len(tracks))
+        d = np.zeros(len(dets), DET_REC)
+        if len(dets):
+            d["frame"] = f
+            d["box"] = dets[:, :4]
+            d["score"] = dets[:, 4]
+            d["cls"] = dets[:, 5] if dets.shape[1] > 5 else 0
+        t = np.zeros(len(tracks), TRACK_REC)      # 복사 → TrackBuffer 재사용과 무관
+        if len(tracks):
+            t["frame"], t["ts"] = f, ts
+            for k in ("id", "box", "score", "vel", "flags"):
+                t[k] = tracks[k]
+        try:
+            self.q.put_nowait((fr, d, t))
+        except queue.Full:
+            METRICS.inc("results.dropped")
+
+    def run(self):
+        pending = {k: [] for k in _FILES}
+        last_flush = last_sync = time.monotonic()
+        while True:
+            try:
+                fr, d, t = self.q.get(timeout=self.flush_s / 4)
+                pending["frames"].append(fr); pending["dets"].append(d); pending["tracks"].append(t)
+            except queue.Empty:
+                pass
+            now = time.monotonic()
+            done = self._halt.is_set() and self.q.empty()
+            if now - last_flush >= self.flush_s or done:
+                t0 = time.perf_counter()
+                for k, parts in pending.items():
+                    if parts:
+                        self._files[k].write(np.concatenate(parts).tobytes())
+                        parts.clear()
+                    self._files[k].flush()
+                last_flush = now
+                if now - last_sync >= self.fsync_s or done:
+                    for fh in self._files.values():
+                        os.fsync(fh.fileno())
+                    last_sync = now
+                METRICS.observe("results.flush_ms", (time.perf_counter() - t0) * 1e3)
+            if done:
+                for fh in self._files.values():
+                    fh.close()
+                return
+
+    def stop(self, timeout: float = 5.0):
+        self._halt.set()
+        self.join(timeout)
+
+
+# ------------------------------------------------------------
+# Reader
+# ------------------------------------------------------------
+
+class ResultsReader:
+    """``np.memmap`` views over a run directory (trailing partial records are ignored)."""
+
+    def __init__(self, run_dir: str):
+        self.root = Path(run_dir)
+        meta = json.loads((self.root / "meta.json").read_text())
+        if meta.get("version") != VERSION:
+            raise ValueError(f"[ResultsLog] unsupported version {meta.get('version')}")
+        for k, dt in _FILES.items():
+            setattr(self, k, self._map(self.root / f"{k}.bin", dt))
+
+    @staticmethod
+    def _map(path: Path, dt: np.dtype) -> np.ndarray:
+        n = path.stat().st_size // dt.itemsize if path.exists() else 0
+        if n == 0:
+            return np.zeros(0, dt)
+        return np.memmap(path, dtype=dt, mode="r", shape=(n,))
+
+    def frame_range(self, t0: Optional[float] = None, t1: Optional[float] = None) -> Tuple[int, int]:
+        """[first, last) frame ids with t0 ≤ ts < t1 (seconds relative to the first frame)."""
+        if len(self.frames) == 0:
+            return 0, 0
+        ts = self.frames["ts"] - self.frames["ts"][0]
+        i0 = 0 if t0 is None else int(np.searchsorted(ts, t0, "left"))
+        i1 = len(ts) if t1 is None else int(np.searchsorted(ts, t1, "left"))
+        f = self.frames["frame"]
+        return (int(f[i0]) if i0 < len(f) else int(f[-1]) + 1), (int(f[i1]) if i1 < len(f) else int(f[-1]) + 1)
+
+    @staticmethod
+    def _slice(arr: np.ndarray, f0: int, f1: int) -> np.ndarray:
+        fr = arr["frame"]
+        return arr[np.searchsorted(fr, f0, "left"):np.searchsorted(fr, f1, "left")]
+
+    def select(self, kind: str = "tracks", t0=None, t1=None, track_id: Optional[int] = None) -> np.ndarray:
+        """Rows of ``frames`` / ``dets`` / ``tracks`` in a time range, optionally one track id."""
+        if kind not in _FILES:
+            raise ValueError(f"[ResultsLog] unknown table: {kind} (choose from {list(_FILES)})")
+        arr = self._slice(getattr(self, kind), *self.frame_range(t0, t1))
+        if track_id is not None and kind == "tracks":
+            arr = arr[arr["id"] == track_id]
+        return arr
+
+    def tracks_at(self, frame: int) -> np.ndarray:
+        """TRACK_DTYPE array of one frame (for re-rendering)."""
+        rec = self._slice(self.tracks, frame, frame + 1)
+        out = np.zeros(len(rec), TRACK_DTYPE)
+        for k in ("id", "box", "score", "vel", "flags"):
+            out[k] = rec[k]
+        return out
+
+
+# ------------------------------------------------------------
+# CLI
+# ------------------------------------------------------------
+
+def _summarize(r: ResultsReader):
+    fr = r.frames
+    if len(fr) == 0:
+        print("empty log")
+        return
+    span = float(fr["ts"][-1] - fr["ts"][0])
+    print(f"\n★★ {r.root} ★★")
+    print(f"frames      : {len(fr)}  ({span:.1f} s, {len(fr) / max(span, 1e-9):.1f} fps)")
+    for k in ("pre_ms", "det_ms", "trk_ms"):
+        v = np.asarray(fr[k], dtype=np.float64)
+        v = v[np.isfinite(v)]
+        if len(v):
+            print(f"{k:<12}: mean {v.mean():6.2f}  p50 {np.percentile(v, 50):6.2f}  "
+                  f"p95 {np.percentile(v, 95):6.2f}  max {v.max():6.2f}")
+    print(f"detections  : {len(r.dets)}  ({len(r.dets) / len(fr):.2f}/frame)")
+    ids, counts = np.unique(r.tracks["id"], return_counts=True)
+    print(f"tracks      : {len(ids)} ids, {len(r.tracks)} rows")
+    for i in np.argsort(-counts)[:5]:
+        print(f"  id {ids[i]:>6}: {counts[i]} frames")
+
+
+def _export(r: ResultsReader, what: str, out: Optional[str], t0, t1, track_id):
+    arr = r.select(what, t0, t1, track_id)
+    cols = []
+    for name in arr.dtype.names:
+        sub = arr.dtype[name].shape
+        cols += [f"{name}{i}" for i in range(sub[0])] if sub else [name]
+    flat = [np.asarray(arr[n], dtype=np.float64).reshape(len(arr), -1) for n in arr.dtype.names]
+    table = np.hstack(flat) if len(arr) else np.zeros((0, len(cols)))
+    if out and out.endswith(".jsonl"):
+        with open(out, "w", encoding="utf-8") as f:
+            for row in table.tolist():
+                f.write(json.dumps(dict(zip(cols, row))) + "\n")
+    else:
+        np.savetxt(out or sys.stdout, table, delimiter=",", header=",".join(cols), comments="", fmt="%.6g")
+    if out:
+        print(f"{len(arr)} {what} rows → {out}")
+
+
+def _render(r: ResultsReader, video: str, out: Optional[str], offset: int):
+    import cv2
+    from pipeline.overlay import OverlayRenderer
+    cap = cv2.VideoCapture(video)
+    if not cap.isOpened():
+        raise RuntimeError(f"cannot open {video}")
+    overlay, writer, idx = OverlayRenderer(), None, 0
+    while True:
+        ok, frame = cap.read()
+        if not ok:
+            break
+        overlay.render(frame, r.tracks_at(idx + offset), f"frame {idx + offset}")
+        if out:
+            if writer is None:
+                h, w = frame.shape[:2]
+                writer = cv2.VideoWriter(out, cv2.VideoWriter_fourcc(*"MJPG"),
+                                         cap.get(cv2.CAP_PROP_FPS) or 30, (w, h))
+            writer.write(frame)
+        else:
+            cv2.imshow("results", frame)
+            if cv2.waitKey(1) & 0xFF == 27:
+                break
+        idx += 1
+    if writer:
+        writer.release()
+    cv2.destroyAllWindows()
+
+
+def main():
+    import argparse
+    ap = argparse.ArgumentParser("results log tool")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    s = sub.add_parser("summarize"); s.add_argument("run")
+    e = sub.add_parser("export"); e.add_argument("run")
+    e.add_argument("--what", choices=list(_FILES), default="tracks")
+    e.add_argument("--out", help=".csv / .jsonl (기본: stdout CSV)")
+    e.add_argument("--t0", type=float, help="시작 (초, 첫 프레임 기준)")
+    e.add_argument("--t1", type=float, help="끝 (초, 첫 프레임 기준)")
+    e.add_argument("--id", type=int, help="track id 필터")
+    v = sub.add_parser("render"); v.add_argument("run")
+    v.add_argument("--video", required=True, help="같은 실행에서 녹화된 raw 영상")
+    v.add_argument("--out", help="출력 영상 (생략 시 화면 표시)")
+    v.add_argument("--offset", type=int, default=0, help="영상 첫 프레임의 frame id")
+    args = ap.parse_args()
+
+    r = ResultsReader(args.run)
+    if args.cmd == "summarize":
+        _summarize(r)
+    elif args.cmd == "export":
+        _export(r, args.what, args.out, args.t0, args.t1, args.id)
+    else:
+        _render(r, args.video, args.out, args.offset)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+# pipeline/stream_server.py – headless MJPEG/HTTP streaming (encode once, serve many)
+# -------------------------------------------------------------------------------------------
+# 모니터가 없는 장비에서 cv2.imshow 대신 주석 영상을 로컬 HTTP 로 내보낸다.
+#
+#   publish(frame)  : 참조만 저장하고 즉시 반환 (Output 스레드 block 없음)
+#   encoder thread  : 가장 최신 프레임만 JPEG 1 회 인코딩 → 모든 client 가 같은 bytes 공유
+#   client thread   : 새 JPEG 이 나올 때까지 대기 후 전송 – 느린 client 는 중간 프레임을 건너뜀
+#   client 가 0 이면 인코딩 자체를 하지 않는다
+#
+#   GET /              간단한 뷰어 페이지
+#   GET /stream.mjpg   multipart/x-mixed-replace MJPEG
+#   GET /snapshot.jpg  최신 프레임 1 장
+#
+#   pipeline.yaml
+#   -------------
+#   display: headless
+#   stream:
+#     enable: true
+#     host: 127.0.0.1
+#     port: 8080
+#     width: 640            # 전송 해상도 (0 = 원본)
+#     quality: 80           # JPEG 품질
+#
+# metrics: stream.encode_ms, stream.clients, stream.frames_sent
+# -------------------------------------------------------------------------------------------
+from __future__ import annotations
+import threading, time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+import cv2, numpy as np
+from utils.logger import get_logger
+from utils.metrics import METRICS
+
+__all__ = ["MJPEGServer"]
+
+_BOUNDARY = b"frame"
+_PAGE = b"<html><body style='margin:0;background:#000'><img src='/stream.mjpg' style='width:100%'></body></html>"
+
+
+class MJPEGServer:
+    """Latest-frame MJPEG broadcaster on a ThreadingHTTPServer."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8080, width: int = 0,
+                 quality: int = 80, **_):
+        self.log = get_logger("MJPEG")
+        self.width, self.quality = int(width or 0), int(quality)
+        self._cv = threading.Condition()
+        self._frame: Optional[np.ndarray] = None      # 인코딩 대기 중인 최신 프레임
+        self._jpeg: Optional[bytes] = None
+        self._seq = 0
+        self.clients = 0
+        self._httpd = ThreadingHTTPServer((host, int(port)), self._handler())
+        self._httpd.daemon_threads = True
+        self.address = self._httpd.server_address
+
+    # --------------------------------------------------------
+    def start(self):
+        threading.Thread(target=self._httpd.serve_forever, daemon=True, name="MJPEGHttp").start()
+        threading.Thread(target=self._encode_loop, daemon=True, name="MJPEGEncode").start()
+        self.log.info("Streaming on http://%s:%d/", *self.address[:2])
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def publish(self, frame: np.ndarray):
+        """Hand over the newest annotated frame (dropped immediately when nobody is watching)."""
+        if self.clients == 0:
+            return
+        with self._cv:
+            self._frame = frame
+            self._cv.notify_all()
+
+    # --------------------------------------------------------
+    def _encode_loop(self):
+        while True:
+            with self._cv:
+                while self._frame is None:
+                    self._cv.wait()
+                frame, self._frame = self._frame, None
+            t0 = time.perf_counter()
+            if self.width and frame.shape[1] != self.width:
+                h = int(round(frame.shape[0] * self.width / frame.shape[1]))
+                frame = cv2.resize(frame, (self.width, h), interpolation=cv2.INTER_AREA)
+            ok, buf = cv2.imencode(".jpg", frame, (cv2.IMWRITE_JPEG_QUALITY, self.quality))
+            METRICS.observe("stream.encode_ms", (time.perf_counter() - t0) * 1e3)
+            if not ok:
+                continue
+            with self._cv:
+                self._jpeg = buf.tobytes()
+                self._seq += 1
+                self._cv.notify_all()
+
+    def _next_jpeg(self, last_seq: int, timeout: float = 5.0):
+        """Block until a JPEG newer than ``last_seq`` exists → (seq, bytes) or (last_seq, None)."""
+        with self._cv:
+            self._cv.wait_for(lambda: self._seq > last_seq, timeout)
+            if self._seq > last_seq:
+                return self._seq, self._jpeg
+            return last_seq, None
+
+    def _attach(self, n: int):
+        with self._cv:
+            self.clients += n
+        METRICS.gauge("stream.clients", self.clients)
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, fmt, *args):          # 요청마다 stderr 출력하지 않음
+                server.log.debug(fmt, *args)
+
+            def _send(self, ctype: str, body: bytes):
+                self.send_response(200)
+                self.send_header("Content-Type", ctype)
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("Cache-Control", "no-cache")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                if self.path in ("/", "/index.html"):
+                    return self._send("text/html", _PAGE)
+                if self.path not in ("/stream.mjpg", "/snapshot.jpg"):
+                    return self.send_error(404)
+                server._attach(1)
+                try:
+                    if self.path == "/snapshot.jpg":
+                        _, jpeg = server._next_jpeg(server._seq)      # 인코딩 재개 후 새 프레임
+                        return self._send("image/jpeg", jpeg) if jpeg else self.send_error(503)
+                    self.send_response(200)
+                    self.send_header("Content-Type",
+                                     "multipart/x-mixed-replace; boundary=" + _BOUNDARY.decode())
+                    self.send_header("Cache-Control", "no-cache")
+                    self.end_headers()
+                    seq = 0
+                    while True:
+                        seq, jpeg = server._next_jpeg(seq)
+                        if jpeg is None:
+                            continue
+                        self.wfile.write(b"--" + _BOUNDARY + b"\r\nContent-Type: image/jpeg\r\n"
+                                         b"Content-Length: " + str(len(jpeg)).encode() + b"\r\n\r\n")
+                        self.wfile.write(jpeg)
+                        self.wfile.write(b"\r\n")
+                        METRICS.inc("stream.frames_sent")
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+                finally:
+                    server._attach(-1)
+
+        return Handler
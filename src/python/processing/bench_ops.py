@@ -0,0 +1,185 @@
+# bench_ops.py ── enhancers operator / preset micro-benchmark with regression baselines
+'''
+python bench_ops.py                                   # REGISTRY 전 operator + PRESETS, 합성 프레임
+python bench_ops.py --video ../../../stores/day1      # frame store | 영상 | 카메라 프레임으로
+python bench_ops.py --only GammaContrast,Night --res 640x480,1920x1080
+python bench_ops.py --save ops_base.json              # baseline 저장
+python bench_ops.py --compare ops_base.json --tolerance 0.15   # 회귀 시 exit 1
+
+* 대상     : enhancers.REGISTRY (기본 파라미터) → "op:<이름>",  enhancers.PRESETS → "preset:<이름>"
+             새 operator / preset 은 등록만 하면 자동으로 포함된다.
+* 프레임   : --frames 장을 미리 읽어 해상도별로 resize 해 두고 순환 → 측정에 캡처·디코딩 대기 없음
+* 타이밍   : 대상·해상도마다 새 인스턴스 (ClutterRemoval 등 상태 공유 방지), warm-up 후 호출 단위
+             perf_counter → min / median / p95 (ms)
+* 할당     : 별도 pass 에서 tracemalloc (numpy / cv2 출력 버퍼 포함) → 호출당 peak KB
+             (tracemalloc 이 느리게 만들므로 타이밍 pass 와 분리)
+'''
+import argparse, json, platform, sys, time, tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+import cv2, numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from processing.enhancers import PRESETS, REGISTRY
+from capture.frame_store import is_store, StoreCapture
+
+DEFAULT_RES = "320x240,640x480,1280x720"
+
+
+def open_source(src, w, h, fourcc=None):
+    """카메라 번호 | 영상 파일 | frame store → cv2.VideoCapture 호환 객체 (profile_ops / eval_ops 공용)."""
+    if is_store(src):                  # frame store → 매 실행 같은 프레임, 카메라 대기·디코딩 없음
+        return StoreCapture(src)
+    cap = cv2.VideoCapture(src, cv2.CAP_V4L2 if isinstance(src, int) else 0)
+    if not cap.isOpened():
+        raise RuntimeError(f"cannot open {src}")
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH,  w)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, h)
+    if fourcc:
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc))
+    return cap
+
+
+def parse_source(video: str):
+    try:
+        return int(video)
+    except ValueError:
+        return str(Path(video).expanduser())
+
+
+def synthetic_frames(n: int, w: int = 1280, h: int = 720, seed: int = 0) -> List[np.ndarray]:
+    """Deterministic test frames: smooth background + shapes + sensor noise, slight motion."""
+    rng = np.random.default_rng(seed)
+    base = cv2.resize(rng.integers(40, 200, (h // 16, w // 16, 3), dtype=np.uint8), (w, h),
+                      interpolation=cv2.INTER_CUBIC)
+    frames = []
+    for i in range(n):
+        f = base.copy()
+        for k in range(6):
+            x, y = (97 * k + 13 * i) % w, (53 * k + 5 * i) % h
+            cv2.rectangle(f, (x, y), (x + w // 12, y + h // 10), (30 * k, 255 - 30 * k, 128), -1)
+        noise = rng.normal(0, 6, f.shape).astype(np.int16)
+        frames.append(np.clip(f.astype(np.int16) + noise, 0, 255).astype(np.uint8))
+    return frames
+
+
+def load_frames(video, n: int) -> List[np.ndarray]:
+    cap = open_source(parse_source(video), 1280, 720)
+    frames = []
+    while len(frames) < n:
+        ok, f = cap.read()
+        if not ok:
+            break
+        frames.append(f)
+    cap.release()
+    if not frames:
+        raise RuntimeError(f"no frames from {video}")
+    return frames
+
+
+def targets(only: str = "") -> Dict[str, Callable]:
+    """name → factory; REGISTRY 는 기본 파라미터, PRESETS 는 이미 factory."""
+    out = {f"op:{k}": cls for k, cls in REGISTRY.items()}
+    out.update({f"preset:{k}": fn for k, fn in PRESETS.items()})
+    if only:
+        keep = set(only.split(","))
+        out = {k: v for k, v in out.items() if k.split(":", 1)[1] in keep or k in keep}
+    return out
+
+
+def bench(factory: Callable, frames: List[np.ndarray], iters: int, warmup: int,
+          alloc_iters: int) -> Dict[str, float]:
+    op = factory()
+    n = len(frames)
+    for i in range(warmup):
+        op(frames[i % n])
+    ts = np.empty(iters)
+    for i in range(iters):
+        f = frames[i % n]
+        t0 = time.perf_counter()
+        op(f)
+        ts[i] = time.perf_counter() - t0
+    peak = 0
+    if alloc_iters:
+        tracemalloc.start()
+        for i in range(alloc_iters):
+            f = frames[i % n]
+            base = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            op(f)
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - base)
+        tracemalloc.stop()
+    ts *= 1e3
+    return {"min": float(ts.min()), "median": float(np.median(ts)), "p95": float(np.percentile(ts, 95)),
+            "alloc_kb": peak / 1024}
+
+
+def compare(res: Dict[str, dict], base: Dict[str, dict], tol: float, slack_ms: float,
+            slack_kb: float) -> List[Tuple[str, str]]:
+    """(key, 지표) list of regressions: median ms 또는 alloc KB 가 baseline × (1 + tol) + slack 초과."""
+    bad = []
+    for k, r in res.items():
+        b = base.get(k)
+        if not b:
+            continue
+        if r["median"] > b["median"] * (1 + tol) + slack_ms:
+            bad.append((k, "median"))
+        if r["alloc_kb"] > b["alloc_kb"] * (1 + tol) + slack_kb:
+            bad.append((k, "alloc"))
+    return bad
+
+
+def main():
+    ap = argparse.ArgumentParser("enhancers operator / preset benchmark")
+    ap.add_argument("--video", default=None,
+                    help="카메라 번호 | 영상 파일 | frame store 디렉터리 (생략 시 합성 프레임)")
+    ap.add_argument("--frames", type=int, default=16, help="순환할 입력 프레임 수")
+    ap.add_argument("--res", default=DEFAULT_RES, help="쉼표로 구분한 WxH 목록")
+    ap.add_argument("--only", default="", help="쉼표로 구분한 operator / preset 이름")
+    ap.add_argument("--iters", type=int, default=50)
+    ap.add_argument("--warmup", type=int, default=5)
+    ap.add_argument("--alloc-iters", type=int, default=5, help="tracemalloc pass 호출 수 (0 = 생략)")
+    ap.add_argument("--save", help="결과를 baseline JSON 으로 저장")
+    ap.add_argument("--compare", help="baseline JSON 과 비교")
+    ap.add_argument("--tolerance", type=float, default=0.2, help="허용 증가율 (0.2 = +20 %%)")
+    ap.add_argument("--slack-ms", type=float, default=0.2, help="작은 항목 노이즈 허용치 (ms)")
+    ap.add_argument("--slack-kb", type=float, default=64.0, help="할당 노이즈 허용치 (KB)")
+    args = ap.parse_args()
+
+    src = load_frames(args.video, args.frames) if args.video is not None else synthetic_frames(args.frames)
+    sizes = [tuple(map(int, r.split("x"))) for r in args.res.split(",")]
+    todo = targets(args.only)
+    if not todo:
+        sys.exit(f"no operator / preset matches --only {args.only}")
+
+    base = json.loads(Path(args.compare).read_text())["results"] if args.compare else {}
+    res: Dict[str, dict] = {}
+    for w, h in sizes:
+        frames = [cv2.resize(f, (w, h), interpolation=cv2.INTER_AREA) for f in src]
+        print(f"\n★★ {w}×{h}, {len(frames)} frames, {args.iters} iters (+{args.warmup} warm-up) ★★")
+        print(f"{'':<28} {'min':>8} {'median':>8} {'p95':>8} {'alloc':>10}")
+        for name, factory in todo.items():
+            key = f"{name}@{w}x{h}"
+            r = res[key] = bench(factory, frames, args.iters, args.warmup, args.alloc_iters)
+            line = f"{name:<28} {r['min']:8.2f} {r['median']:8.2f} {r['p95']:8.2f} {r['alloc_kb']:7.0f} KB"
+            if key in base:
+                b = base[key]["median"]
+                line += f"   base {b:7.2f} ms ({(r['median'] - b) / max(b, 1e-9) * 100:+6.1f} %)"
+            print(line)
+
+    regressions = compare(res, base, args.tolerance, args.slack_ms, args.slack_kb)
+    if args.save:
+        meta = {"source": args.video or "synthetic", "frames": len(src), "iters": args.iters,
+                "python": platform.python_version(), "opencv": cv2.__version__, "machine": platform.machine()}
+        Path(args.save).write_text(json.dumps({"meta": meta, "results": res}, indent=2))
+        print(f"\nbaseline → {args.save}")
+    if regressions:
+        print(f"\n{len(regressions)} regression(s):")
+        for k, what in regressions:
+            print(f"  {k:<40} {what}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
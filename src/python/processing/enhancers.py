@@ -254,25 +254,27 @@ class Compose(Preprocessor):
 #  PRESETS helper                                                             #
 ###############################################################################
 
-PRESETS = {
-    "Normal": Compose([
+# preset 이름 → factory. import 시점에는 아무것도 만들지 않고 (MOG2 등),
+# get_preset() 호출마다 새 인스턴스 → 상태 있는 블록(ClutterRemoval)을 여러 곳에서 공유하지 않는다.
+PRESETS: Dict[str, Callable[[], Preprocessor]] = {
+    "Normal": lambda: Compose([
         GammaContrast(gamma=0.8),
     ]),
-    "Night": Compose([
+    "Night": lambda: Compose([
         GammaContrast(gamma=0.65),
         GaussianDenoise(ksize=3),
         UnsharpMask(5, 1.0),
     ]),
-    "Fog": Compose([
+    "Fog": lambda: Compose([
         GammaContrast(gamma=0.75),
         UnsharpMask(5, 1.8),
     ]),
-    "Motion": Compose([
+    "Motion": lambda: Compose([
         GammaContrast(gamma=0.80),
         LaplacianDeblur(alpha=1.3, ks=3),
         UnsharpMask(5, 0.7),
     ]),
-    "IR": Compose([
+    "IR": lambda: Compose([
         GammaContrast(gamma=0.80),
         ClutterRemoval(),
         UnsharpMask(5, 1.0),
@@ -286,7 +288,7 @@ PRESETS = {
 def get_preset(name: str) -> Preprocessor:
     if name not in PRESETS:
         raise ValueError(f"[enhancers] unknown preset: {name}")
-    return PRESETS[name]
+    return PRESETS[name]()
 
 
 def build_preprocessing(cfg: Dict[str, dict]) -> Preprocessor:
@@ -301,6 +303,8 @@ def build_preprocessing(cfg: Dict[str, dict]) -> Preprocessor:
       edge_enhance:
         ksize: 5
         amount: 1.2
+      LightCLAHE:                   # ← REGISTRY 클래스 이름도 그대로 사용 가능 (sweep_ops 출력)
+        clip_limit: 1.5
     """
     # 1️⃣ preset이 지정돼 있으면 그걸로 끝
     if "preset" in cfg:
@@ -314,7 +318,10 @@ def build_preprocessing(cfg: Dict[str, dict]) -> Preprocessor:
         "deblur"         : "LaplacianDeblur",
         "clutter_removal": "ClutterRemoval",
     }
-    steps = [REGISTRY[mapping[k]](**v) for k, v in cfg.items()]
+    unknown = [k for k in cfg if mapping.get(k, k) not in REGISTRY]
+    if unknown:
+        raise ValueError(f"[enhancers] unknown preprocessing block(s): {unknown}")
+    steps = [REGISTRY[mapping.get(k, k)](**(v or {})) for k, v in cfg.items()]
     return Compose(steps)
 
 ###############################################################################
@@ -7,11 +7,14 @@ from pathlib import Path
 import argparse, cv2, numpy as np
 from collections import defaultdict
 
-# 우리 모듈
-from enhancers import (
+# 우리 모듈 (스크립트 / python -m processing.eval_ops 양쪽에서 같은 경로로)
+import sys
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from processing.enhancers import (
     GammaContrast, UnsharpMask, GaussianDenoise,
     LaplacianDeblur, ClutterRemoval
 )
+from processing.bench_ops import open_source       # 카메라 | 영상 | frame store 공용
 
 ###############################################################################
 # -- 지표 함수들                                                              #
@@ -60,27 +63,14 @@ OPS = [
 • CLUTTER   → 0‥1 (제거 비율)  
 """
 
-###############################################################################
-# -- 소스 열기                                                                #
-###############################################################################
-
-def open_source(src, w, h, fourcc):
-    cam = cv2.VideoCapture(src, cv2.CAP_V4L2 if isinstance(src, int) else 0)
-    if not cam.isOpened():
-        raise RuntimeError(f"cannot open {src}")
-    cam.set(cv2.CAP_PROP_FRAME_WIDTH,  w)
-    cam.set(cv2.CAP_PROP_FRAME_HEIGHT, h)
-    if fourcc:
-        cam.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc))
-    return cam
-
 ###############################################################################
 # -- 메인                                                                     #
 ###############################################################################
 
 def main():
     ap = argparse.ArgumentParser("quality gain evaluator")
-    ap.add_argument("--video", default="0")
+    ap.add_argument("--video", default="0",
+                    help="카메라 번호 | 영상 파일 | frame store 디렉터리 (python -m capture.frame_store record)")
     ap.add_argument("--width",  type=int, default=640)
     ap.add_argument("--height", type=int, default=480)
     ap.add_argument("--fourcc", default=None)
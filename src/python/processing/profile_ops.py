@@ -1,11 +1,14 @@
 # profile_ops.py  ―  원본 + 5개 전처리 블록 개별 타이밍
 import time, collections, argparse, cv2, numpy as np
 from pathlib import Path
-from enhancers import (
+import sys
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from processing.enhancers import (
     LightCLAHE, CLAHEContrast, 
     GammaContrast, UnsharpMask, GaussianDenoise,
     LaplacianDeblur, ClutterRemoval
 )
+from processing.bench_ops import open_source       # 카메라 | 영상 | frame store 공용
 '''
 original
 OPS = [
@@ -23,19 +26,11 @@ OPS = [
     ("DENOISE",   CLAHEContrast()),
 ]
 
-def grab_source(src, w, h, fourcc):
-    cam = cv2.VideoCapture(src, cv2.CAP_V4L2 if isinstance(src, int) else 0)
-    if not cam.isOpened():
-        raise RuntimeError(f"cannot open {src}")
-    cam.set(cv2.CAP_PROP_FRAME_WIDTH,  w)
-    cam.set(cv2.CAP_PROP_FRAME_HEIGHT, h)
-    if fourcc:
-        cam.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc))
-    return cam
 
 def main():
     ap = argparse.ArgumentParser("measure op latency")
-    ap.add_argument("--video", default="0")
+    ap.add_argument("--video", default="0",
+                    help="카메라 번호 | 영상 파일 | frame store 디렉터리 (python -m capture.frame_store record)")
     ap.add_argument("--width", type=int, default=640)
     ap.add_argument("--height", type=int, default=480)
     ap.add_argument("--fourcc", default=None)
@@ -46,7 +41,7 @@ def main():
     try:  src = int(args.video)
     except ValueError: src = str(Path(args.video).expanduser())
 
-    cap   = grab_source(src, args.width, args.height, args.fourcc)
+    cap   = open_source(src, args.width, args.height, args.fourcc)
     stats = collections.Counter()
     total = 0
 
@@ -3,55 +3,50 @@ import cv2, time, argparse, collections, numpy as np
 from pathlib import Path
 
 # 우리 모듈
-from enhancers import (
+import sys
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from processing.enhancers import (
     GammaContrast, UnsharpMask, GaussianDenoise,
     LaplacianDeblur, ClutterRemoval, Compose
 )
+from processing.bench_ops import open_source       # 카메라 | 영상 | frame store 공용
 
 # ──────────────────────────────────────────────────────────────
-#  프리셋 정의 (A~F)  – 수정해도 OK
+#  프리셋 정의 (A~F)  – 수정해도 OK, 측정마다 factory 로 새로 생성
 # ──────────────────────────────────────────────────────────────
 PRESETS = {
-    "A_day": Compose([
+    "A_day": lambda: Compose([
         GammaContrast(),
         GaussianDenoise(),
         LaplacianDeblur(),
         UnsharpMask(),
         ClutterRemoval(),
     ]),
-    "B_night": Compose([
+    "B_night": lambda: Compose([
         GammaContrast(gamma=0.65),
         GaussianDenoise(ksize=3),
         UnsharpMask(5, 1.0),
     ]),
-    "C_fog": Compose([
+    "C_fog": lambda: Compose([
         GammaContrast(gamma=0.75),
         UnsharpMask(5, 1.8),
     ]),
-    "D_motion": Compose([
+    "D_motion": lambda: Compose([
         GammaContrast(gamma=0.80),
         LaplacianDeblur(alpha=1.3, ks=3),
         UnsharpMask(5, 0.7),
     ]),
-    "E_ir": Compose([
+    "E_ir": lambda: Compose([
         GammaContrast(gamma=0.80),
         ClutterRemoval(),
         UnsharpMask(5, 1.0),
     ]),
-    "F_ultra": Compose([
+    "F_ultra": lambda: Compose([
         GammaContrast(gamma=0.8),
     ]),
 }
 
 # ──────────────────────────────────────────────────────────────
-def open_source(src, w, h, fourcc):
-    cap = cv2.VideoCapture(src, cv2.CAP_V4L2 if isinstance(src, int) else 0)
-    if not cap.isOpened(): raise RuntimeError(f"cannot open {src}")
-    cap.set(cv2.CAP_PROP_FRAME_WIDTH,  w)
-    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, h)
-    if fourcc:
-        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc))
-    return cap
 
 def run_bench(preset, cap, num_frames):
     total = 0.0
@@ -68,7 +63,8 @@ def run_bench(preset, cap, num_frames):
 # ──────────────────────────────────────────────────────────────
 def main():
     ap = argparse.ArgumentParser("preset latency profiler")
-    ap.add_argument("--video", default="0")
+    ap.add_argument("--video", default="0",
+                    help="카메라 번호 | 영상 파일 | frame store 디렉터리 (python -m capture.frame_store record)")
     ap.add_argument("--width", type=int, default=640)
     ap.add_argument("--height", type=int, default=480)
     ap.add_argument("--fourcc", default=None)
@@ -82,7 +78,7 @@ def main():
     results = {}
     for name, preset in PRESETS.items():
         cap = open_source(src, args.width, args.height, args.fourcc)
-        ms   = run_bench(preset, cap, args.frames)
+        ms   = run_bench(preset(), cap, args.frames)
         cap.release()
         results[name] = ms
 
@@ -0,0 +1,164 @@
+# sweep_ops.py ── enhancers parameter grid sweep → quality vs latency Pareto front
+'''
+python sweep_ops.py                                        # 내장 grid, 합성 프레임
+python sweep_ops.py --video ../../../stores/day1 --grid night_grid.yaml --workers 4
+python sweep_ops.py --objectives contrast,sharpness --out pareto.yaml
+
+grid (yaml) – chain 이름 → 순서 있는 operator → 파라미터 (리스트 = 후보, 스칼라 = 고정)
+-----------------------------------------------------------------------------------
+night:
+  GammaContrast: {gamma: [0.6, 0.7, 0.8]}
+  GaussianDenoise: {ksize: [3, 5]}
+  UnsharpMask: {ksize: 5, amount: [0.5, 1.0, 1.5]}
+clutter:
+  ClutterRemoval: {history: [20, 50, 100]}
+
+* 품질 지표 : eval_ops 와 동일 (원본 대비, 프레임 평균)
+    contrast  RMS contrast 증가율      sharpness Laplacian variance 증가율
+    noise     노이즈 추정치 감소율      clutter   제거된 픽셀 비율
+* 지연      : 설정별 호출 median (ms).  worker 마다 cv2.setNumThreads(1) → 병렬 실행 중에도
+              설정 간 상대 비교가 공정하다 (절대값은 bench_ops 로 다시 확인).
+* 상태 있는 블록 (ClutterRemoval) 을 위해 설정마다 새 인스턴스, 앞 --warmup 프레임은 지표에서 제외.
+* 프레임은 부모 프로세스가 한 번만 읽어 worker 에 넘긴다 → 카메라여도 모든 설정이 같은 프레임으로 평가.
+* 결과      : --objectives (높을수록 좋음) + 지연 (낮을수록 좋음) 에서 지배되지 않는 설정만
+              ``preprocessing:`` 블록으로 출력 → pipeline.yaml 에 그대로 붙여 넣기
+'''
+import argparse, itertools, os, sys, time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import cv2, numpy as np, yaml
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from processing.enhancers import REGISTRY, Compose
+from processing.bench_ops import load_frames, synthetic_frames
+from processing.eval_ops import rms_contrast, lap_var, noise_est, clutter_removed
+
+OBJECTIVES = ("contrast", "sharpness", "noise", "clutter")
+
+DEFAULT_GRID = {
+    "contrast": {"GammaContrast": {"gamma": [0.6, 0.7, 0.8, 0.9]}},
+    "sharpen": {"GammaContrast": {"gamma": [0.7, 0.8]},
+                "UnsharpMask": {"ksize": [3, 5], "amount": [0.5, 1.0, 1.5]}},
+    "night": {"GammaContrast": {"gamma": [0.65, 0.8]},
+              "GaussianDenoise": {"ksize": [3, 5]},
+              "UnsharpMask": {"ksize": 5, "amount": [0.7, 1.0]}},
+    "clutter": {"GammaContrast": {"gamma": 0.8},
+                "ClutterRemoval": {"history": [20, 50, 100], "var_threshold": [16, 25]}},
+}
+
+Config = Tuple[str, List[Tuple[str, dict]]]          # (chain 이름, [(operator, params), ...])
+
+
+def expand(grid: Dict[str, dict]) -> List[Config]:
+    """Cartesian product of every list-valued parameter, per chain, in declaration order."""
+    out = []
+    for chain, ops in grid.items():
+        unknown = [op for op in ops if op not in REGISTRY]
+        if unknown:
+            raise ValueError(f"[sweep] unknown operator(s) {unknown} in '{chain}' (choose from {list(REGISTRY)})")
+        axes = [(op, k, v if isinstance(v, list) else [v]) for op, params in ops.items()
+                for k, v in (params or {}).items()]
+        for combo in itertools.product(*(vals for _, _, vals in axes)):
+            steps = {op: {} for op in ops}
+            for (op, k, _), v in zip(axes, combo):
+                steps[op][k] = v
+            out.append((chain, list(steps.items())))
+    return out
+
+
+# ------------------------------------------------------------
+# worker
+# ------------------------------------------------------------
+_FRAMES: List[np.ndarray] = []
+
+
+def _init_worker(frames: List[np.ndarray]):
+    global _FRAMES
+    cv2.setNumThreads(1)
+    _FRAMES = frames
+
+
+def evaluate(cfg: Config, warmup: int) -> Dict[str, float]:
+    op = Compose([REGISTRY[name](**params) for name, params in cfg[1]])
+    gains = dict.fromkeys(OBJECTIVES, 0.0)
+    ts, n = [], 0
+    for i, f in enumerate(_FRAMES):
+        t0 = time.perf_counter()
+        p = op(f)
+        dt = time.perf_counter() - t0
+        if i < warmup:
+            continue
+        ts.append(dt)
+        gains["contrast"] += rms_contrast(p) / max(rms_contrast(f), 1e-9) - 1
+        gains["sharpness"] += lap_var(p) / max(lap_var(f), 1e-9) - 1
+        gains["noise"] += 1 - noise_est(p) / max(noise_est(f), 1e-9)
+        gains["clutter"] += clutter_removed(f, p)
+        n += 1
+    res = {k: v / max(n, 1) for k, v in gains.items()}
+    res["latency_ms"] = float(np.median(ts)) * 1e3 if ts else float("nan")
+    return res
+
+
+# ------------------------------------------------------------
+def pareto(results: List[Dict[str, float]], objectives: List[str]) -> List[int]:
+    """Indices not dominated on (objectives ↑, latency ↓)."""
+    keys = np.array([[r[k] for k in objectives] + [-r["latency_ms"]] for r in results])
+    front = []
+    for i, a in enumerate(keys):
+        dominated = np.any(np.all(keys >= a, axis=1) & np.any(keys > a, axis=1))
+        if not dominated:
+            front.append(i)
+    return sorted(front, key=lambda i: results[i]["latency_ms"])
+
+
+def to_yaml(cfg: Config, r: Dict[str, float]) -> str:
+    head = (f"# {cfg[0]}  {r['latency_ms']:.2f} ms | contrast {r['contrast']*100:+.1f} % | "
+            f"sharpness {r['sharpness']*100:+.1f} % | noise ↓ {r['noise']*100:+.1f} % | "
+            f"clutter {r['clutter']*100:.1f} %\n")
+    body = {"preprocessing": {name: {k: (v.item() if hasattr(v, "item") else v) for k, v in params.items()}
+                              for name, params in cfg[1]}}
+    return head + yaml.safe_dump(body, sort_keys=False, allow_unicode=True)
+
+
+def main():
+    ap = argparse.ArgumentParser("enhancers quality / latency Pareto sweep")
+    ap.add_argument("--grid", help="grid yaml (생략 시 내장 DEFAULT_GRID)")
+    ap.add_argument("--video", default=None,
+                    help="카메라 번호 | 영상 파일 | frame store 디렉터리 (생략 시 합성 프레임)")
+    ap.add_argument("--frames", type=int, default=40)
+    ap.add_argument("--warmup", type=int, default=10, help="지표에서 제외할 앞 프레임 수 (MOG2 history 등)")
+    ap.add_argument("--size", default="640x480")
+    ap.add_argument("--objectives", default=",".join(OBJECTIVES), help=f"쉼표 구분: {', '.join(OBJECTIVES)}")
+    ap.add_argument("--workers", type=int, default=max(1, (os.cpu_count() or 2) // 2))
+    ap.add_argument("--out", help="Pareto preprocessing 블록을 저장할 yaml")
+    args = ap.parse_args()
+
+    objectives = args.objectives.split(",")
+    bad = [o for o in objectives if o not in OBJECTIVES]
+    if bad:
+        sys.exit(f"unknown objective(s) {bad} (choose from {list(OBJECTIVES)})")
+    grid = yaml.safe_load(Path(args.grid).read_text(encoding="utf-8")) if args.grid else DEFAULT_GRID
+    configs = expand(grid)
+    size = tuple(map(int, args.size.split("x")))
+    src = load_frames(args.video, args.frames) if args.video is not None else synthetic_frames(args.frames)
+    frames = [cv2.resize(f, size, interpolation=cv2.INTER_AREA) for f in src]
+
+    t0 = time.perf_counter()
+    with ProcessPoolExecutor(args.workers, initializer=_init_worker, initargs=(frames,)) as ex:
+        results = list(ex.map(evaluate, configs, itertools.repeat(args.warmup)))
+    print(f"\n★★ {len(configs)} configs × {len(frames)} frames ({size[0]}×{size[1]}), "
+          f"{args.workers} workers, {time.perf_counter() - t0:.1f} s ★★")
+
+    front = pareto(results, objectives)
+    print(f"Pareto front ({' ↑, '.join(objectives)} ↑, latency ↓): {len(front)} / {len(configs)}\n")
+    blocks = [to_yaml(configs[i], results[i]) for i in front]
+    print("\n".join(blocks))
+    if args.out:
+        Path(args.out).write_text("---\n".join(blocks), encoding="utf-8")
+        print(f"→ {args.out}")
+
+
+if __name__ == "__main__":
+    main()
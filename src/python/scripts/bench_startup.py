@@ -0,0 +1,120 @@
+# bench_startup.py ── import / init time regression benchmark
+'''
+python -m scripts.bench_startup                           # 각 항목 5 회 (새 인터프리터), median
+python -m scripts.bench_startup --save startup_base.json  # baseline 저장
+python -m scripts.bench_startup --compare startup_base.json --tolerance 0.2   # 회귀 시 exit 1
+
+* import   : 새 인터프리터에서 모듈 import 비용 (cv2 / numpy 는 기준선 참고용)
+* init     : 새 인터프리터에서 config 기반 구성 요소 생성 비용
+             (preprocessing, tracker, detector(mock), Pipeline, Output(headless))
+* 카메라 협상·실제 모델 로드는 하드웨어 의존이라 제외 → run_pipeline 의 startup.* 로그 참고
+'''
+import argparse, json, statistics, subprocess, sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]          # src/python
+CFG = ROOT.parents[1] / "config" / "pipeline.yaml"
+
+IMPORTS = [
+    "numpy", "cv2",
+    "processing.enhancers", "detection.factory", "tracking.factory",
+    "tracking.sort_tracker", "tracking.bytetrack_tracker",
+    "pipeline.pipeline", "pipeline.output",
+]
+
+_IMPORT_PROBE = """
+import json, time, importlib
+t0 = time.perf_counter()
+importlib.import_module({mod!r})
+print(json.dumps({{"ms": (time.perf_counter() - t0) * 1e3}}))
+"""
+
+# 순서대로 실행, 각 단계 소요 시간을 출력 (앞 단계 import 비용은 해당 단계에 포함)
+_INIT_PROBE = """
+import json, queue, time, yaml
+t = {{}}
+def step(name, fn):
+    t0 = time.perf_counter(); r = fn(); t[name] = (time.perf_counter() - t0) * 1e3; return r
+cfg = yaml.safe_load(open({cfg!r}, encoding="utf-8"))
+cfg["detector"] = {{"backend": "mock", "fallback": [], "warmup": 1}}
+cfg["display"] = "headless"
+for k in ("stream", "record", "results_log"):
+    (cfg.get(k) or {{}}).update(enable=False)
+def pre():
+    from processing.enhancers import build_preprocessing
+    return build_preprocessing(cfg.get("preprocessing") or {{"preset": "Normal"}})
+def trk():
+    from tracking.factory import build_tracker
+    return build_tracker(cfg)
+def det():
+    from detection.factory import build_detector
+    return build_detector(cfg)
+step("preprocessing", pre)
+tr = step("tracker", trk)
+d = step("detector", det)
+def pipe():
+    from pipeline.pipeline import Pipeline
+    return Pipeline(queue.Queue(), queue.Queue(), cfg, det=d, trk=tr)
+def out():
+    from pipeline.output import Output
+    return Output(queue.Queue(), cfg=cfg)
+step("pipeline", pipe)
+step("output", out)
+print(json.dumps(t))
+"""
+
+
+def _probe(code: str):
+    r = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True)
+    if r.returncode != 0:
+        return None
+    return json.loads(r.stdout.strip().splitlines()[-1])
+
+
+def measure(repeat: int, cfg: Path):
+    res = {}
+    for mod in IMPORTS:
+        runs = [_probe(_IMPORT_PROBE.format(mod=mod)) for _ in range(repeat)]
+        runs = [r["ms"] for r in runs if r]
+        if runs:
+            res[f"import.{mod}"] = statistics.median(runs)
+    runs = [r for r in (_probe(_INIT_PROBE.format(cfg=str(cfg))) for _ in range(repeat)) if r]
+    for k in (runs[0] if runs else {}):
+        res[f"init.{k}"] = statistics.median(r[k] for r in runs)
+    return res
+
+
+def main():
+    ap = argparse.ArgumentParser("startup import / init benchmark")
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--cfg", default=str(CFG))
+    ap.add_argument("--save", help="결과를 baseline JSON 으로 저장")
+    ap.add_argument("--compare", help="baseline JSON 과 비교")
+    ap.add_argument("--tolerance", type=float, default=0.2, help="허용 증가율 (0.2 = +20 %%)")
+    ap.add_argument("--slack-ms", type=float, default=5.0, help="작은 항목 노이즈 허용치 (ms)")
+    args = ap.parse_args()
+
+    res = measure(args.repeat, Path(args.cfg))
+    base = json.loads(Path(args.compare).read_text()) if args.compare else {}
+    regressions = []
+    print(f"\n★★ startup (median of {args.repeat}, fresh interpreter each) ★★")
+    for k, ms in res.items():
+        line = f"{k:<36}: {ms:8.1f} ms"
+        if k in base:
+            b = base[k]
+            line += f"   base {b:8.1f} ms  ({(ms - b) / max(b, 1e-9) * 100:+6.1f} %)"
+            if ms > b * (1 + args.tolerance) + args.slack_ms:
+                regressions.append(k)
+                line += "  ← REGRESSION"
+        print(line)
+
+    if args.save:
+        Path(args.save).write_text(json.dumps(res, indent=2))
+        print(f"\nbaseline → {args.save}")
+    if regressions:
+        print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
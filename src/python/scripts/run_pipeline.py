@@ -2,11 +2,19 @@
 # python scripts/run_pipeline.py --cfg config/pipeline.yaml --source 0
 import argparse, queue, yaml, signal, sys, os, threading, time
 sys.path.append(os.pardir)
+from utils.startup import STARTUP, Loader          # 기동 시간 기준점 – 다른 모듈보다 먼저
 from pathlib import Path
 from capture.camera_capture import CameraCapture
+from capture.frame_store import ReplayCapture, is_store
+from capture.mjpeg_capture import MJPEGCapture
 from pipeline.pipeline import Pipeline
+from detection.factory import DetectorLoader, model_for
+from detection.pool import DetectorPool
+from tracking.factory import build_tracker
 from pipeline.output import Output
 from utils.logger import get_logger
+from utils.trace import TRACER
+from utils.profiler import PROFILER
 from typing import Union
 
 
@@ -17,48 +25,129 @@ def load_cfg(path: Union[str, os.PathLike]):
         return yaml.safe_load(f)
 
 
+def _drain(cap_q: queue.Queue, out_q: queue.Queue, out: Output, idle_s: float = 0.5):
+    """Wait until both queues are empty and Output has been idle for ``idle_s`` (in-flight frame 완료)."""
+    last, t_last = -1, time.perf_counter()
+    while True:
+        time.sleep(0.05)
+        if out.frames != last or not (cap_q.empty() and out_q.empty()):
+            last, t_last = out.frames, time.perf_counter()
+        elif time.perf_counter() - t_last >= idle_s:
+            return
+
+
 def main():
     parser = argparse.ArgumentParser(description="Zybo EO real‑time pipeline runner")
     parser.add_argument("--cfg", default="config/pipeline.yaml", help="YAML config file")
-    parser.add_argument("--source", default="0", help="Camera ID (int) or video file path")
+    parser.add_argument("--source", default="0", help="Camera ID (int), video file path or frame store dir")
+    parser.add_argument("--replay-fast", action="store_true", help="Frame store: replay as fast as possible (no drops)")
+    parser.add_argument("--cpu", action="store_true", help="Force CPU TFLite inference (no Edge TPU)")
+    parser.add_argument("--backend", default=None, help="Detector backend override: edgetpu | tflite | opencv | mock")
     args = parser.parse_args()
 
     cfg = load_cfg(args.cfg)
     log = get_logger("Main")
+    STARTUP.mark("imports")
+
+    # ----- Detector backend override -----------------------------------
+    if args.cpu or args.backend:
+        det_cfg = cfg["detector"] = dict(cfg.get("detector") or {})
+        det_cfg["backend"] = "tflite" if args.cpu else args.backend
+        det_cfg["fallback"] = []
+
+    # ----- Detector / Tracker: 백그라운드 로드 (카메라 FourCC 탐색과 병렬) -----
+    #   detector: 모델 로드 + warm-up,  tracker: scipy / filterpy import (수백 ms)
+    loader = DetectorLoader(cfg)
+    loader.start()
+    trk_loader = Loader("tracker", lambda: build_tracker(cfg))
+    trk_loader.start()
 
     cap_q = queue.Queue(maxsize=cfg.get("queue", 4))
     out_q = queue.Queue(maxsize=cfg.get("queue", 4))
 
-    # ----- Camera / File source select ---------------------------------
-    try:
-        cam_id = int(args.source)
-        log.info(f"Opening camera {cam_id}")
-        cam_th = CameraCapture(cam_id, cap_q, cfg["camera"])
-    except ValueError:
-        # treat as video file path
-        from capture.camera_capture import cv2
-        class VideoFileCapture(CameraCapture):
-            def __init__(self, path, out_q, cfg):
-                self.cfg = cfg; self.q = out_q
-                self.log = get_logger("VideoFile")
-                self.cap = cv2.VideoCapture(str(path))
-                if not self.cap.isOpened():
-                    raise RuntimeError(f"Cannot open video file {path}")
-                super(threading.Thread, self).__init__(daemon=True)  # bypass CameraCapture init
-        log.info(f"Opening video file {args.source}")
-        cam_th = VideoFileCapture(args.source, cap_q, cfg["camera"])
+    # ----- Camera / File / Frame store source select --------------------
+    if is_store(args.source):
+        log.info(f"Replaying frame store {args.source}")
+        cam_th = ReplayCapture(args.source, cap_q, realtime=not args.replay_fast)
+    else:
+        try:
+            cam_id = int(args.source)
+            log.info(f"Opening camera {cam_id}")
+            raw = (cfg["camera"].get("raw_mjpeg") or {}).get("enable", False)   # 압축 grab + 축소 디코딩 풀
+            cam_th = (MJPEGCapture if raw else CameraCapture)(cam_id, cap_q, cfg["camera"])
+        except ValueError:
+            # treat as video file path
+            from capture.camera_capture import cv2
+            class VideoFileCapture(CameraCapture):
+                def __init__(self, path, out_q, cfg):
+                    self.cfg = cfg; self.q = out_q
+                    self.log = get_logger("VideoFile")
+                    self.cap = cv2.VideoCapture(str(path))
+                    if not self.cap.isOpened():
+                        raise RuntimeError(f"Cannot open video file {path}")
+                    super(threading.Thread, self).__init__(daemon=True, name="Capture")  # bypass CameraCapture init
+            log.info(f"Opening video file {args.source}")
+            cam_th = VideoFileCapture(args.source, cap_q, cfg["camera"])
 
     # ----- Launch threads ----------------------------------------------
+    STARTUP.mark("camera")
+    det, trk = loader.result(), trk_loader.result()
+    STARTUP.mark("loaders_wait")                  # 카메라 이후 추가로 기다린 시간
+    log.info("Startup: camera %.0f ms, detector %.0f ms (load+warm-up), tracker %.0f ms, ready after %.0f ms",
+             STARTUP.phases["camera"], loader.elapsed_ms, trk_loader.elapsed_ms, STARTUP.elapsed_ms())
+
+    TRACER.configure(**(cfg.get("trace") or {}))  # 샘플링된 프레임 → Chrome trace JSON
     cam_th.start()
-    Pipeline(cap_q, out_q, cfg).start()
-    Output(out_q).start()
+    pipe = Pipeline(cap_q, out_q, cfg, det=det, trk=trk)
+    pipe.start()
+    out = Output(out_q, cfg=cfg)
+    out.start()
+    STARTUP.mark("threads")                       # 첫 annotated 프레임 시 전체 breakdown 로그
 
     # ----- Graceful shutdown -------------------------------------------
+    def _shutdown():
+        if pipe.results:
+            pipe.results.stop()                   # 남은 chunk flush + fsync
+        if out.rec:
+            out.rec.stop()                        # 현재 segment VideoWriter release (안 하면 마지막 파일 손상)
+
     def _sigint_handler(sig, frame):
         log.info("Ctrl‑C caught – shutting down.")
+        _shutdown()
         sys.exit(0)
     signal.signal(signal.SIGINT, _sigint_handler)
-    signal.pause()
+
+    # ----- Model hot-swap: det_model 수정 후 `kill -HUP <pid>` -----------
+    def _sighup_handler(sig, frame):
+        new_cfg = load_cfg(args.cfg)
+        if isinstance(det, DetectorPool):         # pool: 모든 worker 를 함께 (일부만 바뀌면 결과가 섞임)
+            paths = [model_for(d.active, new_cfg) for d in det.detectors]
+            paths = [p if p and p != d.model_path else None for d, p in zip(det.detectors, paths)]
+            if any(paths):
+                log.info("SIGHUP – hot-swapping %d pool worker(s) → %s", sum(map(bool, paths)),
+                         sorted({p for p in paths if p}))
+                det.swap_models(paths)
+            return
+        path = model_for(det.active, new_cfg)
+        if path and path != det.model_path:
+            log.info("SIGHUP – hot-swapping detector model → %s", path)
+            det.swap_model(path)
+    signal.signal(signal.SIGHUP, _sighup_handler)
+
+    # ----- On-demand profile: `kill -USR1 <pid>` → duration_s 후 자동 종료 -----
+    PROFILER.configure(**(cfg.get("profiler") or {}))
+    if PROFILER.enabled and hasattr(signal, "SIGUSR1"):
+        signal.signal(signal.SIGUSR1, lambda sig, frame: PROFILER.trigger())
+    if isinstance(cam_th, ReplayCapture):         # store 끝 → 남은 프레임 처리 후 SIGINT 와 같은 종료
+        while not cam_th.done.wait(0.5):
+            pass
+        log.info("Replay finished – draining queues.")
+        _drain(cap_q, out_q, out)
+        _shutdown()
+        log.info("Processed %d frames.", out.frames)
+        return
+    while True:                                   # pause() 는 handler 실행 후 반환 (SIGHUP / SIGUSR1)
+        signal.pause()
 
 
 if __name__ == "__main__":
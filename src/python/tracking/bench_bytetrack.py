@@ -0,0 +1,146 @@
+# bench_bytetrack.py ── native NumPy ByteTrack vs. YOLOX wrapper
+'''
+python -m tracking.bench_bytetrack                    # 기본: 300 프레임, 객체 20개
+python -m tracking.bench_bytetrack --frames 600 --objects 50
+
+* import time / RSS : 새 인터프리터에서 모듈 import 비용 측정
+* per-update        : 같은 합성 reference 시퀀스에 대한 update() 지연 (mean / p95)
+* compatibility     : YOLOX 가 설치돼 있으면 프레임별 출력 박스·ID 대응 일치율
+* pan               : 카메라 pan (warp 전달) 중 새로 나타난 객체가 몇 프레임 뒤에 출력되는지
+'''
+import argparse, json, subprocess, sys, time
+from pathlib import Path
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]          # src/python
+
+IMPLS = {
+    "native": ("tracking.bytetrack_tracker", "ByteTracker"),
+    "yolox":  ("tracking.yolox_bytetrack",   "YoloxByteTracker"),
+}
+
+_IMPORT_PROBE = """
+import json, resource, time, importlib
+t0 = time.perf_counter()
+importlib.import_module({mod!r})
+dt = time.perf_counter() - t0
+print(json.dumps({{"import_ms": dt * 1e3,
+                   "maxrss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024}}))
+"""
+
+
+def import_cost(module: str):
+    r = subprocess.run([sys.executable, "-c", _IMPORT_PROBE.format(mod=module)],
+                       cwd=ROOT, capture_output=True, text=True)
+    if r.returncode != 0:
+        return None
+    return json.loads(r.stdout.strip().splitlines()[-1])
+
+
+def reference_sequence(frames: int, objects: int, seed: int = 0):
+    """Deterministic synthetic detections: linear motion + jitter, score dips, gaps, clutter."""
+    rng = np.random.default_rng(seed)
+    pos = rng.uniform([0, 0], [600, 440], size=(objects, 2))
+    vel = rng.uniform(-3, 3, size=(objects, 2))
+    size = rng.uniform([20, 30], [60, 90], size=(objects, 2))
+    seq = []
+    for _ in range(frames):
+        pos = (pos + vel) % [640, 480]
+        score = np.clip(rng.normal(0.75, 0.15, objects), 0.05, 0.99)
+        keep = rng.random(objects) > 0.05                      # 5 % miss
+        c = pos[keep] + rng.normal(0, 1.0, (keep.sum(), 2))
+        boxes = np.hstack([c - size[keep] / 2, c + size[keep] / 2])
+        n_fp = rng.poisson(2)
+        fp_c = rng.uniform([0, 0], [640, 480], (n_fp, 2))
+        fp = np.hstack([fp_c - 15, fp_c + 15, rng.uniform(0.1, 0.6, (n_fp, 1))])
+        dets = np.vstack([np.hstack([boxes, score[keep, None]]), fp])
+        seq.append(dets.astype(np.float32))
+    return seq
+
+
+def pan_sequence(frames: int, pan_px: float, appear: int = 3, size=(30, 40)):
+    """Static-in-world object appearing at frame ``appear`` while the camera pans by pan_px / frame."""
+    seq, warps = [], []
+    A = np.array([[1.0, 0.0, -pan_px], [0.0, 1.0, 0.0]])       # 이전 프레임 → 현재 프레임 좌표
+    for i in range(frames):
+        x = 500.0 - pan_px * i
+        dets = np.array([[x, 200.0, x + size[0], 200.0 + size[1], 0.9]], np.float32)
+        seq.append(dets if i >= appear else np.empty((0, 5), np.float32))
+        warps.append(A)
+    return seq, warps
+
+
+def first_output(cls, seq, warps, **kw):
+    """Index of the first frame with a track in the output, or None."""
+    trk = cls(**kw)
+    for i, (dets, A) in enumerate(zip(seq, warps)):
+        if len(trk.update(dets, warp=A)):
+            return i
+    return None
+
+
+def run(cls, seq, **kw):
+    trk = cls(**kw)
+    outs, lat = [], []
+    for dets in seq:
+        t0 = time.perf_counter()
+        tr = trk.update(dets)
+        lat.append(time.perf_counter() - t0)
+        outs.append(tr.copy())                # TrackBuffer 슬롯 재사용 → 복사 보관
+    return outs, np.asarray(lat) * 1e6
+
+
+def compare(a, b, tol: float = 1e-2):
+    """Frame-wise: same number of tracks, boxes within tol px, consistent id bijection."""
+    same_frames, id_map, id_conflicts = 0, {}, 0
+    for ta, tb in zip(a, b):
+        if len(ta) != len(tb):
+            continue
+        ia, ib = np.argsort(ta["box"][:, 0]), np.argsort(tb["box"][:, 0])
+        if not np.allclose(ta["box"][ia], tb["box"][ib], atol=tol):
+            continue
+        same_frames += 1
+        for x, y in zip(ta["id"][ia].tolist(), tb["id"][ib].tolist()):
+            if id_map.setdefault(x, y) != y:
+                id_conflicts += 1
+    return same_frames / max(1, len(a)), id_conflicts
+
+
+def main():
+    ap = argparse.ArgumentParser("ByteTrack native vs. YOLOX benchmark")
+    ap.add_argument("--frames", type=int, default=300)
+    ap.add_argument("--objects", type=int, default=20)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--pan", default="0,10,15,20", help="쉼표로 구분한 pan 속도 (px / frame)")
+    args = ap.parse_args()
+
+    sys.path.insert(0, str(ROOT))
+    import importlib
+    seq = reference_sequence(args.frames, args.objects, args.seed)
+
+    results = {}
+    print(f"\n★★ {args.frames} frames, {args.objects} objects ★★")
+    for name, (mod, cls_name) in IMPLS.items():
+        imp = import_cost(mod)
+        if imp is None:
+            print(f"{name:<7}: unavailable (import failed)")
+            continue
+        cls = getattr(importlib.import_module(mod), cls_name)
+        outs, us = run(cls, seq)
+        results[name] = outs
+        print(f"{name:<7}: import {imp['import_ms']:7.1f} ms  RSS {imp['maxrss_mb']:6.1f} MB  "
+              f"update mean {us.mean():7.1f} µs  p95 {np.percentile(us, 95):7.1f} µs")
+        pans = []
+        for p in map(float, args.pan.split(",")):
+            seq_p, warps = pan_sequence(20, p)
+            k = first_output(cls, seq_p, warps)
+            pans.append(f"{p:g} px → {'never' if k is None else f'+{k - 3}'}")
+        print(f"{'':<9}new object under pan (frames after appearing): {', '.join(pans)}")
+
+    if len(results) == 2:
+        frac, conflicts = compare(results["native"], results["yolox"])
+        print(f"\ncompat : {frac*100:5.1f} % frames identical, {conflicts} id-mapping conflicts")
+
+
+if __name__ == "__main__":
+    main()
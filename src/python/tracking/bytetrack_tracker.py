@@ -1,38 +1,252 @@
-# ByteTrack adapter – minimal wrapper around YOLOX implementation
-# ===============================================================
+# ByteTrack – native NumPy implementation (no YOLOX / torch dependency)
+# ====================================================================
+# Zhang et al., "ByteTrack: Multi-Object Tracking by Associating Every Detection Box".
+# 알고리즘은 YOLOX tracker/byte_tracker.py 와 동일하게 맞췄다.
+#
+#   1단계  high-score det ↔ (tracked + lost) pool         : 1 - IoU·score, match_thresh
+#   2단계  low-score det  ↔ 1단계에서 남은 tracked 트랙      : 1 - IoU, 0.5
+#   3단계  남은 high det   ↔ unconfirmed(미활성) 트랙         : 1 - IoU·score, 0.7
+#   신규   남은 high det (score ≥ track_thresh + 0.1) → 새 트랙 (첫 프레임 외에는 미활성)
+#   lost   track_buffer·frame_rate/30 프레임 초과 시 제거
+#
+# 모든 트랙 상태는 (T,8) mean / (T,8,8) cov 배열로 보관 → predict / update 는 배치 연산.
+# 비교 벤치마크: python -m tracking.bench_bytetrack
+# ====================================================================
 from __future__ import annotations
 import numpy as np
-
-try:
-    # pip install yolox ; or ensure yolox package in PYTHONPATH
-    from yolox.tracker.byte_tracker import BYTETracker as _BT
-except ImportError as e:
-    raise ImportError("[ByteTrack] YOLOX 패키지가 필요합니다. → pip install yolox") from e
+from scipy.optimize import linear_sum_assignment
+from utils.box_ops import iou_batch
+from tracking.track_array import TrackBuffer, TRACK_CONFIRMED, TRACK_NEW
 
 __all__ = ["ByteTracker"]
 
+_TRACKED, _LOST = 1, 2
+_W_POS, _W_VEL = 1.0 / 20, 1.0 / 160
+
+_F = np.eye(8)
+_F[:4, 4:] = np.eye(4)
+_H = np.eye(4, 8)
+
+
+# ------------------------------------------------------------
+# 1. Batched Kalman filter in (cx, cy, a, h) space
+# ------------------------------------------------------------
+
+def _tlbr_to_xyah(b: np.ndarray) -> np.ndarray:
+    w, h = b[:, 2] - b[:, 0], b[:, 3] - b[:, 1]
+    return np.stack([b[:, 0] + w / 2, b[:, 1] + h / 2, w / np.maximum(h, 1e-6), h], axis=1)
+
+
+def _xyah_to_tlbr(m: np.ndarray) -> np.ndarray:
+    h = m[:, 3]; w = m[:, 2] * h
+    return np.stack([m[:, 0] - w / 2, m[:, 1] - h / 2, m[:, 0] + w / 2, m[:, 1] + h / 2], axis=1)
+
+
+def _kf_initiate(z: np.ndarray):
+    n = len(z)
+    mean = np.zeros((n, 8)); mean[:, :4] = z
+    h = z[:, 3]
+    std = np.stack([2 * _W_POS * h, 2 * _W_POS * h, np.full(n, 1e-2), 2 * _W_POS * h,
+                    10 * _W_VEL * h, 10 * _W_VEL * h, np.full(n, 1e-5), 10 * _W_VEL * h], axis=1)
+    cov = np.zeros((n, 8, 8))
+    idx = np.arange(8)
+    cov[:, idx, idx] = std ** 2
+    return mean, cov
+
+
+def _kf_predict(mean: np.ndarray, cov: np.ndarray):
+    h = mean[:, 3]
+    n = len(mean)
+    std = np.stack([_W_POS * h, _W_POS * h, np.full(n, 1e-2), _W_POS * h,
+                    _W_VEL * h, _W_VEL * h, np.full(n, 1e-5), _W_VEL * h], axis=1)
+    mean = mean @ _F.T
+    cov = _F @ cov @ _F.T
+    idx = np.arange(8)
+    cov[:, idx, idx] += std ** 2
+    return mean, cov
+
+
+def _kf_update(mean: np.ndarray, cov: np.ndarray, z: np.ndarray):
+    h = mean[:, 3]
+    n = len(mean)
+    r = np.stack([_W_POS * h, _W_POS * h, np.full(n, 1e-1), _W_POS * h], axis=1) ** 2
+    S = _H @ cov @ _H.T                                   # (n,4,4)
+    idx = np.arange(4)
+    S[:, idx, idx] += r
+    PHt = cov @ _H.T                                      # (n,8,4)
+    K = np.linalg.solve(S, PHt.transpose(0, 2, 1)).transpose(0, 2, 1)   # (n,8,4)
+    innov = z - mean[:, :4]
+    mean = mean + np.einsum("nij,nj->ni", K, innov)
+    cov = cov - K @ S @ K.transpose(0, 2, 1)
+    return mean, cov
+
+
+def _match(cost: np.ndarray, thresh: float):
+    """Hungarian with cost cut-off → (matches (K,2), unmatched rows, unmatched cols)."""
+    R, C = cost.shape
+    if R == 0 or C == 0:
+        return np.empty((0, 2), dtype=np.int64), np.arange(R), np.arange(C)
+    rows, cols = linear_sum_assignment(np.minimum(cost, thresh + 1e-4))
+    ok = cost[rows, cols] <= thresh
+    m = np.stack([rows[ok], cols[ok]], axis=1)
+    return m, np.setdiff1d(np.arange(R), m[:, 0]), np.setdiff1d(np.arange(C), m[:, 1])
+
+
+# ------------------------------------------------------------
+# 2. Tracker
+# ------------------------------------------------------------
+
 class ByteTracker:
-    """ByteTrack wrapper exposing .update(detections)->tracks.
+    """Native ByteTrack exposing .update(detections)->tracks.
 
     • 입력  detections: (N,5) ndarray [x1,y1,x2,y2,score]
-    • 출력  tracks    : (M,5) ndarray [x1,y1,x2,y2,track_id]
+    • 출력  tracks    : (M,) TRACK_DTYPE 구조체 배열 (tracking.track_array)
     """
 
-    def __init__(self, **kwargs):
-        # kwargs 그대로 YOLOX BYTETracker 에 전달 (fps, track_thresh 등)
-        self.bt = _BT(kwargs if kwargs else {})
+    def __init__(self, track_thresh: float = 0.5, match_thresh: float = 0.8,
+                 track_buffer: int = 30, frame_rate: int = 30, mot20: bool = False,
+                 low_thresh: float = 0.1):
+        self.track_thresh = float(track_thresh)
+        self.det_thresh = self.track_thresh + 0.1
+        self.match_thresh = float(match_thresh)
+        self.low_thresh = float(low_thresh)
+        self.fuse_score = not mot20
+        self.max_time_lost = int(frame_rate / 30.0 * track_buffer)
+        self.frame_id = 0
+        self._next_id = 1
+        self._out = TrackBuffer()
+
+        # per-track columns (row i = one track)
+        self.mean = np.zeros((0, 8)); self.cov = np.zeros((0, 8, 8))
+        self.ids = np.zeros(0, np.int64)
+        self.state = np.zeros(0, np.int8)
+        self.activated = np.zeros(0, bool)
+        self.score = np.zeros(0)
+        self.start = np.zeros(0, np.int64)
+        self.last = np.zeros(0, np.int64)          # end_frame (마지막 매칭 프레임)
+        self.tlen = np.zeros(0, np.int64)          # tracklet_len
 
     # --------------------------------------------------------
-    def update(self, detections: np.ndarray):
-        if detections.size == 0:
-            return np.empty((0,5), dtype=np.float32)
-
-        # YOLOX BYTETracker expects tlbr+score; we append dummy class id 0
-        dets = np.hstack([detections, np.zeros((detections.shape[0],1), np.float32)])
-        online_targets = self.bt.update(dets, img_info=(None, None))  # img size not used
-
-        res = []
-        for t in online_targets:
-            tlbr = t.tlbr  # [x1,y1,x2,y2]
-            res.append([*tlbr, t.track_id])
-        return np.asarray(res, dtype=np.float32)
+    def _boxes(self, idx=slice(None)):
+        return _xyah_to_tlbr(self.mean[idx])
+
+    def _iou_cost(self, t_idx, dets, fuse: bool):
+        iou = iou_batch(self._boxes(t_idx), dets[:, :4])
+        if fuse:
+            iou = iou * dets[None, :, 4]
+        return 1.0 - iou
+
+    def _apply(self, t_idx, dets):
+        """Matched tracks ← detections (update + re-activate lost ones)."""
+        if len(t_idx) == 0:
+            return
+        self.mean[t_idx], self.cov[t_idx] = _kf_update(
+            self.mean[t_idx], self.cov[t_idx], _tlbr_to_xyah(dets[:, :4]))
+        relost = self.state[t_idx] == _LOST
+        self.tlen[t_idx] = np.where(relost, 0, self.tlen[t_idx] + 1)
+        self.state[t_idx] = _TRACKED
+        self.activated[t_idx] = True
+        self.score[t_idx] = dets[:, 4]
+        self.last[t_idx] = self.frame_id
+
+    def _warp(self, idx, A):
+        L, t = A[:, :2], A[:, 2]
+        m = self.mean[idx]
+        m[:, :2] = m[:, :2] @ L.T + t
+        m[:, 4:6] = m[:, 4:6] @ L.T
+        k = np.sqrt(abs(np.linalg.det(L)))
+        m[:, 3] *= k; m[:, 7] *= k
+        self.mean[idx] = m
+
+    # --------------------------------------------------------
+    def update(self, detections: np.ndarray, warp=None):
+        self.frame_id += 1
+        dets = np.asarray(detections, dtype=np.float64)
+        if dets.size == 0:
+            dets = np.empty((0, 5))
+        scores = dets[:, 4]
+        high = dets[scores > self.track_thresh]
+        low = dets[(scores > self.low_thresh) & (scores < self.track_thresh)]
+
+        tracked = (self.state == _TRACKED) & self.activated
+        unconf = np.flatnonzero((self.state == _TRACKED) & ~self.activated)
+        pool = np.flatnonzero(tracked | (self.state == _LOST))
+
+        # predict pool (lost 트랙은 h 속도 0)
+        if len(pool):
+            m = self.mean[pool]
+            m[self.state[pool] != _TRACKED, 7] = 0
+            if warp is not None:
+                self.mean[pool] = m; self._warp(pool, warp); m = self.mean[pool]
+            self.mean[pool], self.cov[pool] = _kf_predict(m, self.cov[pool])
+        if warp is not None and len(unconf):          # unconfirmed 도 stage 3 에서 현재 프레임 det 과 비교
+            self._warp(unconf, warp)
+
+        # 1) high dets ↔ pool
+        m1, u_trk, u_high = _match(self._iou_cost(pool, high, self.fuse_score), self.match_thresh)
+        self._apply(pool[m1[:, 0]], high[m1[:, 1]])
+
+        # 2) low dets ↔ remaining *tracked* pool
+        r_trk = pool[u_trk][self.state[pool[u_trk]] == _TRACKED]
+        m2, u_r, _ = _match(self._iou_cost(r_trk, low, False), 0.5)
+        self._apply(r_trk[m2[:, 0]], low[m2[:, 1]])
+        self.state[r_trk[u_r]] = _LOST
+
+        # 3) unconfirmed ↔ remaining high
+        high = high[u_high]
+        m3, u_unc, u_high = _match(self._iou_cost(unconf, high, self.fuse_score), 0.7)
+        self._apply(unconf[m3[:, 0]], high[m3[:, 1]])
+        removed = np.zeros(len(self.ids), bool)
+        removed[unconf[u_unc]] = True
+
+        # lost buffer 초과 → 제거
+        removed |= (self.state == _LOST) & (self.frame_id - self.last > self.max_time_lost)
+        self._compact(~removed)
+
+        # 신규 트랙
+        new = high[u_high]
+        new = new[new[:, 4] >= self.det_thresh]
+        if len(new):
+            self._spawn(new)
+
+        self._compact(~self._duplicates())
+        return self._collect()
+
+    # --------------------------------------------------------
+    def _duplicates(self) -> np.ndarray:
+        """YOLOX remove_duplicate_stracks: tracked ↔ lost IoU > 0.85 → 이력이 짧은 쪽 제거."""
+        dup = np.zeros(len(self.ids), bool)
+        t = np.flatnonzero(self.state == _TRACKED)
+        l = np.flatnonzero(self.state == _LOST)
+        if len(t) == 0 or len(l) == 0:
+            return dup
+        pi, qi = np.nonzero(1.0 - iou_batch(self._boxes(t), self._boxes(l)) < 0.15)
+        age_t = self.last[t[pi]] - self.start[t[pi]]
+        age_l = self.last[l[qi]] - self.start[l[qi]]
+        dup[np.where(age_t > age_l, l[qi], t[pi])] = True
+        return dup
+
+    def _compact(self, keep):
+        for name in ("mean", "cov", "ids", "state", "activated", "score", "start", "last", "tlen"):
+            setattr(self, name, getattr(self, name)[keep])
+
+    def _spawn(self, dets):
+        n = len(dets)
+        mean, cov = _kf_initiate(_tlbr_to_xyah(dets[:, :4]))
+        self.mean = np.concatenate([self.mean, mean]); self.cov = np.concatenate([self.cov, cov])
+        self.ids = np.concatenate([self.ids, np.arange(self._next_id, self._next_id + n)])
+        self._next_id += n
+        self.state = np.concatenate([self.state, np.full(n, _TRACKED, np.int8)])
+        self.activated = np.concatenate([self.activated, np.full(n, self.frame_id == 1)])
+        self.score = np.concatenate([self.score, dets[:, 4]])
+        self.start = np.concatenate([self.start, np.full(n, self.frame_id)])
+        self.last = np.concatenate([self.last, np.full(n, self.frame_id)])
+        self.tlen = np.concatenate([self.tlen, np.zeros(n, np.int64)])
+
+    def _collect(self):
+        on = np.flatnonzero((self.state == _TRACKED) & self.activated)
+        fresh = self.start[on] == self.frame_id
+        return self._out.fill(self.ids[on], self._boxes(on), scores=self.score[on],
+                              ages=self.frame_id - self.start[on], hits=self.tlen[on] + 1,
+                              vels=self.mean[on, 4:6],
+                              flags=np.where(fresh, TRACK_CONFIRMED | TRACK_NEW, TRACK_CONFIRMED))
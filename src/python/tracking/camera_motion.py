@@ -0,0 +1,102 @@
+# tracking/camera_motion.py – global camera-motion (ego-motion) estimate for tracker prediction
+# -------------------------------------------------------------------------------------------
+# 카메라가 pan/tilt 하면 칼만 예측은 이미지 좌표에서 외삽되므로 IoU 매칭이 깨진다.
+# 매 프레임 축소된 gray 영상에서 sparse LK optical flow → RANSAC partial-affine 을 구해
+# 트래커의 예측 상태를 association 전에 warp 한다.
+#
+#   pipeline.yaml
+#   -------------
+#   camera_motion:
+#     enable: true
+#     scale: 0.25        # 640×480 → 160×120 에서 추정
+#     budget_ms: 3.0     # 초과 시 feature 수를 줄여 다음 프레임 비용을 낮춘다
+#
+# 반환값 A 는 full-res 좌표계의 2×3 affine (이전 프레임 → 현재 프레임).
+# -------------------------------------------------------------------------------------------
+from __future__ import annotations
+import time
+import cv2, numpy as np
+from utils.metrics import METRICS
+
+__all__ = ["CameraMotionEstimator", "IDENTITY", "compose_affine"]
+
+IDENTITY = np.array([[1, 0, 0], [0, 1, 0]], dtype=np.float64)
+
+
+def compose_affine(a2: np.ndarray, a1: np.ndarray) -> np.ndarray:
+    """2×3 affine applying ``a1`` then ``a2`` (e.g. 건너뛴 프레임의 warp 누적)."""
+    out = a2[:, :2] @ a1
+    out[:, 2] += a2[:, 2]
+    return out
+
+
+class CameraMotionEstimator:
+    def __init__(self, scale: float = 0.25, max_corners: int = 120, min_corners: int = 20,
+                 budget_ms: float = 3.0, ransac_px: float = 1.0, **_):
+        self.scale = float(scale)
+        self.max_corners = int(max_corners)
+        self.min_corners = int(min_corners)
+        self.budget_ms = float(budget_ms)
+        self.ransac_px = float(ransac_px)
+        self._corners = self.max_corners
+        self._prev = None
+
+    # --------------------------------------------------------
+    def _small_gray(self, frame: np.ndarray) -> np.ndarray:
+        gray = frame if frame.ndim == 2 else cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        return cv2.resize(gray, None, fx=self.scale, fy=self.scale, interpolation=cv2.INTER_AREA)
+
+    def _estimate(self, prev: np.ndarray, curr: np.ndarray) -> np.ndarray:
+        pts = cv2.goodFeaturesToTrack(prev, self._corners, 0.01, 6)
+        if pts is not None and len(pts) >= 6:
+            nxt, st, _ = cv2.calcOpticalFlowPyrLK(prev, curr, pts, None,
+                                                  winSize=(15, 15), maxLevel=2)
+            good = st.ravel() == 1
+            if good.sum() >= 6:
+                A, inl = cv2.estimateAffinePartial2D(pts[good], nxt[good], method=cv2.RANSAC,
+                                                     ransacReprojThreshold=self.ransac_px)
+                if A is not None:
+                    METRICS.observe("cmc.inliers", int(inl.sum()))
+                    return A
+        # texture 부족 → phase correlation 으로 translation 만 추정
+        (dx, dy), resp = cv2.phaseCorrelate(prev.astype(np.float32), curr.astype(np.float32))
+        if resp < 0.1:
+            return IDENTITY.copy()
+        return np.array([[1, 0, dx], [0, 1, dy]], dtype=np.float64)
+
+    # --------------------------------------------------------
+    def __call__(self, frame: np.ndarray) -> np.ndarray:
+        t0 = time.perf_counter()
+        curr = self._small_gray(frame)
+        prev, self._prev = self._prev, curr
+        if prev is None or prev.shape != curr.shape:
+            return IDENTITY.copy()
+
+        A = self._estimate(prev, curr)
+        A[:, 2] /= self.scale                       # small → full-res translation
+
+        dt = (time.perf_counter() - t0) * 1e3
+        METRICS.observe("cmc.latency_ms", dt)
+        METRICS.observe("cmc.shift_px", float(np.hypot(A[0, 2], A[1, 2])))
+        if dt > self.budget_ms:
+            METRICS.inc("cmc.over_budget")
+            self._corners = max(self.min_corners, self._corners // 2)
+        elif dt < 0.5 * self.budget_ms and self._corners < self.max_corners:
+            self._corners = min(self.max_corners, self._corners + 10)
+        return A
+
+    def reset(self):
+        self._prev = None
+
+
+def warp_cxcy_state(x: np.ndarray, A: np.ndarray, pos=(0, 1), vel=None):
+    """In-place warp of a state vector's centre (and optional velocity) by 2×3 affine A."""
+    L = A[:, :2]
+    i, j = pos
+    c = L @ np.array([x[i], x[j]], dtype=np.float64).reshape(2) + A[:, 2]
+    x[i], x[j] = c[0], c[1]
+    if vel is not None:
+        vi, vj = vel
+        v = L @ np.array([x[vi], x[vj]], dtype=np.float64).reshape(2)
+        x[vi], x[vj] = v[0], v[1]
+    return x
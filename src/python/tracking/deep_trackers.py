@@ -9,7 +9,7 @@ Available classes
 -----------------
 * **Sort**        – Kalman + IoU (lightweight, no DL dependency)
 * **DeepSort**    – Sort + CNN Re‑ID embedding
-* **ByteTracker** – YOLOX ByteTrack implementation
+* **ByteTracker** – native NumPy ByteTrack (YOLOX wrapper: tracking.yolox_bytetrack)
 * **OCSort**      – Occlusion‑aware IoU tracker
 
 Only the class that is actually imported by user code will trigger the heavy
@@ -24,14 +24,27 @@ tracker = ByteTracker(track_thresh=0.5)
 """
 from __future__ import annotations
 
+import importlib
+
 # ---------------------------------------------------------------------
-# Lazy re‑export: simply import the classes from their original modules
-# so external code can do `from tracking.deep_trackers import Foo`.
+# Lazy re‑export (PEP 562): the source module is imported on first
+# attribute access, so `from tracking.deep_trackers import Sort` does not
+# require yolox / ocsort to be installed.
 # ---------------------------------------------------------------------
-from tracking.sort_tracker import Sort  # type: ignore
-from tracking.deepsort_tracker import DeepSort  # type: ignore
-from tracking.bytetrack_tracker import ByteTracker  # type: ignore
-from tracking.ocsort_tracker import OCSort  # type: ignore
+_SOURCES = {
+    "Sort":        "tracking.sort_tracker",
+    "DeepSort":    "tracking.deepsort_tracker",
+    "ByteTracker": "tracking.bytetrack_tracker",
+    "OCSort":      "tracking.ocsort_tracker",
+}
+
+
+def __getattr__(name: str):
+    if name not in _SOURCES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    cls = getattr(importlib.import_module(_SOURCES[name]), name)
+    globals()[name] = cls
+    return cls
 
 __all__ = [
     "Sort",
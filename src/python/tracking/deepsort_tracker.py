@@ -0,0 +1,159 @@
+# DeepSORT‑lite – SORT + cheap CPU appearance (HSV histogram) for ambiguous matches
+# ================================================================================
+# CNN Re‑ID 는 Zynq 에서 감당 불가 → 작은 crop 의 HSV 히스토그램(상/하 2분할)을 임베딩으로 사용.
+#
+# * 임베딩은 "애매한" detection 에 대해서만 계산한다.
+#     - IoU ≥ iou_thresh 후보 트랙이 2개 이상인 detection
+#     - 후보 detection 이 2개 이상인 트랙 / 다른 트랙과 예측 박스가 겹치는 트랙의 후보 detection
+# * 트랙마다 gallery_size 개의 ring-buffer gallery 를 두고, 모든 gallery 를 한 번에
+#   (T,K,D)·(N,D) einsum 으로 cosine 거리 계산.
+# * 임베딩 계산 비용은 reid.embed_ms / reid.embeddings 메트릭으로 보고.
+#
+#   pipeline.yaml
+#   -------------
+#   tracker:
+#     name: deepsort
+#     params: {max_age: 30, appearance_weight: 0.5, max_cos_dist: 0.35}
+# ================================================================================
+from __future__ import annotations
+import time
+import cv2, numpy as np
+from scipy.optimize import linear_sum_assignment
+from tracking.sort_tracker import Sort
+from utils.box_ops import iou_batch
+from utils.metrics import METRICS
+
+__all__ = ["DeepSort", "hsv_embedding"]
+
+_H_BINS, _S_BINS = 8, 4
+EMBED_DIM = 2 * _H_BINS * _S_BINS          # 상/하 절반 × (H,S) 2D 히스토그램
+
+
+def hsv_embedding(frame: np.ndarray, boxes: np.ndarray, crop=(16, 32)) -> np.ndarray:
+    """(N,4) boxes → (N,EMBED_DIM) L2-normalised HSV histograms of small crops."""
+    h, w = frame.shape[:2]
+    out = np.zeros((len(boxes), EMBED_DIM), dtype=np.float32)
+    xy = np.clip(np.asarray(boxes, dtype=np.float64)[:, :4], 0, (w, h, w, h)).astype(np.int32)
+    half = crop[1] // 2
+    for i, (x1, y1, x2, y2) in enumerate(xy):
+        if x2 - x1 < 2 or y2 - y1 < 2:
+            continue
+        patch = cv2.resize(frame[y1:y2, x1:x2], crop, interpolation=cv2.INTER_NEAREST)
+        hsv = cv2.cvtColor(patch, cv2.COLOR_BGR2HSV)
+        for k, part in enumerate((hsv[:half], hsv[half:])):
+            hist = cv2.calcHist([part], [0, 1], None, [_H_BINS, _S_BINS], [0, 180, 0, 256])
+            out[i, k * _H_BINS * _S_BINS:(k + 1) * _H_BINS * _S_BINS] = hist.ravel()
+    norm = np.linalg.norm(out, axis=1, keepdims=True)
+    return out / np.maximum(norm, 1e-6)
+
+
+class DeepSort(Sort):
+    """Sort with an appearance term only where IoU association is ambiguous.
+
+    • 입력  update(detections, frame=..., warp=None) – detections (N,5) [x1,y1,x2,y2,score]
+    • 출력  TRACK_DTYPE 구조체 배열 (tracking.track_array)
+    """
+    needs_frame = True
+
+    def __init__(self, max_age: int = 30, min_hits: int = 3, iou_thresh: float = 0.3,
+                 gallery_size: int = 16, appearance_weight: float = 0.5,
+                 max_cos_dist: float = 0.35, max_tracks: int = 256, **_):
+        super().__init__(max_age=max_age, min_hits=min_hits, iou_thresh=iou_thresh)
+        self.w_app = float(appearance_weight)
+        self.max_cos = float(max_cos_dist)
+        self.K = int(gallery_size)
+        # preallocated galleries: slot → (K,D) ring, valid count, write index
+        self._gal = np.zeros((max_tracks, self.K, EMBED_DIM), dtype=np.float32)
+        self._gal_n = np.zeros(max_tracks, dtype=np.int32)
+        self._gal_i = np.zeros(max_tracks, dtype=np.int32)
+        self._slot = {}                              # track id → slot
+        self._free = list(range(max_tracks - 1, -1, -1))
+        self._frame = None
+
+    # --------------------------------------------------------
+    def update(self, detections, frame=None, warp=None):
+        self._frame = frame
+        out = super().update(detections, warp=warp)
+        self._release_dead()
+        return out
+
+    # gallery helpers ----------------------------------------
+    def _slot_of(self, tid: int):
+        s = self._slot.get(tid)
+        if s is None and self._free:
+            s = self._slot[tid] = self._free.pop()
+            self._gal_n[s] = self._gal_i[s] = 0
+        return s
+
+    def _push(self, tid: int, emb: np.ndarray):
+        s = self._slot_of(tid)
+        if s is None:
+            return
+        self._gal[s, self._gal_i[s]] = emb
+        self._gal_i[s] = (self._gal_i[s] + 1) % self.K
+        self._gal_n[s] = min(self._gal_n[s] + 1, self.K)
+
+    def _release_dead(self):
+        alive = {t.id for t in self.trackers}
+        for tid in [t for t in self._slot if t not in alive]:
+            self._free.append(self._slot.pop(tid))
+
+    def _cos_dist(self, tids, embs: np.ndarray) -> np.ndarray:
+        """(T,) track ids × (N,D) → (T,N) min cosine distance over each gallery (nan = no gallery)."""
+        slots = np.array([self._slot.get(t, -1) for t in tids], dtype=np.int64)
+        has = slots >= 0
+        dist = np.full((len(tids), len(embs)), np.nan, dtype=np.float32)
+        if not has.any():
+            return dist
+        s = slots[has]
+        G = self._gal[s]                                             # (T',K,D)
+        valid = np.arange(self.K)[None, :] < self._gal_n[s][:, None]  # (T',K)
+        sim = np.einsum("tkd,nd->tkn", G, embs)
+        sim = np.where(valid[:, :, None], sim, -np.inf).max(axis=1)
+        d = 1.0 - sim
+        d[~np.isfinite(d)] = np.nan
+        dist[has] = d
+        return dist
+
+    # --------------------------------------------------------
+    def _associate(self, dets, trks):
+        if len(trks) == 0 or len(dets) == 0 or self._frame is None:
+            return super()._associate(dets, trks)
+
+        iou_mat = np.nan_to_num(iou_batch(trks, dets[:, :4]), nan=-1e5)
+        cand = iou_mat >= self.iou_thresh
+        tt = iou_batch(trks, trks); np.fill_diagonal(tt, 0.0)
+        busy_trk = (cand.sum(axis=1) >= 2) | (tt > 0).any(axis=1)
+        amb = (cand.sum(axis=0) >= 2) | cand[busy_trk].any(axis=0)
+        if not amb.any():
+            return super()._associate(dets, trks)
+
+        a_idx = np.flatnonzero(amb)
+        t0 = time.perf_counter()
+        embs = hsv_embedding(self._frame, dets[a_idx, :4])
+        METRICS.observe("reid.embed_ms", (time.perf_counter() - t0) * 1e3)
+        METRICS.inc("reid.embeddings", len(a_idx))
+
+        tids = [t.id for t in self.trackers]
+        dist = self._cos_dist(tids, embs)                   # (T, |amb|)
+        score = iou_mat.copy()
+        sub = score[:, a_idx]
+        known = ~np.isnan(dist)
+        sub[known] = (1 - self.w_app) * sub[known] + self.w_app * (1.0 - dist[known])
+        sub[known & (dist > self.max_cos)] = -1e5           # appearance gate
+        score[:, a_idx] = sub
+
+        rows, cols = linear_sum_assignment(-score)
+        matches, used_t, used_d = [], set(), set()
+        for t_idx, d_idx in zip(rows, cols):
+            if iou_mat[t_idx, d_idx] >= self.iou_thresh and score[t_idx, d_idx] > -1e4:
+                matches.append([t_idx, d_idx]); used_t.add(t_idx); used_d.add(d_idx)
+
+        col_of = {d: k for k, d in enumerate(a_idx)}
+        for t_idx, d_idx in matches:
+            if d_idx in col_of:
+                self._push(tids[t_idx], embs[col_of[d_idx]])
+
+        unmatched_dets = np.array([d for d in range(len(dets)) if d not in used_d], dtype=np.int64)
+        unmatched_trks = np.array([t for t in range(len(trks)) if t not in used_t], dtype=np.int64)
+        return np.asarray(matches), unmatched_dets, unmatched_trks
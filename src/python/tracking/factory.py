@@ -15,7 +15,8 @@
 # -------------------------------------------------------------------------------------------
 #   신규 트래커 추가 시
 #   --------------------
-#   1) tracking/<foo>_tracker.py 에 클래스 구현 (BaseTracker duck‑type: update(ndarray)->ndarray)
+#   1) tracking/<foo>_tracker.py 에 클래스 구현 (BaseTracker duck‑type: update(ndarray)->TRACK_DTYPE ndarray,
+#      tracking.track_array.TrackBuffer 로 출력 버퍼 재사용)
 #   2) _REGISTRY["foo"] = (import_path, class_name)
 # -------------------------------------------------------------------------------------------
 from __future__ import annotations
@@ -32,6 +33,7 @@ _REGISTRY: Dict[str, Tuple[str, str]] = {
     "deepsort":  ("tracking.deep_trackers", "DeepSort"),
     "bytetrack": ("tracking.deep_trackers", "ByteTracker"),
     "ocsort":    ("tracking.deep_trackers", "OCSort"),
+    "bytetrack_yolox": ("tracking.yolox_bytetrack", "YoloxByteTracker"),   # 비교용 YOLOX 래퍼
 
     # OpenCV trackers --------------------------------------------------
     "kcf":        ("tracking.opencv_trackers", "KCFTracker"),
@@ -2,6 +2,7 @@
 # ============================================
 from __future__ import annotations
 import numpy as np
+from tracking.track_array import TrackBuffer, empty_tracks
 
 try:
     # pip install ocsort
@@ -15,18 +16,20 @@ class OCSort:
     """OC-SORT wrapper exposing .update(detections)->tracks.
 
     • 입력  detections: (N,5) ndarray [x1,y1,x2,y2,score]
-    • 출력  tracks    : (M,5) ndarray [x1,y1,x2,y2,track_id]
+    • 출력  tracks    : (M,) TRACK_DTYPE 구조체 배열 (tracking.track_array)
     """
 
     def __init__(self, **kwargs):
         self.oc = _OCSort(**kwargs)
+        self._out = TrackBuffer()
 
     # --------------------------------------------------------
-    def update(self, detections: np.ndarray):
+    def update(self, detections: np.ndarray, warp=None):
+        # warp: ocsort 패키지는 내부 칼만 상태를 노출하지 않으므로 camera-motion 보정 미지원
         if detections.size == 0:
-            return np.empty((0,5), dtype=np.float32)
+            return empty_tracks()
 
-        outputs = self.oc.update(detections)  # (M,6) x1,y1,x2,y2,score,id
+        outputs = self.oc.update(detections[:, :5])  # (M,6) x1,y1,x2,y2,score,id
         if outputs.shape[0] == 0:
-            return np.empty((0,5), dtype=np.float32)
-        return outputs[:, [0,1,2,3,5]].astype(np.float32)
+            return empty_tracks()
+        return self._out.fill(outputs[:, 5], outputs[:, :4], scores=outputs[:, 4])
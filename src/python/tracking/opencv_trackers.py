@@ -9,7 +9,7 @@
 📐  Bounding‑box & API
 ----------------------
 * 입력  : `detections` → (N,5) ndarray [x1,y1,x2,y2,score]
-* 출력  : `tracks`     → (M,5) ndarray [x1,y1,x2,y2,track_id]
+* 출력  : `tracks`     → (M,) TRACK_DTYPE 구조체 배열 (tracking.track_array)
 
 🚦  생명주기 파라미터
 ---------------------
@@ -19,6 +19,8 @@
 from __future__ import annotations
 import cv2, numpy as np
 from typing import List, Dict, Tuple
+from utils.box_ops import warp_boxes
+from tracking.track_array import TrackBuffer, TRACK_CONFIRMED, TRACK_COASTING, TRACK_NEW
 
 try:
     from scipy.optimize import linear_sum_assignment  # optional, for Hungarian
@@ -55,22 +57,30 @@ _CTOR_MAP = {
 }
 
 class _Track:
-    def __init__(self, bbox: np.ndarray, tid: int, ctor):
+    def __init__(self, bbox: np.ndarray, tid: int, ctor, score: float = 0.0):
         self.id = tid
         self.trk = ctor()
         x1,y1,x2,y2 = bbox
         self.trk.init(np.zeros((1,1,3), dtype=np.uint8), (x1,y1,x2-x1,y2-y1))
         self.bbox = bbox.copy()
+        self.score = float(score)
         self.age  = 0     # total frames
+        self.hits = 1     # total matches
         self.miss = 0     # consecutive misses
+        self.vel  = np.zeros(2, dtype=np.float32)   # center delta per frame
 
     def predict(self) -> Tuple[bool, np.ndarray]:
         ok, bb = self.trk.update(np.zeros((1,1,3), dtype=np.uint8))
+        self.age += 1
         if ok:
             x,y,w,h = bb
-            self.bbox = np.array([x,y,x+w,y+h], dtype=np.float32)
+            self.move_to(np.array([x,y,x+w,y+h], dtype=np.float32))
         return ok, self.bbox
 
+    def move_to(self, bbox: np.ndarray):
+        self.vel = (bbox[:2] + bbox[2:4] - self.bbox[:2] - self.bbox[2:4]) * 0.5
+        self.bbox = bbox
+
 # ------------------------------------------------------------
 # 3. Multi‑object orchestrator
 # ------------------------------------------------------------
@@ -84,13 +94,14 @@ class _MultiCVTracker:
         self.min_iou = min_iou
         self._next_id = 0
         self.tracks: List[_Track] = []
+        self._out = TrackBuffer()
 
     # --------------------------------------------------------
-    def update(self, detections: np.ndarray):
+    def update(self, detections: np.ndarray, warp=None):
         M = len(self.tracks); N = detections.shape[0]
         if M == 0:
             for d in detections:
-                self._add_track(d[:4])
+                self._add_track(d[:4], d[4])
             return self._collect()
 
         # 1) predict all
@@ -99,6 +110,10 @@ class _MultiCVTracker:
             ok, bb = t.predict()
             preds.append(bb if ok else t.bbox)
         preds = np.stack(preds)
+        if warp is not None:                     # camera-motion compensation
+            preds = warp_boxes(preds, warp).astype(np.float32)
+            for t, bb in zip(self.tracks, preds):
+                t.bbox = bb
 
         # 2) build IoU matrix
         iou_mat = np.zeros((M,N), dtype=np.float32)
@@ -126,13 +141,15 @@ class _MultiCVTracker:
         for t_idx, d_idx in matches:
             self.tracks[t_idx].trk.init(np.zeros((1,1,3), dtype=np.uint8),
                                         tuple(self._to_xywh(detections[d_idx,:4])))
-            self.tracks[t_idx].bbox = detections[d_idx,:4].copy()
+            self.tracks[t_idx].move_to(detections[d_idx,:4].astype(np.float32))
+            self.tracks[t_idx].score = float(detections[d_idx,4])
+            self.tracks[t_idx].hits += 1
             self.tracks[t_idx].miss = 0
 
         # 5) unmatched det → new track
         for j in range(N):
             if j not in matched_d:
-                self._add_track(detections[j,:4])
+                self._add_track(detections[j,:4], detections[j,4])
 
         # 6) unmatched track → age++ / remove if too old
         keep=[]
@@ -147,8 +164,8 @@ class _MultiCVTracker:
         return self._collect()
 
     # --------------------------------------------------------
-    def _add_track(self, bbox):
-        self.tracks.append(_Track(bbox, self._next_id, self._ctor))
+    def _add_track(self, bbox, score=0.0):
+        self.tracks.append(_Track(bbox, self._next_id, self._ctor, score))
         self._next_id +=1
 
     @staticmethod
@@ -156,10 +173,20 @@ class _MultiCVTracker:
         x1,y1,x2,y2=b;return (x1,y1,x2-x1,y2-y1)
 
     def _collect(self):
-        out=[]
-        for t in self.tracks:
-            out.append([*t.bbox, t.id])
-        return np.asarray(out, dtype=np.float32)
+        out = self._out.acquire(len(self.tracks))
+        ids, boxes, scores = out["id"], out["box"], out["score"]
+        ages, hits, vels, flags = out["age"], out["hits"], out["vel"], out["flags"]
+        for i, t in enumerate(self.tracks):
+            ids[i] = t.id
+            boxes[i] = t.bbox
+            scores[i] = t.score
+            ages[i] = t.age
+            hits[i] = t.hits
+            vels[i] = t.vel
+            flags[i] = (TRACK_CONFIRMED
+                        | (TRACK_COASTING if t.miss else 0)
+                        | (TRACK_NEW if t.age == 0 else 0))
+        return out
 
 # ------------------------------------------------------------
 # 4. External classes (aliases for factory)
@@ -3,19 +3,20 @@ import numpy as np, time
 from scipy.optimize import linear_sum_assignment
 from filterpy.kalman import KalmanFilter
 from utils.box_ops import iou_batch
+from tracking.track_array import TrackBuffer, TRACK_CONFIRMED, TRACK_COASTING, TRACK_NEW
 
 class KalmanBoxTracker:
     """Represents the internal state of individual tracked objects."""
     count = 0
-    def __init__(self, bbox):
+    def __init__(self, bbox, score: float = 0.0):
         # x,y,s,r velocity + position (similar to original SORT)
         if bbox[2] <= bbox[0] or bbox[3] <= bbox[1]:
             bbox = [0, 0, 1, 1]  # 최소 크기 보정
         self.kf = KalmanFilter(dim_x=7, dim_z=4)
         # State: [cx, cy, s, r, vx, vy, vs]
         self.kf.F = np.eye(7)
-        for i in range(4):
-            self.kf.F[i, i+3] = 1
+        for i in range(3):
+            self.kf.F[i, i+4] = 1   # cx,cy,s += vx,vy,vs
         self.kf.H = np.zeros((4,7))
         self.kf.H[:4, :4] = np.eye(4)
         self.kf.R *= 0.01
@@ -32,10 +33,13 @@ class KalmanBoxTracker:
         self.hits = 1
         self.hit_streak = 1
         self.age = 0
+        self.score = float(score)
 
-    def update(self, bbox):
+    def update(self, bbox, score: float = None):
         if bbox[2] <= bbox[0] or bbox[3] <= bbox[1]:
             bbox = [0, 0, 1, 1]  # 최소 크기 보정
+        if score is not None:
+            self.score = float(score)
         self.time_since_update = 0
         self.hits += 1
         self.hit_streak += 1
@@ -62,6 +66,21 @@ class KalmanBoxTracker:
             h = s / (w + 1e-6)
         return np.array([cx - w / 2, cy - h / 2, cx + w / 2, cy + h / 2])
 
+    def apply_affine(self, A):
+        """Warp state & covariance by global camera motion A (2×3, prev → curr frame)."""
+        L = A[:, :2]
+        det = abs(np.linalg.det(L))
+        T = np.eye(7)
+        T[0:2, 0:2] = L
+        T[4:6, 4:6] = L
+        T[2, 2] = T[6, 6] = det          # area scales with |det|
+        self.kf.x = T @ self.kf.x
+        self.kf.x[0:2, 0] += A[:, 2]
+        self.kf.P = T @ self.kf.P @ T.T
+
+    def velocity(self):
+        return self.kf.x[4:6, 0]
+
 class Sort:
     def __init__(self, max_age:int=10, min_hits:int=3, iou_thresh:float=0.3):
         self.max_age = max_age
@@ -69,14 +88,19 @@ class Sort:
         self.iou_thresh = iou_thresh
         self.trackers = []
         self.frame_count = 0
+        self._out = TrackBuffer()
 
-    def update(self, detections):
-        """detections: ndarray Nx5 (x1,y1,x2,y2,score)"""
+    def update(self, detections, warp=None):
+        """detections: ndarray Nx5 (x1,y1,x2,y2,score) → TRACK_DTYPE array (tracking.track_array)
+        warp: optional 2×3 camera-motion affine (tracking.camera_motion) applied to predictions"""
         self.frame_count += 1
         trks = np.zeros((len(self.trackers),4))
         to_del = []
         for t,tracker in enumerate(self.trackers):
             pos = tracker.predict()
+            if warp is not None:
+                tracker.apply_affine(warp)
+                pos = tracker.get_state()
             trks[t] = pos
             if np.any(np.isnan(pos)):
                 to_del.append(t)
@@ -88,20 +112,33 @@ class Sort:
 
         # update matched trackers with assigned detections
         for t_idx, d_idx in matched:
-            self.trackers[t_idx].update(detections[d_idx, :4])
+            self.trackers[t_idx].update(detections[d_idx, :4], detections[d_idx, 4])
 
         # add new trackers for unmatched detections
         for i in unmatched_dets:
-            self.trackers.append(KalmanBoxTracker(detections[i,:4]))
+            self.trackers.append(KalmanBoxTracker(detections[i,:4], detections[i, 4]))
 
         # remove dead trackers
-        ret = []
-        for trk in reversed(self.trackers):
-            if trk.time_since_update > self.max_age:
-                self.trackers.remove(trk)
-            elif trk.hits >= self.min_hits or self.frame_count <= self.min_hits:
-                ret.append(np.concatenate((trk.get_state(), [trk.id])))
-        return np.array(ret)
+        self.trackers = [t for t in self.trackers if t.time_since_update <= self.max_age]
+        return self._collect()
+
+    def _collect(self):
+        live = [t for t in reversed(self.trackers)
+                if t.hits >= self.min_hits or self.frame_count <= self.min_hits]
+        out = self._out.acquire(len(live))
+        ids, boxes, scores = out["id"], out["box"], out["score"]
+        ages, hits, vels, flags = out["age"], out["hits"], out["vel"], out["flags"]
+        for i, trk in enumerate(live):
+            ids[i] = trk.id
+            boxes[i] = trk.get_state()
+            scores[i] = trk.score
+            ages[i] = trk.age
+            hits[i] = trk.hits
+            vels[i] = trk.velocity()
+            flags[i] = ((TRACK_CONFIRMED if trk.hits >= self.min_hits else 0)
+                        | (TRACK_COASTING if trk.time_since_update > 0 else 0)
+                        | (TRACK_NEW if trk.hits == 1 and trk.age == 0 else 0))
+        return out
 
     def _associate(self, dets, trks):
         if len(trks) == 0 or len(dets) == 0:
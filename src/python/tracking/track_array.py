@@ -0,0 +1,78 @@
+# tracking/track_array.py – fixed-dtype track output shared by every tracker
+# -------------------------------------------------------------------------------------------
+# 모든 트래커(tracking.factory)의 update() 는 아래 TRACK_DTYPE 구조체 배열을 반환한다.
+#
+#   id     int32        track id
+#   box    float32[4]   x1,y1,x2,y2 (frame 좌표)
+#   score  float32      마지막으로 매칭된 detection score
+#   age    int32        생성 후 경과 프레임
+#   hits   int32        누적 매칭 횟수
+#   vel    float32[2]   중심점 속도 (px/frame)
+#   flags  uint8        TRACK_* 비트 플래그
+#
+# box / vel 은 sub-array 필드라서 tracks["box"] 가 곧 (M,4) view → 별도 복사 없이 벡터 연산 가능.
+# -------------------------------------------------------------------------------------------
+from __future__ import annotations
+import numpy as np
+
+__all__ = [
+    "TRACK_DTYPE", "TrackBuffer",
+    "TRACK_CONFIRMED", "TRACK_COASTING", "TRACK_NEW",
+    "empty_tracks",
+]
+
+TRACK_DTYPE = np.dtype([
+    ("id",    np.int32),
+    ("box",   np.float32, (4,)),
+    ("score", np.float32),
+    ("age",   np.int32),
+    ("hits",  np.int32),
+    ("vel",   np.float32, (2,)),
+    ("flags", np.uint8),
+])
+
+# state flags -------------------------------------------------------------------------------
+TRACK_CONFIRMED = 1 << 0     # min_hits 이상 매칭된 트랙
+TRACK_COASTING  = 1 << 1     # 이번 프레임 매칭 없음 → 예측값만 출력
+TRACK_NEW       = 1 << 2     # 이번 프레임에 생성된 트랙
+
+
+def empty_tracks() -> np.ndarray:
+    return np.zeros(0, dtype=TRACK_DTYPE)
+
+
+class TrackBuffer:
+    """Ring of preallocated TRACK_DTYPE arrays reused across ``update()`` calls.
+
+    ``acquire(n)`` hands out an ``n``-row view of the next slot. The view stays
+    valid only for ``slots - 1`` further acquisitions, so anything that keeps
+    tracks past the next few ``update()`` calls – e.g. another thread behind a
+    queue – must take a ``.copy()`` (Pipeline does so before ``out_q``).
+    """
+
+    def __init__(self, capacity: int = 64, slots: int = 8):
+        self._bufs = [np.zeros(capacity, dtype=TRACK_DTYPE) for _ in range(max(2, slots))]
+        self._idx = 0
+
+    def acquire(self, n: int) -> np.ndarray:
+        self._idx = (self._idx + 1) % len(self._bufs)
+        buf = self._bufs[self._idx]
+        if buf.shape[0] < n:                      # 드물게만 발생 → 2배씩 확장
+            buf = np.zeros(max(n, 2 * buf.shape[0]), dtype=TRACK_DTYPE)
+            self._bufs[self._idx] = buf
+        out = buf[:n]
+        out["flags"] = 0
+        return out
+
+    def fill(self, ids, boxes, scores=None, ages=None, hits=None, vels=None, flags=None) -> np.ndarray:
+        """Vectorized fill for trackers that already hold their state as arrays."""
+        boxes = np.asarray(boxes, dtype=np.float32).reshape(-1, 4)
+        out = self.acquire(boxes.shape[0])
+        out["id"] = ids
+        out["box"] = boxes
+        out["score"] = 0.0 if scores is None else scores
+        out["age"] = 0 if ages is None else ages
+        out["hits"] = 0 if hits is None else hits
+        out["vel"] = 0.0 if vels is None else vels
+        out["flags"] = TRACK_CONFIRMED if flags is None else flags
+        return out
@@ -0,0 +1,107 @@
+# tracking/trajectory.py – bounded per-track trajectory history (ring buffers) + batched trail drawing
+# -------------------------------------------------------------------------------------------
+# 트랙 ID 별 최근 K 개 중심점을 미리 할당한 배열에 ring buffer 로 저장한다.
+#
+#   pts   float32 (capacity, K, 2)   slot 별 중심점 ring
+#   head  int32   (capacity,)        다음 기록 위치
+#   count int32   (capacity,)        유효 점 개수 (≤ K)
+#   seen  int64   (capacity,)        마지막으로 본 프레임 번호
+#
+# 트랙 ID 는 KalmanBoxTracker.count 처럼 끝없이 증가하지만 메모리는 capacity × K 로 고정:
+# max_age 프레임 동안 안 보인 ID 는 slot 을 반납하고, slot 이 모자라면 가장 오래 안 보인 ID 를 밀어낸다.
+#
+#   pipeline.yaml
+#   -------------
+#   trajectory:
+#     enable: true
+#     length: 32            # K – ID 당 보관 점 수
+#     capacity: 128         # 동시에 보관할 최대 ID 수
+#     max_age: 10           # 생략 시 tracker.params.max_age
+# -------------------------------------------------------------------------------------------
+from __future__ import annotations
+from typing import Dict, List
+
+import cv2, numpy as np
+
+__all__ = ["TrajectoryStore"]
+
+
+class TrajectoryStore:
+    def __init__(self, length: int = 32, capacity: int = 128, max_age: int = 10, **_):
+        self.K, self.capacity, self.max_age = int(length), int(capacity), int(max_age)
+        self.pts = np.zeros((self.capacity, self.K, 2), dtype=np.float32)
+        self.head = np.zeros(self.capacity, dtype=np.int32)
+        self.count = np.zeros(self.capacity, dtype=np.int32)
+        self.seen = np.full(self.capacity, -1, dtype=np.int64)
+        self._slot: Dict[int, int] = {}           # track id → slot
+        self._owner = np.full(self.capacity, -1, dtype=np.int64)
+        self._free: List[int] = list(range(self.capacity - 1, -1, -1))
+        self._frame = 0
+        self._ar = np.arange(self.K)
+
+    def __len__(self) -> int:
+        return len(self._slot)
+
+    # --------------------------------------------------------
+    def _release(self, slots: np.ndarray):
+        for s in slots.tolist():
+            del self._slot[int(self._owner[s])]
+            self._owner[s] = -1
+            self.count[s] = 0
+            self.seen[s] = -1
+            self._free.append(s)
+
+    def _acquire(self, tid: int) -> int:
+        """Slot for a new id, or -1 when every slot already belongs to an id seen this frame."""
+        if not self._free:                        # 꽉 참 → 가장 오래 안 보인 ID 를 밀어냄
+            used = np.flatnonzero((self._owner >= 0) & (self.seen < self._frame))
+            if len(used) == 0:
+                return -1
+            self._release(used[[np.argmin(self.seen[used])]])
+        s = self._free.pop()
+        self._slot[tid] = s
+        self._owner[s] = tid
+        self.head[s] = 0
+        self.seen[s] = self._frame                # 같은 프레임의 다음 eviction 후보에서 제외
+        return s
+
+    def update(self, tracks: np.ndarray):
+        """Append the current centre of every finite track box; evict IDs unseen for > max_age frames."""
+        self._frame += 1
+        if len(tracks):
+            boxes = tracks["box"]
+            ok = np.isfinite(boxes).all(axis=1)
+            c = (boxes[ok, :2] + boxes[ok, 2:4]) * 0.5
+            ids = tracks["id"][ok].tolist()
+            known = [self._slot[t] for t in ids if t in self._slot]
+            self.seen[known] = self._frame        # 이번 프레임에 보인 ID 는 새 ID 가 밀어내지 못하게 먼저 표시
+            get = self._slot.get
+            slots = np.array([get(t) if t in self._slot else self._acquire(t) for t in ids], dtype=np.int64)
+            keep = slots >= 0                     # capacity 초과분은 이번 프레임 궤적 없음
+            slots, c = slots[keep], c[keep]
+            if len(slots):
+                self.pts[slots, self.head[slots]] = c
+                self.head[slots] = (self.head[slots] + 1) % self.K
+                self.count[slots] = np.minimum(self.count[slots] + 1, self.K)
+                self.seen[slots] = self._frame
+        stale = np.flatnonzero((self._owner >= 0) & (self._frame - self.seen > self.max_age))
+        if len(stale):
+            self._release(stale)
+
+    # --------------------------------------------------------
+    def trails(self, min_points: int = 2) -> List[np.ndarray]:
+        """Oldest→newest int32 (n,1,2) point arrays for every live trail (cv2.polylines 입력 형식)."""
+        act = np.flatnonzero((self._owner >= 0) & (self.count >= min_points))
+        if len(act) == 0:
+            return []
+        # 한 번의 gather 로 모든 ring 을 시간순 정렬 → (M,K,2); 앞쪽 K-count 개는 미사용 칸
+        order = (self.head[act, None] - self.K + self._ar) % self.K
+        seq = np.rint(self.pts[act[:, None], order]).astype(np.int32)
+        return [seq[i, self.K - n:, None] for i, n in enumerate(self.count[act].tolist())]
+
+    def draw(self, frame: np.ndarray, color=(0, 255, 255), thickness: int = 1) -> np.ndarray:
+        """All trails in a single ``cv2.polylines`` call."""
+        trails = self.trails()
+        if trails:
+            cv2.polylines(frame, trails, False, color, thickness, cv2.LINE_AA)
+        return frame
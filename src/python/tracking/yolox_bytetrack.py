@@ -0,0 +1,59 @@
+# ByteTrack adapter – minimal wrapper around YOLOX implementation
+# ===============================================================
+# 기본 "bytetrack" 별칭은 tracking.bytetrack_tracker (NumPy 구현) 로 옮겨졌다.
+# 이 래퍼는 "bytetrack_yolox" 별칭 및 tracking/bench_bytetrack.py 비교 기준으로 유지.
+from __future__ import annotations
+from types import SimpleNamespace
+import numpy as np
+from tracking.camera_motion import warp_cxcy_state
+from tracking.track_array import TrackBuffer, TRACK_CONFIRMED
+
+try:
+    # pip install yolox ; or ensure yolox package in PYTHONPATH
+    from yolox.tracker.byte_tracker import BYTETracker as _BT
+except ImportError as e:
+    raise ImportError("[ByteTrack] YOLOX 패키지가 필요합니다. → pip install yolox") from e
+
+__all__ = ["YoloxByteTracker"]
+
+class YoloxByteTracker:
+    """ByteTrack wrapper exposing .update(detections)->tracks.
+
+    • 입력  detections: (N,5) ndarray [x1,y1,x2,y2,score]
+    • 출력  tracks    : (M,) TRACK_DTYPE 구조체 배열 (tracking.track_array)
+    """
+
+    def __init__(self, track_thresh: float = 0.5, match_thresh: float = 0.8,
+                 track_buffer: int = 30, frame_rate: int = 30, mot20: bool = False):
+        # YOLOX BYTETracker 는 argparse 스타일 args 객체를 기대한다
+        args = SimpleNamespace(track_thresh=track_thresh, match_thresh=match_thresh,
+                               track_buffer=track_buffer, mot20=mot20)
+        self.bt = _BT(args, frame_rate=frame_rate)
+        self._out = TrackBuffer()
+
+    # --------------------------------------------------------
+    def update(self, detections: np.ndarray, warp=None):
+        if warp is not None:
+            # YOLOX 는 update() 안에서 predict 하므로 그 전에 상태(xyah + v)를 warp.
+            # (affine 과 등속 예측은 교환 가능 → 순서 무관)
+            for t in (*self.bt.tracked_stracks, *self.bt.lost_stracks):
+                if t.mean is not None:
+                    warp_cxcy_state(t.mean, warp, pos=(0, 1), vel=(4, 5))
+        if detections.size == 0:                      # 빈 프레임도 lost 버퍼 진행을 위해 update
+            detections = np.empty((0, 5), dtype=np.float32)
+
+        # 5열(tlbr+score)이면 YOLOX 는 score 를 그대로 사용, img_info == img_size → scale 1
+        online_targets = self.bt.update(detections[:, :5], (1, 1), (1, 1))
+
+        out = self._out.acquire(len(online_targets))
+        ids, boxes, scores = out["id"], out["box"], out["score"]
+        ages, hits, vels = out["age"], out["hits"], out["vel"]
+        for i, t in enumerate(online_targets):
+            ids[i] = t.track_id
+            boxes[i] = t.tlbr           # [x1,y1,x2,y2]
+            scores[i] = t.score
+            ages[i] = t.frame_id - t.start_frame
+            hits[i] = t.tracklet_len
+            vels[i] = t.mean[4:6]       # (vx, vy) of xyah state
+        out["flags"] = TRACK_CONFIRMED  # online_targets 는 모두 activated
+        return out
@@ -26,3 +26,46 @@ def iou_batch(bb_test, bb_gt):
 
     # NaN 처리
     return np.nan_to_num(iou, nan=0.0, posinf=0.0, neginf=0.0)
+
+
+def warp_boxes(boxes, A):
+    """Move (N,4) x1y1x2y2 boxes by 2×3 affine A (centre warped, size scaled by sqrt|det|)."""
+    boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+    c = (boxes[:, :2] + boxes[:, 2:]) * 0.5
+    half = (boxes[:, 2:] - boxes[:, :2]) * 0.5 * np.sqrt(abs(np.linalg.det(A[:, :2])))
+    c = c @ A[:, :2].T + A[:, 2]
+    return np.hstack([c - half, c + half])
+
+
+def nms(dets, thresh: float = 0.5, metric: str = "iou", class_aware: bool = False):
+    """Greedy NMS on (N,≥5) [x1,y1,x2,y2,score,(cls)] → kept row indices (score 내림차순).
+
+    class_aware=True 면 cls 열(5)별로 좌표를 멀리 떨어뜨려 같은 클래스끼리만 억제.
+
+    overlap 행렬은 한 번만 계산하고 greedy 단계는 boolean 마스크 갱신만 한다.
+    metric="ios" (intersection / smaller area) 는 타일 경계에서 잘린 부분 박스를
+    전체 박스가 흡수하도록 할 때 사용.
+    """
+    dets = np.asarray(dets)
+    if len(dets) == 0:
+        return np.zeros(0, dtype=np.int64)
+    order = np.argsort(-dets[:, 4], kind="stable")
+    b = dets[order, :4].astype(np.float64)
+    if class_aware and dets.shape[1] > 5:
+        b = b + (dets[order, 5:6] * (b.max() + 1.0))
+    if metric == "ios":
+        xx1 = np.maximum(b[:, None, 0], b[None, :, 0]); yy1 = np.maximum(b[:, None, 1], b[None, :, 1])
+        xx2 = np.minimum(b[:, None, 2], b[None, :, 2]); yy2 = np.minimum(b[:, None, 3], b[None, :, 3])
+        inter = np.maximum(0., xx2 - xx1) * np.maximum(0., yy2 - yy1)
+        area = np.maximum(0., b[:, 2] - b[:, 0]) * np.maximum(0., b[:, 3] - b[:, 1])
+        ov = inter / (np.minimum(area[:, None], area[None, :]) + 1e-6)
+    else:
+        ov = iou_batch(b, b)
+    suppressed = np.zeros(len(b), dtype=bool)
+    keep = []
+    for i in range(len(b)):
+        if suppressed[i]:
+            continue
+        keep.append(i)
+        suppressed |= ov[i] > thresh
+    return order[np.asarray(keep, dtype=np.int64)]
@@ -0,0 +1,73 @@
+"""Process-wide lightweight metrics registry (thread-safe).
+
+Stages report latencies / counters by name, e.g. ``METRICS.observe("cmc.latency_ms", 1.2)``;
+``METRICS.snapshot()`` returns a plain dict for logging or remote queries.
+"""
+import threading, time
+from contextlib import contextmanager
+
+
+class _Stat:
+    __slots__ = ("count", "last", "ema", "max", "total")
+
+    def __init__(self):
+        self.count, self.last, self.ema, self.max, self.total = 0, 0.0, 0.0, 0.0, 0.0
+
+    def add(self, v: float, alpha: float = 0.1):
+        self.count += 1
+        self.last = v
+        self.total += v
+        self.ema = v if self.count == 1 else (1 - alpha) * self.ema + alpha * v
+        if v > self.max:
+            self.max = v
+
+    def as_dict(self):
+        return {"count": self.count, "last": self.last, "ema": self.ema,
+                "max": self.max, "mean": self.total / self.count if self.count else 0.0}
+
+
+class Metrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+        self._counters = {}
+        self._gauges = {}
+
+    def observe(self, name: str, value: float):
+        with self._lock:
+            st = self._stats.get(name)
+            if st is None:
+                st = self._stats[name] = _Stat()
+            st.add(float(value))
+
+    def inc(self, name: str, n: int = 1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + n
+
+    def gauge(self, name: str, value):
+        with self._lock:
+            self._gauges[name] = value
+
+    @contextmanager
+    def timer(self, name: str):
+        """``with METRICS.timer("foo_ms"): ...`` → observe elapsed milliseconds."""
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, (time.perf_counter() - t0) * 1e3)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "stats":    {k: v.as_dict() for k, v in self._stats.items()},
+                "counters": dict(self._counters),
+                "gauges":   dict(self._gauges),
+            }
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear(); self._counters.clear(); self._gauges.clear()
+
+
+METRICS = Metrics()
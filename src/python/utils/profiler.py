@@ -0,0 +1,141 @@
+"""On-demand, time-boxed profiler for a running pipeline (``kill -USR1 <pid>``).
+
+현장 장비가 느려졌을 때 재시작 없이 프로파일을 뜬다.  신호를 받으면 ``duration_s`` 동안만 켜지고
+결과 파일을 쓴 뒤 스스로 꺼진다.  꺼져 있을 때는 각 stage 루프의 ``PROFILER.checkpoint()`` 가
+속성 조회 1 회로 끝난다 (LiveConfig.apply 와 같은 fast path).
+
+    mode: sample    모든 스레드를 interval_ms 마다 ``sys._current_frames()`` 로 stack sampling
+                    → ``<out_dir>/profile_<시각>.collapsed``  (flamegraph.pl / speedscope 에서 열기)
+                    대상 스레드 코드는 건드리지 않으므로 오버헤드가 작다.
+    mode: cprofile  stage 하나 (Capture | Pipeline | Output) 를 cProfile 로 결정적 측정
+                    → ``<out_dir>/profile_<시각>_<stage>.pstats``  (python -m pstats / snakeviz)
+                    cProfile 은 자기 스레드에서만 켤 수 있으므로 해당 stage 가 다음 프레임 경계
+                    (checkpoint) 에서 켜고, duration_s 가 지난 뒤의 경계에서 끄고 기록한다.
+
+pipeline.yaml::
+
+    profiler:
+      enable: true
+      mode: sample          # sample | cprofile
+      stage: Pipeline       # cprofile 대상
+      duration_s: 10
+      interval_ms: 5
+      out_dir: ../../profiles
+"""
+import cProfile, collections, os, sys, threading, time
+from pathlib import Path
+from typing import Dict, Optional
+
+from utils.logger import get_logger
+from utils.metrics import METRICS
+
+# stage → 스레드 이름 (숫자 접미사 제외): 캡처 소스는 구현마다 이름이 다르다
+STAGES = {
+    "Capture": ("Capture", "MJPEGCapture", "ReplayCapture"),
+    "Pipeline": ("Pipeline",),
+    "Output": ("Output",),
+}
+MODES = ("sample", "cprofile")
+
+
+class StageProfiler:
+    """Signal-triggered sampler / per-stage cProfile; idle until ``trigger()``."""
+
+    def __init__(self):
+        self.log = get_logger("Profiler")
+        self.enabled = False
+        self.mode, self.stage = "sample", "Pipeline"
+        self.duration_s, self.interval_ms = 10.0, 5.0
+        self.out_dir = Path("profiles")
+        self.busy = False                         # 한 번에 하나만
+        self._want: Optional[str] = None          # cprofile: 켜야 할 stage (checkpoint 가 확인)
+        self._prof: Optional[cProfile.Profile] = None
+        self._owner: Optional[threading.Thread] = None
+        self._t_end = 0.0
+        self._lock = threading.Lock()
+
+    def configure(self, enable: bool = False, mode: str = "sample", stage: str = "Pipeline",
+                  duration_s: float = 10.0, interval_ms: float = 5.0, out_dir: str = "profiles", **_):
+        if mode not in MODES:
+            raise ValueError(f"[Profiler] unknown mode '{mode}' (choose from {list(MODES)})")
+        if stage not in STAGES:
+            raise ValueError(f"[Profiler] unknown stage '{stage}' (choose from {list(STAGES)})")
+        self.enabled = bool(enable)
+        self.mode, self.stage = mode, stage
+        self.duration_s, self.interval_ms = float(duration_s), float(interval_ms)
+        self.out_dir = Path(out_dir)
+        return self
+
+    # ---- 시작 (signal handler / control 등) -------------------------------
+    def trigger(self, mode: Optional[str] = None, stage: Optional[str] = None) -> bool:
+        """Start one time-boxed profile; False if disabled or one is already running."""
+        if not self.enabled:
+            return False
+        mode, stage = mode or self.mode, stage or self.stage
+        with self._lock:
+            if self.busy:
+                self.log.warning("profile already running – ignored")
+                return False
+            self.busy = True
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        if mode == "sample":
+            threading.Thread(target=self._sample, daemon=True, name="ProfilerSampler").start()
+        else:
+            self._want = stage                    # 해당 stage 의 다음 checkpoint 에서 시작
+        self.log.info("profiling %s for %g s (%s)", "all threads" if mode == "sample" else stage,
+                      self.duration_s, mode)
+        return True
+
+    # ---- stage 스레드 (프레임 경계) ----------------------------------------
+    def checkpoint(self):
+        if self._want is None and self._prof is None:     # 평소: 속성 조회만
+            return
+        th = threading.current_thread()
+        if self._prof is None:
+            if th.name.rstrip("0123456789") not in STAGES.get(self._want, ()):
+                return
+            self._owner, self._want = th, None
+            self._t_end = time.perf_counter() + self.duration_s
+            self._prof = cProfile.Profile()
+            self._prof.enable()
+        elif th is self._owner and time.perf_counter() >= self._t_end:
+            self._prof.disable()
+            path = self.out_dir / f"profile_{time.strftime('%Y%m%d-%H%M%S')}_{th.name}.pstats"
+            self._prof.dump_stats(path)
+            self._prof = self._owner = None
+            self._done(path)
+
+    # ---- sampler 스레드 ----------------------------------------------------
+    def _sample(self):
+        me = threading.get_ident()
+        stacks: Dict[str, int] = collections.Counter()
+        interval, n = self.interval_ms / 1e3, 0
+        t_end = time.perf_counter() + self.duration_s
+        while time.perf_counter() < t_end:
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == me:
+                    continue
+                parts = []
+                while frame is not None:
+                    code = frame.f_code
+                    parts.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                parts.append(names.get(ident, str(ident)))
+                stacks[";".join(reversed(parts))] += 1
+            n += 1
+            time.sleep(interval)
+        path = self.out_dir / f"profile_{time.strftime('%Y%m%d-%H%M%S')}.collapsed"
+        with open(path, "w", encoding="utf-8") as f:
+            f.writelines(f"{s} {c}\n" for s, c in stacks.most_common())
+        self.log.info("%d samples × %d threads", n, len({s.split(";", 1)[0] for s in stacks}))
+        self._done(path)
+
+    def _done(self, path: Path):
+        METRICS.inc("profiler.runs")
+        self.log.info("profile written → %s (profiler off)", path)
+        with self._lock:
+            self.busy = False
+
+
+PROFILER = StageProfiler()
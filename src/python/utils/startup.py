@@ -0,0 +1,75 @@
+"""Startup instrumentation: phase timer + background initializers.
+
+``STARTUP`` 의 기준 시각은 이 모듈의 import 시점 → entry point 에서 가장 먼저 import 한다.
+``STARTUP.mark("camera")`` 는 직전 mark 이후 경과 시간을 ``startup.camera_ms`` gauge 로 남기고,
+``STARTUP.first_frame()`` 은 첫 annotated 프레임 시각을 기록한 뒤 전체 breakdown 을 로그로 출력한다.
+
+``Loader("tracker", lambda: build_tracker(cfg))`` 는 무거운 import / 모델 로드를 카메라 협상과
+겹쳐 실행하는 스레드 – ``result()`` 에서 완료를 기다리고 예외는 그대로 다시 던진다.
+"""
+import threading, time
+from typing import Any, Callable, Dict
+
+from utils.logger import get_logger
+from utils.metrics import METRICS
+
+
+class StartupTimer:
+    def __init__(self):
+        self.t0 = self._last = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._first = False
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.t0) * 1e3
+
+    def mark(self, phase: str) -> float:
+        """Record time since the previous mark as ``phase``; returns it in ms."""
+        with self._lock:
+            now = time.perf_counter()
+            ms = (now - self._last) * 1e3
+            self._last = now
+            self.phases[phase] = ms
+        METRICS.gauge(f"startup.{phase}_ms", round(ms, 1))
+        return ms
+
+    def first_frame(self):
+        """Call once per annotated frame; only the first call records and logs."""
+        if self._first:
+            return
+        self._first = True
+        total = self.elapsed_ms()
+        METRICS.gauge("startup.first_frame_ms", round(total, 1))
+        parts = ", ".join(f"{k} {v:.0f}" for k, v in self.phases.items())
+        get_logger("Startup").info("first annotated frame after %.0f ms (%s ms)", total, parts)
+
+
+STARTUP = StartupTimer()
+
+
+class Loader(threading.Thread):
+    """Runs ``fn()`` in a background thread; ``result()`` blocks until it is ready."""
+
+    def __init__(self, name: str, fn: Callable[[], Any]):
+        super().__init__(daemon=True, name=f"Loader[{name}]")
+        self.key, self.fn = name, fn
+        self._value, self._err = None, None
+        self.elapsed_ms = 0.0
+
+    def run(self):
+        t0 = time.perf_counter()
+        try:
+            self._value = self.fn()
+        except BaseException as e:                # noqa: BLE001 – result() 에서 다시 던진다
+            self._err = e
+        self.elapsed_ms = (time.perf_counter() - t0) * 1e3
+        METRICS.gauge(f"startup.{self.key}_ms", round(self.elapsed_ms, 1))
+
+    def result(self, timeout=None):
+        self.join(timeout)
+        if self.is_alive():
+            raise TimeoutError(f"[Loader] {self.key} not ready")
+        if self._err is not None:
+            raise self._err
+        return self._value
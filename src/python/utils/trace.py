@@ -0,0 +1,114 @@
+"""Per-frame trace context + sampled Chrome / Perfetto trace-event exporter.
+
+큐 항목에 ``FrameTrace`` (또는 None) 를 함께 실어 capture → pre → detect → track → draw → display
+전 구간과 큐 대기 시간을 한 프레임 단위로 따라간다.
+
+    tr = TRACER.new()                    # 샘플링된 프레임만 FrameTrace, 나머지는 None
+    if tr: tr.add("pre", t0, t1)         # stage 가 이미 재는 perf_counter() 값 그대로
+    if tr: tr.enqueue("cap_q")           # put 직전
+    if tr: tr.dequeue("cap_q")           # get 직후 → "queue:cap_q" 구간 (대기 시간)
+    TRACER.finish(tr)                    # 마지막 stage (display) 이후 → exporter 로
+
+시각은 모두 time.perf_counter() (monotonic).  exporter 는 Chrome JSON Array Format 으로 append:
+닫는 ``]`` 는 생략 가능한 형식이라 실행 중에도 chrome://tracing / ui.perfetto.dev 에서 바로 열린다.
+스레드별 트랙 + 큐 대기는 "queue:<name>" 트랙, 같은 프레임의 구간은 flow 화살표로 연결.
+
+pipeline.yaml::
+
+    trace:
+      enable: true
+      sample_every: 30       # N 프레임 중 1 개 추적
+      path: ../../trace.json
+      max_frames: 2000       # 이만큼 기록하면 자동 중지 (0 = 무제한)
+"""
+import itertools, json, queue, threading, time
+from typing import List, Optional, Tuple
+
+from utils.logger import get_logger
+
+
+class FrameTrace:
+    __slots__ = ("fid", "spans", "_queued")
+
+    def __init__(self, fid: int):
+        self.fid = fid
+        self.spans: List[Tuple[str, str, float, float]] = []    # (name, track, t_begin, t_end)
+        self._queued = {}
+
+    def add(self, name: str, t0: float, t1: float):
+        """Span from already-measured perf_counter() stamps (stage 가 이미 시간을 재는 곳)."""
+        self.spans.append((name, threading.current_thread().name, t0, t1))
+
+    def enqueue(self, q: str):
+        self._queued[q] = time.perf_counter()
+
+    def dequeue(self, q: str):
+        t0 = self._queued.pop(q, None)
+        if t0 is not None:
+            self.spans.append((f"queue:{q}", f"queue:{q}", t0, time.perf_counter()))
+
+
+class Tracer:
+    """Sampling decision + background Chrome trace writer (disabled until ``configure``)."""
+
+    def __init__(self):
+        self.enabled = False
+        self.sample_every, self.max_frames = 30, 0
+        self._count = itertools.count()
+        self._q: Optional[queue.Queue] = None
+        self.written = 0
+
+    def configure(self, enable: bool = False, sample_every: int = 30, path: str = "trace.json",
+                  max_frames: int = 0, **_):
+        if not enable:
+            return self
+        self.sample_every, self.max_frames = max(1, int(sample_every)), int(max_frames)
+        self._q = queue.Queue(maxsize=256)
+        threading.Thread(target=self._writer, args=(path,), daemon=True, name="TraceWriter").start()
+        self.enabled = True
+        get_logger("Trace").info("tracing 1/%d frames → %s", self.sample_every, path)
+        return self
+
+    def new(self) -> Optional[FrameTrace]:
+        if not self.enabled:
+            return None
+        n = next(self._count)
+        return FrameTrace(n) if n % self.sample_every == 0 else None
+
+    def finish(self, tr: Optional[FrameTrace]):
+        if tr is None or not self.enabled:
+            return
+        try:
+            self._q.put_nowait(tr)
+        except queue.Full:                        # writer 가 밀리면 trace 만 버림
+            pass
+
+    # --------------------------------------------------------
+    def _writer(self, path: str):
+        pid, t_base, tids = 1, time.perf_counter(), {}
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("[\n")
+            while True:
+                tr = self._q.get()
+                events = []
+                for k, (name, track, t0, t1) in enumerate(sorted(tr.spans, key=lambda s: s[2])):
+                    if track not in tids:
+                        tids[track] = len(tids) + 1
+                        events.append({"ph": "M", "name": "thread_name", "pid": pid, "tid": tids[track],
+                                       "args": {"name": track}})
+                    ts, tid = (t0 - t_base) * 1e6, tids[track]
+                    events.append({"ph": "X", "name": name, "cat": name.split(":")[0], "pid": pid, "tid": tid,
+                                   "ts": round(ts, 1), "dur": round((t1 - t0) * 1e6, 1), "args": {"frame": tr.fid}})
+                    ph = "s" if k == 0 else ("f" if k == len(tr.spans) - 1 else "t")
+                    events.append({"ph": ph, "name": "frame", "cat": "frame", "id": tr.fid, "pid": pid,
+                                   "tid": tid, "ts": round(ts, 1), **({"bp": "e"} if ph == "f" else {})})
+                f.write("".join(json.dumps(e, separators=(",", ":")) + ",\n" for e in events))
+                f.flush()
+                self.written += 1
+                if self.max_frames and self.written >= self.max_frames:
+                    self.enabled = False
+                    get_logger("Trace").info("trace done: %d frames → %s", self.written, path)
+                    return
+
+
+TRACER = Tracer()